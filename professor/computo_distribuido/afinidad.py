@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Afinidad de CPU para los pools de hilos y procesos (Linux)
+Usado por ejemplos_modelos_ejecucion.py (demo_gil y Modelo 5)
+
+Sin afinidad, el planificador del sistema operativo mueve los workers entre
+cores y puede poner dos workers en hilos SMT ("hyperthreads") del mismo core
+físico, que comparten unidades de ejecución y caché. En máquinas compartidas
+eso hace que el mismo experimento tarde muy distinto de una corrida a otra.
+
+Políticas:
+- "libre":    sin fijar (lo decide el sistema operativo)
+- "nucleos":  cada worker en un core físico distinto
+- "hermanos": workers empaquetados en los hilos SMT de un mismo core
+              (útil para ver cuánto cuesta compartir core)
+
+La topología se lee de /sys/devices/system/cpu/cpu*/topology y se limita a
+las CPUs permitidas para este proceso (os.sched_getaffinity).
+"""
+
+import argparse
+import glob
+import multiprocessing
+import os
+import queue
+import re
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+POLITICAS = ("libre", "nucleos", "hermanos")
+
+SOPORTADO = hasattr(os, "sched_setaffinity")
+
+
+# =============================================================================
+# TOPOLOGÍA
+# =============================================================================
+def _leer(ruta):
+    with open(ruta) as f:
+        return f.read().strip()
+
+
+def topologia():
+    """
+    Retorna lista de cores físicos; cada uno es la lista ordenada de sus
+    CPUs lógicas permitidas. Ej. con 2 cores y SMT: [[0, 4], [1, 5]].
+    """
+    permitidas = os.sched_getaffinity(0) if SOPORTADO else set(range(os.cpu_count() or 1))
+    cores = {}
+    for ruta in glob.glob("/sys/devices/system/cpu/cpu[0-9]*"):
+        cpu = int(re.search(r"cpu(\d+)$", ruta).group(1))
+        if cpu not in permitidas:
+            continue
+        try:
+            paquete = int(_leer(f"{ruta}/topology/physical_package_id"))
+            core = int(_leer(f"{ruta}/topology/core_id"))
+        except (OSError, ValueError):
+            paquete, core = 0, cpu  # sin información: cada CPU es su propio core
+        cores.setdefault((paquete, core), []).append(cpu)
+    if not cores:  # /sys no disponible (contenedores, otros sistemas)
+        cores = {(0, cpu): [cpu] for cpu in permitidas}
+    return [sorted(cpus) for _, cpus in sorted(cores.items())]
+
+
+def plan_afinidad(politica, workers, cores=None):
+    """
+    Retorna la lista de CPUs (una por worker) según la política, o None para "libre".
+    Si hay más workers que CPUs en la política, se reparten cíclicamente.
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"política desconocida: {politica} (opciones: {POLITICAS})")
+    if politica == "libre" or not SOPORTADO:
+        return None
+    cores = topologia() if cores is None else cores
+    if politica == "nucleos":
+        cpus = [c[0] for c in cores]
+    else:
+        cpus = [cpu for c in cores for cpu in c]
+    return [cpus[i % len(cpus)] for i in range(workers)]
+
+
+# =============================================================================
+# POOLS CON AFINIDAD
+# =============================================================================
+def _fijar_cpu(cola_cpus):
+    """
+    Initializer de cada worker: toma una CPU de la cola y se fija a ella.
+    En Linux sched_setaffinity(0, ...) afecta solo al hilo que la llama, así
+    que sirve tanto para procesos como para hilos.
+    """
+    try:
+        os.sched_setaffinity(0, {cola_cpus.get_nowait()})
+    except queue.Empty:
+        pass  # worker de reemplazo: se queda sin fijar
+
+
+def crear_pool(tipo, workers, politica="libre"):
+    """
+    ProcessPoolExecutor o ThreadPoolExecutor (tipo "procesos" / "hilos")
+    con cada worker fijado a una CPU según `politica`.
+    """
+    Executor = ProcessPoolExecutor if tipo == "procesos" else ThreadPoolExecutor
+    cpus = plan_afinidad(politica, workers)
+    if cpus is None:
+        return Executor(max_workers=workers)
+    cola = multiprocessing.Queue() if tipo == "procesos" else queue.Queue()
+    for cpu in cpus:
+        cola.put(cpu)
+    return Executor(max_workers=workers, initializer=_fijar_cpu, initargs=(cola,))
+
+
+# =============================================================================
+# BENCHMARK: varianza y throughput por política
+# =============================================================================
+def tarea_cpu(n):
+    return sum(range(n))
+
+
+def medir_politica(tipo, politica, workers, tareas, n, repeticiones):
+    tiempos = []
+    with crear_pool(tipo, workers, politica) as executor:
+        list(executor.map(tarea_cpu, [1] * workers))  # arrancar y fijar workers
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            list(executor.map(tarea_cpu, [n] * tareas))
+            tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Afinidad de CPU: varianza y throughput por política")
+    parser.add_argument("--tipo", choices=("procesos", "hilos"), default="procesos")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--n", type=int, default=5_000_000)
+    parser.add_argument("--repeticiones", type=int, default=10)
+    args = parser.parse_args()
+
+    cores = topologia()
+    print("\n" + "="*70)
+    print(f"AFINIDAD DE CPU ({args.tipo}, {args.workers} workers)")
+    print("="*70)
+    print(f"Topología: {len(cores)} cores físicos, CPUs lógicas por core: {cores}")
+    if not SOPORTADO:
+        print("⚠️  os.sched_setaffinity no disponible: todas las políticas equivalen a 'libre'")
+
+    tareas = 2 * args.workers
+    print(f"{'política':<10} {'CPUs':<16} {'media':>8} {'desv.':>8} {'CV':>6} {'tareas/s':>9} {'varianza vs libre':>18}")
+    var_libre = None
+    for politica in POLITICAS:
+        tiempos = medir_politica(args.tipo, politica, args.workers, tareas, args.n, args.repeticiones)
+        media, desv = statistics.mean(tiempos), statistics.stdev(tiempos)
+        var_libre = var_libre if var_libre is not None else desv ** 2
+        reduccion = 1 - desv ** 2 / var_libre if var_libre else 0.0
+        cpus = plan_afinidad(politica, args.workers, cores)
+        print(f"{politica:<10} {str(cpus or '-'):<16} {media:>7.3f}s {desv:>7.3f}s {desv / media:>6.1%} "
+              f"{tareas / media:>9.1f} {reduccion:>17.0%}")
+
+    print("\n✅ nucleos: menos migraciones y sin compartir core → menor varianza")
+    print("⚠️  hermanos: dos workers en un core físico comparten unidades de ejecución")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Trabajo CPU-bound dentro de asyncio: bloquear vs delegar a un executor
+Complemento de ejemplos_modelos_ejecucion.py (Modelo 4: asíncrono concurrente)
+
+Los ejemplos `ejemplo_cpu_bound_en_asyncio` y `ejemplo_trabajo_cpu_en_async`
+muestran que un cálculo sin await bloquea el event loop: ninguna otra tarea
+avanza hasta que termina. Aquí se mide ese bloqueo y se corrige.
+
+Modo híbrido: el paso CPU-bound se envía a un executor con
+loop.run_in_executor(); la corrutina hace await del future y el event loop
+sigue atendiendo las tareas de I/O mientras tanto.
+
+Para medir el bloqueo se usa un monitor de "lag" del event loop: una tarea
+que pide despertar cada `intervalo` segundos y registra cuánto tarde
+despertó realmente. Con el loop libre el lag es ~0; si alguien bloquea el
+loop 300 ms, alguna muestra tendrá ~300 ms de lag.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+# =============================================================================
+# MONITOR DE LAG DEL EVENT LOOP
+# =============================================================================
+class MonitorLag:
+    """
+    Mide el retraso con que el event loop atiende un temporizador periódico.
+
+    Uso:
+        monitor = MonitorLag(intervalo=0.005)
+        monitor.iniciar()
+        ...  # código a medir
+        await monitor.detener()
+        print(monitor.resumen())
+    """
+
+    def __init__(self, intervalo=0.005):
+        self.intervalo = intervalo
+        self.muestras = []
+        self._tarea = None
+
+    def iniciar(self):
+        self._tarea = asyncio.get_running_loop().create_task(self._medir())
+
+    async def detener(self):
+        self._tarea.cancel()
+        try:
+            await self._tarea
+        except asyncio.CancelledError:
+            pass
+
+    async def _medir(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            esperado = loop.time() + self.intervalo
+            await asyncio.sleep(self.intervalo)
+            self.muestras.append(max(0.0, loop.time() - esperado))
+
+    def resumen(self):
+        """Retorna dict con lag máximo, p99 y promedio en milisegundos."""
+        if not self.muestras:
+            return {"max_ms": 0.0, "p99_ms": 0.0, "promedio_ms": 0.0, "muestras": 0}
+        ordenadas = sorted(self.muestras)
+        p99 = ordenadas[min(len(ordenadas) - 1, int(0.99 * len(ordenadas)))]
+        return {
+            "max_ms": ordenadas[-1] * 1000,
+            "p99_ms": p99 * 1000,
+            "promedio_ms": sum(ordenadas) / len(ordenadas) * 1000,
+            "muestras": len(ordenadas),
+        }
+
+
+# =============================================================================
+# TRABAJO CPU-BOUND (a nivel módulo para poder enviarse a otros procesos)
+# =============================================================================
+def calculo_cpu(n):
+    """El mismo cálculo que ejemplo_cpu_bound_en_asyncio: sum(range(n))."""
+    return sum(range(n))
+
+
+# =============================================================================
+# CARGA MIXTA: pasos CPU + tareas de I/O que deberían seguir avanzando
+# =============================================================================
+async def tarea_con_cpu(nombre, n, duracion_io, executor):
+    """
+    Paso CPU seguido de una espera de I/O (como tarea_con_cpu de
+    ejemplo_trabajo_cpu_en_async). Con executor=None el cálculo corre en el
+    event loop y lo bloquea; con un executor se delega y se hace await.
+    """
+    if executor is None:
+        resultado = calculo_cpu(n)
+    else:
+        loop = asyncio.get_running_loop()
+        resultado = await loop.run_in_executor(executor, calculo_cpu, n)
+    await asyncio.sleep(duracion_io)
+    return nombre, resultado
+
+
+async def tarea_io(nombre, pasos, duracion_paso, inicio):
+    """
+    I/O periódico (como tarea_io de ejemplo_cpu_bound_en_asyncio, partido en
+    pasos). Retorna el retraso respecto al tiempo ideal, contado desde
+    `inicio` (loop.time() al lanzar la carga): si el loop estaba bloqueado
+    cuando la tarea debía arrancar, eso también cuenta.
+    """
+    loop = asyncio.get_running_loop()
+    for _ in range(pasos):
+        await asyncio.sleep(duracion_paso)
+    return nombre, (loop.time() - inicio) - pasos * duracion_paso
+
+
+async def carga_mixta(executor, n=10_000_000):
+    """Dos tareas con paso CPU y dos tareas de I/O, todas concurrentes."""
+    inicio = asyncio.get_running_loop().time()
+    return await asyncio.gather(
+        tarea_con_cpu("Tarea A", n, 0.2, executor),
+        tarea_con_cpu("Tarea B", n // 2, 0.2, executor),
+        tarea_io("I/O 1", 20, 0.05, inicio),
+        tarea_io("I/O 2", 10, 0.1, inicio),
+    )
+
+
+async def medir_modo(executor, n):
+    """Ejecuta la carga mixta con el monitor de lag activo."""
+    monitor = MonitorLag()
+    monitor.iniciar()
+    inicio = time.time()
+    resultados = await carga_mixta(executor, n)
+    tiempo_total = time.time() - inicio
+    await monitor.detener()
+    retraso_io = max(r for nombre, r in resultados if nombre.startswith("I/O"))
+    return tiempo_total, retraso_io, monitor.resumen()
+
+
+# =============================================================================
+# MAIN: Comparar bloqueante vs delegado a hilo vs delegado a proceso
+# =============================================================================
+def main():
+    n = 10_000_000
+
+    print("\n" + "="*70)
+    print("TRABAJO CPU-BOUND EN ASYNCIO: BLOQUEAR vs run_in_executor")
+    print("="*70)
+    print(f"Sistema: {os.cpu_count()} cores disponibles")
+    print(f"{'modo':<12} {'tiempo':>8} {'retraso I/O':>12} {'lag máx':>10} {'lag p99':>10}")
+
+    modos = [
+        ("bloqueante", None),
+        ("hilo", ThreadPoolExecutor(max_workers=2)),
+        ("proceso", ProcessPoolExecutor(max_workers=2)),
+    ]
+    for nombre, executor in modos:
+        if executor is not None:
+            # Arrancar los workers antes de medir
+            list(executor.map(calculo_cpu, [1, 1]))
+        tiempo_total, retraso_io, lag = asyncio.run(medir_modo(executor, n))
+        if executor is not None:
+            executor.shutdown()
+        print(f"{nombre:<12} {tiempo_total:>7.2f}s {retraso_io * 1000:>10.0f}ms "
+              f"{lag['max_ms']:>8.1f}ms {lag['p99_ms']:>8.1f}ms")
+
+    print("\n⚠️  bloqueante: el cálculo congela el loop; el I/O se retrasa lo que dura el cálculo")
+    print("⚠️  hilo: sum(range(n)) corre en C y no suelta el GIL hasta terminar;")
+    print("    el loop sigue congelado (sirve si el cálculo libera el GIL, p. ej. NumPy)")
+    print("✅ proceso: el loop queda libre y el cálculo corre en otro core")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
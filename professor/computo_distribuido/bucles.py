@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Implementaciones del event loop (asyncio / uvloop) y costo de sus primitivas
+Usado por ejemplos_modelos_ejecucion.py (Modelos 2 y 4)
+
+asyncio.run() siempre usa el event loop de la biblioteca estándar. uvloop
+(pip install uvloop, opcional) lo reemplaza por uno escrito sobre libuv,
+el mismo que usa Node.js; la API es la misma.
+
+Los modelos de la cocina esperan segundos en asyncio.sleep, así que ahí el
+loop no se nota. Se nota cuando hay miles de tareas cortas: el costo de
+crear, agendar y cancelar tareas es lo que domina. Los microbenchmarks de
+este archivo miden ese costo en µs por operación:
+
+- create_task:        crear una tarea y esperarla
+- gather:             gather de corrutinas en lotes de LOTE
+- wait + cancelar:    wait(FIRST_COMPLETED) sobre LOTE tareas y cancelar las demás
+- wait_for timeout:   wait_for que vence (TimeoutError)
+- TaskGroup:          TaskGroup con LOTE tareas (Python 3.11+)
+
+--ejemplos corre además los ejemplos de create_task y asyncio.wait() de los
+alumnos (EJEMPLOS_ALUMNOS) en cada event loop instalado. Los archivos se cargan
+por ruta y no se modifican: cada carpeta de alumno es independiente.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import time
+
+try:
+    import uvloop
+except ImportError:  # opcional
+    uvloop = None
+
+LOTE = 100
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ruta desde la raíz del repositorio -> corrutinas sin argumentos a correr
+EJEMPLOS_ALUMNOS = {
+    "students/KarolCisneros/computo_distribuido/sincrono_asincrono/ejemplos_ejecucion.py":
+        ("ejemplo_asincrono_concurrente_create_task", "ejemplo_avanzado_wait"),
+    "students/leovice2004/computo_distribuido/sincrono_asincrono/ejemplos_codigo.py":
+        ("ejemplo_asincrono_concurrente_create_task",),
+}
+
+
+# =============================================================================
+# SELECCIÓN DEL EVENT LOOP
+# =============================================================================
+def disponibles():
+    """Nombres de las implementaciones instaladas."""
+    return ["asyncio"] + (["uvloop"] if uvloop is not None else [])
+
+
+def fabrica_bucle(nombre):
+    """Función que crea un event loop nuevo de la implementación pedida."""
+    if nombre == "asyncio":
+        return asyncio.new_event_loop
+    if nombre == "uvloop":
+        if uvloop is None:
+            raise RuntimeError("uvloop no está instalado (pip install uvloop)")
+        return uvloop.new_event_loop
+    raise ValueError(f"event loop desconocido: {nombre} (opciones: asyncio, uvloop)")
+
+
+def correr(corrutina, bucle="asyncio"):
+    """Como asyncio.run(corrutina), pero en el event loop elegido."""
+    fabrica = fabrica_bucle(bucle)
+    if hasattr(asyncio, "Runner"):  # Python 3.11+
+        with asyncio.Runner(loop_factory=fabrica) as runner:
+            return runner.run(corrutina)
+    loop = fabrica()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(corrutina)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def _cargar(ruta):
+    """Importa un archivo .py por ruta (los alumnos no son paquetes)."""
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def correr_ejemplos(bucle="asyncio"):
+    """Corre EJEMPLOS_ALUMNOS en el event loop elegido; retorna {(ruta, nombre): segundos}."""
+    tiempos = {}
+    for relativa, nombres in EJEMPLOS_ALUMNOS.items():
+        modulo = _cargar(os.path.join(RAIZ, relativa))
+        for nombre in nombres:
+            inicio = time.perf_counter()
+            correr(getattr(modulo, nombre)(), bucle)
+            tiempos[relativa, nombre] = time.perf_counter() - inicio
+    return tiempos
+
+
+# =============================================================================
+# MICROBENCHMARKS (cada uno retorna el número de operaciones hechas)
+# =============================================================================
+async def _nada():
+    return None
+
+
+async def _dormir():
+    await asyncio.sleep(3600)
+
+
+async def bench_create_task(n):
+    tareas = [asyncio.create_task(_nada()) for _ in range(n)]
+    for t in tareas:
+        await t
+    return n
+
+
+async def bench_gather(n):
+    for _ in range(n // LOTE):
+        await asyncio.gather(*[_nada() for _ in range(LOTE)])
+    return n // LOTE * LOTE
+
+
+async def bench_wait_cancelar(n):
+    rondas = n // LOTE
+    for _ in range(rondas):
+        tareas = [asyncio.create_task(_nada())]
+        tareas += [asyncio.create_task(_dormir()) for _ in range(LOTE - 1)]
+        _, pendientes = await asyncio.wait(tareas, return_when=asyncio.FIRST_COMPLETED)
+        for t in pendientes:
+            t.cancel()
+        await asyncio.gather(*pendientes, return_exceptions=True)
+    return rondas
+
+
+async def bench_wait_for(n):
+    for _ in range(n):
+        try:
+            await asyncio.wait_for(_dormir(), timeout=1e-6)
+        except asyncio.TimeoutError:
+            pass
+    return n
+
+
+async def bench_taskgroup(n):
+    for _ in range(n // LOTE):
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(LOTE):
+                tg.create_task(_nada())
+    return n // LOTE * LOTE
+
+
+BENCHMARKS = {
+    "create_task": bench_create_task,
+    "gather": bench_gather,
+    f"wait + cancelar {LOTE - 1}": bench_wait_cancelar,
+    "wait_for timeout": bench_wait_for,
+}
+if hasattr(asyncio, "TaskGroup"):
+    BENCHMARKS["TaskGroup"] = bench_taskgroup
+
+
+def medir(bucle, benchmark, n, repeticiones=3):
+    """Mejor de `repeticiones`, en µs por operación."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        ops = correr(BENCHMARKS[benchmark](n), bucle)
+        mejor = min(mejor, (time.perf_counter() - inicio) / ops * 1e6)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Costo de las primitivas de asyncio por event loop")
+    parser.add_argument("--n", type=int, default=100_000, help="Operaciones por benchmark")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--ejemplos", action="store_true",
+                        help="Correr también los ejemplos create_task / wait de los alumnos en cada loop")
+    args = parser.parse_args()
+
+    bucles = disponibles()
+    print("\n" + "="*70)
+    print(f"EVENT LOOPS: µs por operación (n={args.n:,}, mejor de {args.repeticiones})")
+    print("="*70)
+    if uvloop is None:
+        print("⚠️  uvloop no está instalado (pip install uvloop): solo se mide asyncio")
+    print(f"{'operación':<22}" + "".join(f"{b:>12}" for b in bucles)
+          + (f"{'uvloop vs asyncio':>19}" if len(bucles) > 1 else ""))
+
+    for benchmark in BENCHMARKS:
+        n = args.n // 10 if benchmark == "wait_for timeout" else args.n  # cada op espera un timer
+        us = {b: medir(b, benchmark, n, args.repeticiones) for b in bucles}
+        fila = f"{benchmark:<22}" + "".join(f"{us[b]:>10.2f}µs" for b in bucles)
+        if len(bucles) > 1:
+            fila += f"{us['asyncio'] / us['uvloop']:>18.1f}x"
+        print(fila)
+
+    if args.ejemplos:
+        for b in bucles:
+            print(f"\n--- Ejemplos de los alumnos sobre {b} ---")
+            for (relativa, nombre), segundos in correr_ejemplos(b).items():
+                print(f"⏱️  {relativa.split('/')[1]}: {nombre} en {segundos:.2f}s ({b})")
+
+    print("\n✅ Crear una tarea cuesta microsegundos: irrelevante frente a una espera de red")
+    print("⚠️  Con cientos de miles de tareas cortas el loop sí domina: ahí uvloop ayuda")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
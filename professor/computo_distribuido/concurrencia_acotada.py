@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Fan-out acotado en asyncio: amap con límite de concurrencia
+Complemento de ejemplos_modelos_ejecucion.py (Modelo 4: asíncrono concurrente)
+
+Los ejemplos lanzan todo de golpe:
+
+    await asyncio.gather(*[tarea(i) for i in range(n)])
+
+Con n = 100k+ eso crea n corrutinas y n Tasks antes de que termine la
+primera: la memoria crece con n y el servicio de destino recibe n peticiones
+a la vez.
+
+amap() procesa un iterable con a lo más `limite` tareas vivas:
+- en orden de terminación: `limite` workers toman el siguiente elemento
+  del iterable en cuanto se liberan
+- en orden de entrada: ventana deslizante de `limite` tareas; se entrega la
+  más antigua y se lanza la siguiente
+Soporta timeout por elemento y cancelación (al cerrar el generador o
+cancelar al consumidor se cancelan las tareas en vuelo).
+"""
+
+import argparse
+import asyncio
+import collections
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# =============================================================================
+# amap
+# =============================================================================
+async def _llamar(fn, x, timeout, en_error):
+    try:
+        if timeout is None:
+            return await fn(x)
+        return await asyncio.wait_for(fn(x), timeout)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        if en_error == "devolver":
+            return e
+        raise
+
+
+def amap(fn, iterable, limite=100, ordenado=False, timeout=None, en_error="lanzar"):
+    """
+    Aplica la corrutina `fn` a cada elemento con a lo más `limite` en vuelo.
+
+    Retorna un generador asíncrono de tuplas (indice, resultado):
+    - ordenado=False: en orden de terminación
+    - ordenado=True:  en orden de entrada (un elemento lento retiene a los siguientes)
+
+    timeout:  segundos por elemento (asyncio.TimeoutError si se excede)
+    en_error: "lanzar" propaga la primera excepción y cancela lo demás;
+              "devolver" entrega la excepción como resultado y sigue
+
+    El iterable se consume de forma perezosa: nunca hay más de `limite`
+    elementos tomados sin terminar.
+
+        async for i, r in amap(descargar, urls, limite=50):
+            ...
+    """
+    if limite < 1:
+        raise ValueError("limite debe ser >= 1")
+    if en_error not in ("lanzar", "devolver"):
+        raise ValueError("en_error debe ser 'lanzar' o 'devolver'")
+    generador = _amap_ordenado if ordenado else _amap_terminacion
+    return generador(fn, iterable, limite, timeout, en_error)
+
+
+async def _amap_ordenado(fn, iterable, limite, timeout, en_error):
+    elementos = enumerate(iterable)
+    ventana = collections.deque()
+    try:
+        for i, x in elementos:
+            ventana.append((i, asyncio.ensure_future(_llamar(fn, x, timeout, en_error))))
+            if len(ventana) >= limite:
+                i0, tarea = ventana.popleft()
+                yield i0, await tarea
+        while ventana:
+            i0, tarea = ventana.popleft()
+            yield i0, await tarea
+    finally:
+        for _, tarea in ventana:
+            tarea.cancel()
+        if ventana:
+            await asyncio.gather(*(t for _, t in ventana), return_exceptions=True)
+
+
+_FIN = object()
+
+
+async def _amap_terminacion(fn, iterable, limite, timeout, en_error):
+    elementos = enumerate(iterable)
+    salida = asyncio.Queue(maxsize=limite)
+
+    async def worker():
+        # next() es síncrono: en un solo event loop no hay carrera entre workers
+        try:
+            for i, x in elementos:
+                resultado = await _llamar(fn, x, timeout, en_error)
+                await salida.put((i, resultado))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await salida.put((_FIN, e))
+            return
+        await salida.put((_FIN, None))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(limite)]
+    activos = len(workers)
+    try:
+        while activos:
+            i, resultado = await salida.get()
+            if i is _FIN:
+                activos -= 1
+                if resultado is not None:
+                    raise resultado
+                continue
+            yield i, resultado
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+# =============================================================================
+# BENCHMARK: gather vs amap (memoria pico y throughput)
+# =============================================================================
+async def tarea(i):
+    """Tarea de I/O simulada: una espera corta y un resultado pequeño."""
+    await asyncio.sleep(0.001)
+    return i * 2
+
+
+async def _con_gather(n, limite):
+    total = 0
+    for r in await asyncio.gather(*[tarea(i) for i in range(n)]):
+        total += r
+    return total
+
+
+async def _con_amap(n, limite, ordenado=False):
+    total = 0
+    async for _, r in amap(tarea, range(n), limite=limite, ordenado=ordenado):
+        total += r
+    return total
+
+
+ESTRATEGIAS = {
+    "gather": _con_gather,
+    "amap": _con_amap,
+    "amap ordenado": lambda n, limite: _con_amap(n, limite, ordenado=True),
+}
+
+
+def medir_en_proceso(estrategia, n, limite):
+    """
+    Corre una estrategia y retorna (segundos, MB de memoria pico adicional).
+    Se ejecuta en un proceso nuevo para que ru_maxrss no arrastre picos previos.
+    """
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    inicio = time.perf_counter()
+    total = asyncio.run(ESTRATEGIAS[estrategia](n, limite))
+    transcurrido = time.perf_counter() - inicio
+    rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    assert total == n * (n - 1), estrategia
+    return transcurrido, (rss1 - rss0) / 1024  # ru_maxrss en KB (Linux)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="asyncio.gather vs amap con límite de concurrencia")
+    parser.add_argument("--tamanos", default="1000,100000,1000000")
+    parser.add_argument("--limite", type=int, default=1000)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print(f"FAN-OUT ACOTADO: gather vs amap (limite={args.limite})")
+    print("="*70)
+    print(f"{'tareas':>10} {'estrategia':<14} {'tiempo':>9} {'tareas/s':>10} {'memoria pico':>13}")
+
+    for n in (int(t) for t in args.tamanos.split(",")):
+        for estrategia in ESTRATEGIAS:
+            # max_tasks_per_child=1: un proceso limpio por medición
+            with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+                t, mb = executor.submit(medir_en_proceso, estrategia, n, args.limite).result()
+            print(f"{n:>10,} {estrategia:<14} {t:>8.2f}s {n / t:>10,.0f} {mb:>11.1f}MB")
+
+    print("\n✅ amap: memoria acotada por el límite, no por el número de tareas")
+    print("✅ El servicio de destino nunca ve más de `limite` peticiones a la vez")
+    print("⚠️  Orden de entrada: una tarea lenta frena la ventana; usar orden de terminación si se puede")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
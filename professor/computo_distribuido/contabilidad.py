@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Contabilidad de CPU y memoria por modelo de ejecución
+Usado por ejemplos_modelos_ejecucion.py
+
+El tiempo de pared solo dice cuánto esperamos. No dice cuánta CPU se
+quemó (4 procesos × 1s = 4s de CPU aunque la pared marque 1s) ni cuánta
+memoria costó cada modelo (un hilo comparte el proceso; cada proceso hijo
+carga su propio intérprete).
+
+medir("Modelo N") registra, para el bloque:
+- pared:     time.perf_counter
+- CPU:       resource.getrusage de este proceso (todos sus hilos) y de los
+             hijos ya terminados (RUSAGE_CHILDREN solo cuenta hijos esperados:
+             los pools deben cerrarse dentro del bloque)
+- RSS pico:  de este proceso (VmHWM, reiniciado en cada bloque vía
+             /proc/self/clear_refs) y del hijo más grande. El de los hijos es
+             acumulado: ru_maxrss de RUSAGE_CHILDREN no se puede reiniciar y es
+             el máximo de TODOS los hijos esperados desde que arrancó el proceso,
+             no solo los de este bloque
+- tracemalloc: pico de memoria Python del padre, solo si tracemalloc ya está
+             activo (cuesta caro: ~50x en bucles que crean enteros)
+- cambios de contexto voluntarios + involuntarios (padre e hijos)
+"""
+
+import os
+import re
+import resource
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+Medicion = namedtuple("Medicion", [
+    "modelo", "pared", "cpu_propio", "cpu_hijos",
+    "rss_mb", "rss_hijos_max_acum_mb", "tracemalloc_mb", "cambios_contexto",
+])
+
+_mediciones = []
+
+
+# =============================================================================
+# LECTURAS
+# =============================================================================
+def _reiniciar_pico_rss():
+    """Reinicia VmHWM (Linux >= 4.0). Retorna False si no se puede."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _pico_rss_kb(uso, reiniciado):
+    """VmHWM si se pudo reiniciar; si no, ru_maxrss (pico de toda la vida del proceso)."""
+    if reiniciado:
+        try:
+            with open("/proc/self/status") as f:
+                return int(re.search(r"VmHWM:\s+(\d+)", f.read()).group(1))
+        except (OSError, AttributeError):
+            pass
+    return uso.ru_maxrss  # KB en Linux
+
+
+def _cpu(uso):
+    return uso.ru_utime + uso.ru_stime
+
+
+def _cambios(uso):
+    return uso.ru_nvcsw + uso.ru_nivcsw
+
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+@contextmanager
+def medir(modelo):
+    """
+    Registra pared, CPU, memoria y cambios de contexto del bloque:
+
+        with medir("Modelo 5"):
+            modelo_5_paralelo()
+    """
+    reiniciado = _reiniciar_pico_rss()
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    propio0 = resource.getrusage(resource.RUSAGE_SELF)
+    hijos0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        pared = time.perf_counter() - inicio
+        propio1 = resource.getrusage(resource.RUSAGE_SELF)
+        hijos1 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu_hijos = _cpu(hijos1) - _cpu(hijos0)
+        # ru_maxrss de hijos es el máximo histórico: solo se reporta si hubo hijos aquí,
+        # y aun así puede venir de un hijo de un bloque anterior
+        hubo_hijos = cpu_hijos > 0 or hijos1.ru_maxrss > hijos0.ru_maxrss
+        _mediciones.append(Medicion(
+            modelo=modelo,
+            pared=pared,
+            cpu_propio=_cpu(propio1) - _cpu(propio0),
+            cpu_hijos=cpu_hijos,
+            rss_mb=_pico_rss_kb(propio1, reiniciado) / 1024,
+            rss_hijos_max_acum_mb=hijos1.ru_maxrss / 1024 if hubo_hijos else None,
+            tracemalloc_mb=tracemalloc.get_traced_memory()[1] / 2**20 if tracemalloc.is_tracing() else None,
+            cambios_contexto=_cambios(propio1) - _cambios(propio0) + _cambios(hijos1) - _cambios(hijos0),
+        ))
+
+
+def mediciones():
+    """Copia de las mediciones registradas."""
+    return list(_mediciones)
+
+
+def limpiar():
+    _mediciones.clear()
+
+
+# =============================================================================
+# TABLA
+# =============================================================================
+def _mb(valor):
+    return f"{valor:>7.1f}MB" if valor is not None else f"{'—':>9}"
+
+
+def tabla(lista=None):
+    """
+    Tabla de resumen. Columnas derivadas:
+    - cores:      CPU total / pared (cuántos cores se usaron en promedio)
+    - eficiencia: cores / os.cpu_count() (qué fracción de la máquina trabajó)
+    "hijo acum" es el máximo acumulado de ru_maxrss de hijos (ver el docstring del módulo).
+    """
+    lista = mediciones() if lista is None else lista
+    if not lista:
+        return "(sin mediciones)"
+    n_cores = os.cpu_count() or 1
+    ancho = max(len(m.modelo) for m in lista)
+    lineas = [f"{'modelo':<{ancho}} {'pared':>7} {'CPU':>7} {'(hijos)':>8} {'RSS pico':>9} "
+              f"{'hijo acum':>9} {'tracemalloc':>11} {'ctx sw':>8} {'cores':>6} {'eficiencia':>10}"]
+    for m in lista:
+        cpu = m.cpu_propio + m.cpu_hijos
+        cores = cpu / m.pared if m.pared else 0.0
+        lineas.append(f"{m.modelo:<{ancho}} {m.pared:>6.2f}s {cpu:>6.2f}s {m.cpu_hijos:>7.2f}s "
+                      f"{_mb(m.rss_mb)} {_mb(m.rss_hijos_max_acum_mb)} {_mb(m.tracemalloc_mb):>11} "
+                      f"{m.cambios_contexto:>8,} {cores:>6.2f} {cores / n_cores:>10.0%}")
+    lineas.append("hijo acum: máximo de ru_maxrss de todos los hijos esperados hasta ese modelo, "
+                  "no solo los suyos")
+    return "\n".join(lineas)
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Modelo 6: DISTRIBUIDO (varias máquinas)
+Complemento de ejemplos_modelos_ejecucion.py
+
+El Modelo 5 usa varios cores de UNA máquina. Aquí un coordinador publica
+una cola de tareas por TCP (multiprocessing.managers.BaseManager) y N
+workers se conectan a él, desde la misma máquina o desde otras.
+
+    Coordinador (host:puerto)            Workers (cualquier host)
+    ┌─────────────────────────┐    TCP   ┌────────────┐
+    │ pendientes  [t3 t4 t5]  │ <──────> │ worker A   │ tomar / entregar / latido
+    │ en curso    {t1:A t2:B} │ <──────> │ worker B   │
+    │ resultados  {t0: ...}   │          └────────────┘
+    └─────────────────────────┘
+
+Tolerancia a fallas: cada worker envía un latido periódico. Si un worker
+deja de latir, el coordinador regresa sus tareas en curso a la cola
+(hasta `max_intentos` veces). Entregar dos veces la misma tarea es inocuo.
+
+Uso en varias máquinas:
+    máquina 1:  python distribuido.py --puerto 50000 coordinador --clave secreto
+    máquina 2+: python distribuido.py --puerto 50000 worker --host máquina1 --clave secreto
+Demo local (coordinador + workers como procesos locales):
+    python distribuido.py
+"""
+
+import argparse
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Process
+from multiprocessing.managers import BaseManager
+
+
+# =============================================================================
+# COORDINADOR: estado compartido que se sirve por TCP
+# =============================================================================
+class Coordinador:
+    """
+    Cola de tareas con arrendamientos (leases).
+
+    tomar() entrega una tarea y la marca "en curso" a nombre del worker;
+    entregar() la da por terminada; revisar_caidos() devuelve a la cola las
+    tareas de workers sin latido reciente.
+    """
+
+    def __init__(self, tareas, plazo_latido=2.0, max_intentos=3):
+        self._pendientes = queue.Queue()
+        self._en_curso = {}      # id_tarea -> (worker, tarea)
+        self._latidos = {}       # worker -> último latido (time.monotonic)
+        self._intentos = {}      # id_tarea -> veces entregada a un worker
+        self._resultados = {}
+        self._fallidas = {}
+        self._despedidos = set()  # workers que ya recibieron "FIN"
+        self._candado = threading.Lock()
+        self.total = len(tareas)
+        self.plazo_latido = plazo_latido
+        self.max_intentos = max_intentos
+        self.reintentos = 0
+        for id_tarea, tarea in enumerate(tareas):
+            self._pendientes.put((id_tarea, tarea))
+
+    # --- llamados por los workers (a través de proxies) ---
+    def tomar(self, worker, espera=0.5):
+        """Retorna (id_tarea, tarea), None si no hay nada por ahora, o "FIN"."""
+        self.latido(worker)
+        if self.terminado():
+            with self._candado:
+                self._despedidos.add(worker)
+            return "FIN"
+        try:
+            id_tarea, tarea = self._pendientes.get(timeout=espera)
+        except queue.Empty:
+            return None
+        with self._candado:
+            if id_tarea in self._resultados:  # ya la entregó un worker que creíamos caído
+                return None
+            self._en_curso[id_tarea] = (worker, tarea)
+            self._intentos[id_tarea] = self._intentos.get(id_tarea, 0) + 1
+        return id_tarea, tarea
+
+    def entregar(self, worker, id_tarea, resultado):
+        with self._candado:
+            self._en_curso.pop(id_tarea, None)
+            self._fallidas.pop(id_tarea, None)
+            self._resultados.setdefault(id_tarea, resultado)
+        self.latido(worker)
+
+    def latido(self, worker):
+        with self._candado:
+            self._latidos[worker] = time.monotonic()
+
+    # --- llamados por el proceso coordinador ---
+    def revisar_caidos(self):
+        """Regresa a la cola las tareas de workers sin latido en `plazo_latido` s."""
+        ahora = time.monotonic()
+        with self._candado:
+            caidos = {w for w, t in self._latidos.items() if ahora - t > self.plazo_latido}
+            for id_tarea, (worker, tarea) in list(self._en_curso.items()):
+                if worker not in caidos:
+                    continue
+                del self._en_curso[id_tarea]
+                if self._intentos[id_tarea] >= self.max_intentos:
+                    self._fallidas[id_tarea] = f"falló {self._intentos[id_tarea]} veces"
+                else:
+                    self.reintentos += 1
+                    self._pendientes.put((id_tarea, tarea))
+            for w in caidos:
+                del self._latidos[w]
+        return caidos
+
+    def terminado(self):
+        with self._candado:
+            return len(self._resultados) + len(self._fallidas) >= self.total
+
+    def resultados(self):
+        with self._candado:
+            return dict(self._resultados), dict(self._fallidas)
+
+    def todos_despedidos(self):
+        """True si cada worker vivo (con latido reciente) ya recibió "FIN"."""
+        with self._candado:
+            return self._latidos.keys() <= self._despedidos
+
+
+class GestorCoordinador(BaseManager):
+    """BaseManager que expone el Coordinador por TCP."""
+
+
+def iniciar_coordinador(tareas, puerto, clave, host="127.0.0.1", **opciones):
+    """
+    Sirve un Coordinador en host:puerto desde un hilo de este proceso.
+    Retorna (coordinador, servidor); el coordinador se usa directamente aquí.
+    Al terminar, detener_coordinador(servidor) libera el puerto.
+    """
+    coordinador = Coordinador(tareas, **opciones)
+
+    # Subclase por servidor: register() modifica el registro de la clase
+    class Gestor(GestorCoordinador):
+        pass
+
+    Gestor.register("coordinador", callable=lambda: coordinador)
+    gestor = Gestor(address=(host, puerto), authkey=clave)
+    servidor = gestor.get_server()
+    servidor.stop_event = threading.Event()
+    threading.Thread(target=_servir, args=(servidor,), daemon=True).start()
+    return coordinador, servidor
+
+
+def _servir(servidor):
+    # Como Server.serve_forever, pero el bucle de accept termina con stop_event
+    # y cierra el listener (serve_forever nunca lo cierra: el puerto quedaba ocupado)
+    try:
+        while True:
+            try:
+                conexion = servidor.listener.accept()
+            except OSError:
+                continue
+            if servidor.stop_event.is_set():
+                conexion.close()
+                break
+            threading.Thread(target=servidor.handle_request, args=(conexion,), daemon=True).start()
+    finally:
+        servidor.listener.close()
+
+
+def detener_coordinador(servidor):
+    """Deja de aceptar conexiones y cierra el puerto. Las conexiones abiertas siguen atendidas."""
+    servidor.stop_event.set()
+    # accept() está bloqueado: una conexión propia lo despierta para que vea el evento
+    # (la autenticación la hace handle_request, no el listener)
+    socket.create_connection(servidor.address).close()
+
+
+def esperar_resultados(coordinador, intervalo=0.2):
+    """Revisa latidos hasta que todas las tareas terminen o fallen."""
+    while not coordinador.terminado():
+        caidos = coordinador.revisar_caidos()
+        for w in caidos:
+            print(f"⚠️  Worker {w} sin latido: sus tareas vuelven a la cola")
+        time.sleep(intervalo)
+    return coordinador.resultados()
+
+
+def esperar_despedidas(coordinador, gracia=5.0, intervalo=0.2):
+    """
+    Sigue sirviendo "FIN" hasta que todos los workers vivos lo tomen o pasen
+    `gracia` segundos. Sin esto, cerrar el coordinador deja a los workers que
+    esperan en tomar() sin conexión. Retorna True si todos se despidieron.
+    """
+    limite = time.monotonic() + gracia
+    while not coordinador.todos_despedidos():
+        if time.monotonic() >= limite:
+            return False
+        coordinador.revisar_caidos()  # un worker caído no se va a despedir
+        time.sleep(intervalo)
+    return True
+
+
+# =============================================================================
+# WORKER: se conecta al coordinador y procesa tareas
+# =============================================================================
+def _conectar(direccion, clave, intentos=50):
+    GestorCoordinador.register("coordinador")
+    for _ in range(intentos):
+        gestor = GestorCoordinador(address=direccion, authkey=clave)
+        try:
+            gestor.connect()
+            return gestor.coordinador()
+        except ConnectionRefusedError:
+            time.sleep(0.1)
+    raise ConnectionRefusedError(f"no hay coordinador en {direccion}")
+
+
+def _latir(direccion, clave, worker, detener, intervalo):
+    # Conexión propia: los proxies no se comparten entre hilos
+    try:
+        coordinador = _conectar(direccion, clave)
+        while not detener.wait(intervalo):
+            coordinador.latido(worker)
+    except (EOFError, ConnectionError):
+        pass  # el coordinador ya cerró: el hilo principal decide qué hacer
+
+
+def ejecutar_worker(direccion, clave, fn, morir_tras=None, intervalo_latido=0.5):
+    """
+    Procesa tareas hasta que el coordinador responda "FIN".
+    morir_tras: simular una caída (os._exit) después de tomar esa cantidad de tareas.
+    """
+    worker = f"{os.uname().nodename}:{os.getpid()}"
+    coordinador = _conectar(direccion, clave)
+    detener = threading.Event()
+    threading.Thread(target=_latir, args=(direccion, clave, worker, detener, intervalo_latido),
+                     daemon=True).start()
+    tomadas = 0
+    try:
+        while True:
+            asignacion = coordinador.tomar(worker)
+            if asignacion == "FIN":
+                break
+            if asignacion is None:
+                continue
+            id_tarea, tarea = asignacion
+            tomadas += 1
+            if morir_tras is not None and tomadas > morir_tras:
+                os._exit(1)  # caída abrupta: sin entregar ni avisar
+            coordinador.entregar(worker, id_tarea, fn(*tarea))
+    except (EOFError, ConnectionError):
+        # El coordinador cerró antes de que tomáramos "FIN": ya no hay nada que hacer
+        print(f"⚠️  Worker {worker}: el coordinador cerró la conexión, termino")
+    finally:
+        detener.set()
+
+
+# =============================================================================
+# TRABAJO (a nivel módulo para que los workers lo puedan importar)
+# =============================================================================
+def procesar(nombre, complejidad):
+    """CPU-bound, como procesar_ingrediente del Modelo 5 pero sin imprimir."""
+    return nombre, sum(range(complejidad))
+
+
+def _tarea_tupla(tarea):
+    return procesar(*tarea)
+
+
+def tareas_demo(n=24):
+    ingredientes = ["🥔 Papas", "🥕 Zanahorias", "🧅 Cebollas"]
+    return [(f"{ingredientes[i % 3]} #{i}", 1_000_000 + 250_000 * (i % 4)) for i in range(n)]
+
+
+# =============================================================================
+# MODELO 6: demo local y comparación con ProcessPoolExecutor
+# =============================================================================
+def correr_distribuido(tareas, n_workers, puerto, simular_caida=False):
+    """
+    Coordinador en este proceso + n_workers procesos locales conectados por TCP.
+    Con simular_caida, el primer worker muere después de tomar su segunda tarea.
+    Retorna (segundos, resultados, fallidas, reintentos).
+    """
+    clave = os.urandom(16)
+    direccion = ("127.0.0.1", puerto)
+    inicio = time.time()
+    coordinador, servidor = iniciar_coordinador(tareas, puerto, clave, plazo_latido=1.5)
+    workers = []
+    try:
+        for i in range(n_workers):
+            morir_tras = 1 if (simular_caida and i == 0) else None
+            p = Process(target=ejecutar_worker, args=(direccion, clave, procesar, morir_tras))
+            p.start()
+            workers.append(p)
+        resultados, fallidas = esperar_resultados(coordinador)
+        transcurrido = time.time() - inicio
+        for p in workers:
+            p.join()
+    finally:
+        detener_coordinador(servidor)
+    return transcurrido, resultados, fallidas, coordinador.reintentos
+
+
+def modelo_6_distribuido(n_workers=3, puerto=50000):
+    """
+    Múltiples cocinas (máquinas) reciben órdenes de un mismo coordinador.
+    Aquí las "máquinas" son procesos locales que se conectan por TCP.
+    """
+    print(f"\n{'='*70}")
+    print("MODELO 6: DISTRIBUIDO (coordinador TCP + workers)")
+    print(f"{'='*70}")
+
+    tareas = tareas_demo()
+
+    print("\n--- ProcessPoolExecutor (una máquina, baseline) ---")
+    inicio = time.time()
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        esperado = dict(executor.map(_tarea_tupla, tareas))
+    tiempo_pool = time.time() - inicio
+    print(f"⏱️  ProcessPoolExecutor: {tiempo_pool:.2f}s ({len(tareas) / tiempo_pool:.1f} tareas/s)")
+
+    for titulo, caida, p in (("sin fallas", False, puerto), ("con caída de un worker", True, puerto + 1)):
+        print(f"\n--- Distribuido, {titulo} ({n_workers} workers vía TCP 127.0.0.1:{p}) ---")
+        t, resultados, fallidas, reintentos = correr_distribuido(tareas, n_workers, p, caida)
+        print(f"⏱️  Distribuido: {t:.2f}s ({len(tareas) / t:.1f} tareas/s)")
+        print(f"🔁 Reintentos: {reintentos}, fallidas: {len(fallidas)}")
+        print(f"✅ Resultados iguales al baseline: {dict(resultados.values()) == esperado}")
+
+    print("\n⚠️  Costos extra: una llamada TCP por tarea, serialización y detección de caídas")
+    print("✅ A cambio: los workers pueden estar en otras máquinas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Modelo 6: distribuido con coordinador TCP")
+    sub = parser.add_subparsers(dest="rol")
+    c = sub.add_parser("coordinador", help="Servir las tareas de demo y esperar workers")
+    c.add_argument("--host", default="0.0.0.0")
+    c.add_argument("--clave", required=True)
+    w = sub.add_parser("worker", help="Conectarse a un coordinador y procesar tareas")
+    w.add_argument("--host", required=True)
+    w.add_argument("--clave", required=True)
+    parser.add_argument("--workers", type=int, default=3, help="Workers locales (demo)")
+    # Solo aquí: si los subcomandos también lo definen, su default pisa el valor del padre
+    parser.add_argument("--puerto", type=int, default=50000, help="Puerto del coordinador")
+    args = parser.parse_args()
+
+    if args.rol == "coordinador":
+        clave = args.clave.encode()
+        coordinador, servidor = iniciar_coordinador(tareas_demo(), args.puerto, clave, host=args.host)
+        print(f"Coordinador en {args.host}:{args.puerto}, {coordinador.total} tareas")
+        try:
+            resultados, fallidas = esperar_resultados(coordinador)
+            if not esperar_despedidas(coordinador):
+                print("⚠️  Algunos workers no tomaron FIN a tiempo")
+        finally:
+            detener_coordinador(servidor)
+        print(f"✅ {len(resultados)} resultados, {len(fallidas)} fallidas, {coordinador.reintentos} reintentos")
+    elif args.rol == "worker":
+        ejecutar_worker((args.host, args.puerto), args.clave.encode(), procesar)
+    else:
+        modelo_6_distribuido(n_workers=args.workers, puerto=args.puerto)
+
+
+if __name__ == "__main__":
+    main()
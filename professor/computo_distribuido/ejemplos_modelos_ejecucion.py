@@ -4,21 +4,49 @@ Ejemplos de Modelos de Ejecución Computacional
 Basado en los materiales de professor/computo_distribuido/
 
 Este archivo demuestra los 5 modelos principales con la analogía de la cocina.
+
+Uso:
+    python ejemplos_modelos_ejecucion.py                  # imprime cada paso
+    python ejemplos_modelos_ejecucion.py --silencioso     # solo resúmenes y Gantt
+    python ejemplos_modelos_ejecucion.py --traza trazas/  # + JSON para chrome://tracing
+    python ejemplos_modelos_ejecucion.py --distribuido    # + Modelo 6 (distribuido.py)
+    python ejemplos_modelos_ejecucion.py --afinidad nucleos  # workers fijados a cores (afinidad.py)
+    python ejemplos_modelos_ejecucion.py --tracemalloc    # + pico de memoria Python (lento)
+    python ejemplos_modelos_ejecucion.py --kernel numpy   # trabajo CPU vectorizado (kernels.py)
+    python ejemplos_modelos_ejecucion.py --bucle uvloop   # Modelos 2 y 4 sobre uvloop (bucles.py)
 """
 
+import argparse
 import asyncio
 import threading
 import time
 import os
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import tracemalloc
 from datetime import datetime
 
+import afinidad
+import bucles
+import contabilidad
+import kernels
+import selector
+import trazas
+from trazas import tramo
+
+# Con --silencioso no se imprimen los pasos; la línea de tiempo sale de las trazas
+IMPRIMIR_PASOS = True
+
 
 def timestamp():
     """Retorna timestamp legible HH:MM:SS.mmm"""
     return datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
 
+def log(mensaje):
+    """Imprime [HH:MM:SS.mmm] mensaje, salvo en modo silencioso"""
+    if IMPRIMIR_PASOS:
+        print(f"[{timestamp()}] {mensaje}")
+
+
 # =============================================================================
 # MODELO 1: SECUENCIAL
 # =============================================================================
@@ -32,16 +60,18 @@ def modelo_1_secuencial():
     print(f"{'='*70}")
     
     def preparar_cafe():
-        print(f"[{timestamp()}] ☕ Café: moler granos...")
-        time.sleep(1)
-        print(f"[{timestamp()}] ☕ Café: hervir agua...")
-        time.sleep(1)
-        print(f"[{timestamp()}] ☕ Café: LISTO")
+        with tramo("☕ Café"):
+            log("☕ Café: moler granos...")
+            time.sleep(1)
+            log("☕ Café: hervir agua...")
+            time.sleep(1)
+            log("☕ Café: LISTO")
     
     def tostar_pan():
-        print(f"[{timestamp()}] 🍞 Pan: meter en tostadora...")
-        time.sleep(0.5)
-        print(f"[{timestamp()}] 🍞 Pan: LISTO")
+        with tramo("🍞 Pan"):
+            log("🍞 Pan: meter en tostadora...")
+            time.sleep(0.5)
+            log("🍞 Pan: LISTO")
     
     inicio = time.time()
     preparar_cafe()  # Espera a que termine
@@ -64,14 +94,16 @@ async def modelo_2_async_no_concurrente():
     print(f"{'='*70}")
     
     async def preparar_cafe():
-        print(f"[{timestamp()}] ☕ Café: inicio cafetera...")
-        await asyncio.sleep(1)  # Espera (wait)
-        print(f"[{timestamp()}] ☕ Café: LISTO")
+        with tramo("☕ Café"):
+            log("☕ Café: inicio cafetera...")
+            await asyncio.sleep(1)  # Espera (wait)
+            log("☕ Café: LISTO")
     
     async def tostar_pan():
-        print(f"[{timestamp()}] 🍞 Pan: inicio tostadora...")
-        await asyncio.sleep(0.5)  # Espera (wait)
-        print(f"[{timestamp()}] 🍞 Pan: LISTO")
+        with tramo("🍞 Pan"):
+            log("🍞 Pan: inicio tostadora...")
+            await asyncio.sleep(0.5)  # Espera (wait)
+            log("🍞 Pan: LISTO")
     
     inicio = time.time()
     await preparar_cafe()  # Espera a que termine (no aprovecha el wait)
@@ -84,19 +116,21 @@ async def modelo_2_async_no_concurrente():
 # =============================================================================
 # MODELO 3: CONCURRENTE pero NO ASÍNCRONO
 # =============================================================================
-def modelo_3_concurrente_no_async():
+def modelo_3_concurrente_no_async(kernel="python"):
     """
     Tres tareas CPU-bound que se alternan por time-slicing.
     No hay esperas reales, solo cambios de contexto.
+    kernel: implementación del trabajo de CPU (ver kernels.py)
     """
     print(f"\n{'='*70}")
     print("MODELO 3: CONCURRENTE pero NO ASÍNCRONO (time-slicing)")
     print(f"{'='*70}")
     
     def tarea_cpu_intensiva(nombre, iteraciones):
-        print(f"[{timestamp()}] {nombre}: INICIO")
-        resultado = sum(range(iteraciones))
-        print(f"[{timestamp()}] {nombre}: FIN (resultado={resultado})")
+        with tramo(nombre):
+            log(f"{nombre}: INICIO")
+            resultado = kernels.ejecutar(kernel, iteraciones)
+            log(f"{nombre}: FIN (resultado={resultado})")
     
     inicio = time.time()
     
@@ -130,21 +164,24 @@ async def modelo_4_async_concurrente():
     print(f"{'='*70}")
     
     async def preparar_cafe():
-        print(f"[{timestamp()}] ☕ Café: inicio cafetera...")
-        await asyncio.sleep(1)  # Espera (wait) - libera CPU
-        print(f"[{timestamp()}] ☕ Café: LISTO")
+        with tramo("☕ Café"):
+            log("☕ Café: inicio cafetera...")
+            await asyncio.sleep(1)  # Espera (wait) - libera CPU
+            log("☕ Café: LISTO")
         return "café"
     
     async def tostar_pan():
-        print(f"[{timestamp()}] 🍞 Pan: inicio tostadora...")
-        await asyncio.sleep(0.5)  # Espera (wait) - libera CPU
-        print(f"[{timestamp()}] 🍞 Pan: LISTO")
+        with tramo("🍞 Pan"):
+            log("🍞 Pan: inicio tostadora...")
+            await asyncio.sleep(0.5)  # Espera (wait) - libera CPU
+            log("🍞 Pan: LISTO")
         return "pan"
     
     async def cortar_fruta():
-        print(f"[{timestamp()}] 🍎 Fruta: cortando...")
-        await asyncio.sleep(0.3)  # Trabajo
-        print(f"[{timestamp()}] 🍎 Fruta: LISTO")
+        with tramo("🍎 Fruta"):
+            log("🍎 Fruta: cortando...")
+            await asyncio.sleep(0.3)  # Trabajo
+            log("🍎 Fruta: LISTO")
         return "fruta"
     
     inicio = time.time()
@@ -159,24 +196,27 @@ async def modelo_4_async_concurrente():
 # =============================================================================
 # MODELO 5: PARALELO (múltiples cores)
 # =============================================================================
-def procesar_ingrediente(nombre, complejidad):
+def procesar_ingrediente(nombre, complejidad, kernel="python"):
     """Función auxiliar para procesamiento paralelo (debe estar a nivel módulo)"""
     pid = os.getpid()
-    print(f"[{timestamp()}] {nombre}: INICIO (PID {pid})")
-    resultado = sum(range(complejidad))  # CPU-bound
-    print(f"[{timestamp()}] {nombre}: FIN (PID {pid}, resultado={resultado})")
+    with tramo(nombre):
+        log(f"{nombre}: INICIO (PID {pid})")
+        resultado = kernels.ejecutar(kernel, complejidad)  # CPU-bound
+        log(f"{nombre}: FIN (PID {pid}, resultado={resultado})")
     return resultado
 
 
-def modelo_5_paralelo():
+def modelo_5_paralelo(politica_afinidad="libre", kernel="python"):
     """
     Múltiples chefs (cores) trabajan simultáneamente.
     Paralelismo real en múltiples CPUs.
+    politica_afinidad: "libre", "nucleos" o "hermanos" (ver afinidad.py)
+    kernel: implementación del trabajo de CPU (ver kernels.py)
     """
     print(f"\n{'='*70}")
     print(f"MODELO 5: PARALELO (múltiples cores)")
     print(f"{'='*70}")
-    print(f"Sistema: {os.cpu_count()} cores disponibles")
+    print(f"Sistema: {os.cpu_count()} cores disponibles, kernel: {kernel}")
     
     tareas = [
         ("🥔 Papas", 8_000_000),
@@ -188,18 +228,21 @@ def modelo_5_paralelo():
     print("\n--- SECUENCIAL (baseline) ---")
     inicio = time.time()
     for nombre, complejidad in tareas:
-        procesar_ingrediente(nombre, complejidad)
+        procesar_ingrediente(nombre, complejidad, kernel)
     tiempo_seq = time.time() - inicio
     print(f"⏱️  Secuencial: {tiempo_seq:.2f}s")
     
-    print("\n--- PARALELO (múltiples procesos) ---")
+    print(f"\n--- PARALELO (múltiples procesos, afinidad: {politica_afinidad}) ---")
     inicio = time.time()
-    with ProcessPoolExecutor(max_workers=3) as executor:
-        resultados = list(executor.map(
-            procesar_ingrediente, 
+    with afinidad.crear_pool("procesos", 3, politica_afinidad) as executor:
+        # Como executor.map, pero trae de vuelta los tramos de cada proceso hijo
+        resultados = trazas.map_trazado(
+            executor,
+            procesar_ingrediente,
             [t[0] for t in tareas],
-            [t[1] for t in tareas]
-        ))
+            [t[1] for t in tareas],
+            [kernel] * len(tareas)
+        )
     tiempo_par = time.time() - inicio
     print(f"⏱️  Paralelo: {tiempo_par:.2f}s")
     print(f"⚡ Speedup: {tiempo_seq/tiempo_par:.2f}x")
@@ -208,18 +251,19 @@ def modelo_5_paralelo():
 # =============================================================================
 # DEMOSTRACIÓN: Threading vs Multiprocessing para CPU-bound
 # =============================================================================
-def tarea_cpu(n):
+def tarea_cpu(n, kernel="python"):
     """Función auxiliar para demo GIL (debe estar a nivel módulo)"""
-    return sum(range(n))
+    return kernels.ejecutar(kernel, n)
 
 
-def demo_gil():
+def demo_gil(politica_afinidad="libre", kernel="python"):
     """
     Demuestra el impacto del GIL en tareas CPU-bound.
     Threading NO da paralelismo, Multiprocessing SÍ.
+    Con un kernel de NumPy (suelta el GIL) los hilos también pueden escalar.
     """
     print(f"\n{'='*70}")
-    print("DEMOSTRACIÓN: Impacto del GIL en CPU-bound")
+    print(f"DEMOSTRACIÓN: Impacto del GIL en CPU-bound (kernel: {kernel})")
     print(f"{'='*70}")
     
     datos = [10_000_000, 10_000_000]
@@ -227,55 +271,118 @@ def demo_gil():
     # ThreadPoolExecutor (limitado por GIL)
     print("--- Threading (limitado por GIL) ---")
     inicio = time.time()
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        list(executor.map(tarea_cpu, datos))
+    with afinidad.crear_pool("hilos", 2, politica_afinidad) as executor:
+        list(executor.map(tarea_cpu, datos, [kernel] * len(datos)))
     tiempo_threading = time.time() - inicio
-    print(f"⏱️  Threading: {tiempo_threading:.2f}s (casi secuencial)")
+    nota = "casi secuencial" if kernel == "python" else "NumPy suelta el GIL"
+    print(f"⏱️  Threading: {tiempo_threading:.2f}s ({nota})")
     
     # ProcessPoolExecutor (sin GIL)
     print("\n--- Multiprocessing (sin GIL) ---")
     inicio = time.time()
-    with ProcessPoolExecutor(max_workers=2) as executor:
-        list(executor.map(tarea_cpu, datos))
+    with afinidad.crear_pool("procesos", 2, politica_afinidad) as executor:
+        list(executor.map(tarea_cpu, datos, [kernel] * len(datos)))
     tiempo_multiproc = time.time() - inicio
     print(f"⏱️  Multiprocessing: {tiempo_multiproc:.2f}s (paralelismo real)")
     print(f"⚡ Speedup: {tiempo_threading/tiempo_multiproc:.2f}x")
 
 
+# =============================================================================
+# LÍNEA DE TIEMPO: Gantt en consola y traza para chrome://tracing
+# =============================================================================
+def reportar_traza(modelo, directorio=None):
+    """Imprime el Gantt de los tramos del modelo y, si se pide, exporta la traza"""
+    print(f"\n📊 Línea de tiempo ({modelo}):")
+    print(trazas.gantt_ascii())
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+        ruta = os.path.join(directorio, f"traza_{modelo}.json")
+        trazas.exportar_chrome(ruta)
+        print(f"💾 Traza Chrome: {ruta} (abrir en chrome://tracing o ui.perfetto.dev)")
+    trazas.limpiar()
+
+
 # =============================================================================
 # MAIN: Ejecutar todos los ejemplos
 # =============================================================================
 def main():
+    global IMPRIMIR_PASOS
+
+    parser = argparse.ArgumentParser(description="Modelos de ejecución con la analogía de la cocina")
+    parser.add_argument("--traza", metavar="DIR", help="Exportar trazas Chrome Trace Event en DIR")
+    parser.add_argument("--silencioso", action="store_true",
+                        help="No imprimir cada paso (menos perturbación en los tiempos)")
+    parser.add_argument("--distribuido", action="store_true",
+                        help="Incluir el Modelo 6 (coordinador TCP local, ver distribuido.py)")
+    parser.add_argument("--afinidad", choices=afinidad.POLITICAS, default="libre",
+                        help="Fijar los workers de Modelo 5 y demo GIL a CPUs (ver afinidad.py)")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Medir el pico de memoria Python por modelo (alarga mucho los modelos CPU-bound)")
+    parser.add_argument("--kernel", choices=kernels.KERNELS, default="python",
+                        help="Trabajo de CPU de los Modelos 3 y 5 y la demo GIL (ver kernels.py)")
+    parser.add_argument("--bucle", choices=("asyncio", "uvloop"), default="asyncio",
+                        help="Event loop de los Modelos 2 y 4 (ver bucles.py)")
+    args = parser.parse_args()
+    if args.bucle not in bucles.disponibles():
+        parser.error("uvloop no está instalado (pip install uvloop)")
+    IMPRIMIR_PASOS = not args.silencioso
+    if args.tracemalloc:
+        tracemalloc.start()
+
     print("\n" + "="*70)
     print("EJEMPLOS DE MODELOS DE EJECUCIÓN COMPUTACIONAL")
     print("Basado en: professor/computo_distribuido/")
     print("="*70)
     
     # Modelo 1: Secuencial
-    modelo_1_secuencial()
+    with contabilidad.medir("Modelo 1: secuencial"):
+        modelo_1_secuencial()
+    reportar_traza("modelo_1", args.traza)
     
     # Modelo 2: Async no concurrente
-    asyncio.run(modelo_2_async_no_concurrente())
+    with contabilidad.medir("Modelo 2: async no concurrente"):
+        bucles.correr(modelo_2_async_no_concurrente(), args.bucle)
+    reportar_traza("modelo_2", args.traza)
     
     # Modelo 3: Concurrente no async
-    modelo_3_concurrente_no_async()
+    with contabilidad.medir("Modelo 3: hilos"):
+        modelo_3_concurrente_no_async(args.kernel)
+    reportar_traza("modelo_3", args.traza)
     
     # Modelo 4: Async concurrente
-    asyncio.run(modelo_4_async_concurrente())
+    with contabilidad.medir("Modelo 4: async concurrente"):
+        bucles.correr(modelo_4_async_concurrente(), args.bucle)
+    reportar_traza("modelo_4", args.traza)
     
     # Modelo 5: Paralelo
-    modelo_5_paralelo()
+    with contabilidad.medir("Modelo 5: procesos"):
+        modelo_5_paralelo(args.afinidad, args.kernel)
+    reportar_traza("modelo_5", args.traza)
+    
+    # Modelo 6: Distribuido (opcional: abre puertos TCP locales)
+    if args.distribuido:
+        from distribuido import modelo_6_distribuido
+        with contabilidad.medir("Modelo 6: distribuido"):
+            modelo_6_distribuido()
     
     # Demo GIL
-    demo_gil()
+    with contabilidad.medir("Demo GIL"):
+        demo_gil(args.afinidad, args.kernel)
     
     print("\n" + "="*70)
     print("RESUMEN DE DECISIONES:")
     print("="*70)
+    print(contabilidad.tabla())
+    print("(CPU incluye hijos; cores = CPU/pared;")
+    print(f" eficiencia = cores/{os.cpu_count()}; ctx sw = cambios de contexto)")
+    print()
     print("✅ I/O-bound + librerías async  → asyncio (Modelo 4)")
     print("✅ I/O-bound + librerías sync   → ThreadPoolExecutor")
     print("✅ CPU-bound                    → ProcessPoolExecutor (Modelo 5)")
     print("✅ Tarea simple                 → Secuencial (Modelo 1)")
+    print("✅ Más trabajo que una máquina  → Coordinador + workers (Modelo 6)")
+    print("\n--- Decisión automática: auto_executor (ver selector.py) ---")
+    selector.demo()
     print("="*70 + "\n")
 
 
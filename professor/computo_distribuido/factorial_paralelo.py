@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Factorial por árbol de productos (binary splitting) repartido en procesos
+Complemento de ejemplos_modelos_ejecucion.py (Modelo 5: paralelo)
+
+`calcular_factorial` multiplica 1·2·3·…·n en un bucle: cada paso multiplica
+un entero enorme por uno chico, n multiplicaciones sobre números que crecen
+hasta O(n log n) bits → costo ~O(n²).
+
+Con un árbol de productos se multiplican números de tamaño parecido
+(Python usa Karatsuba para enteros grandes), y los subárboles son
+independientes: se pueden calcular en procesos distintos.
+
+                         1..n
+                /                    \\
+           1..n/2                  n/2+1..n        ← hojas en el pool
+          /      \\                /        \\
+       ...        ...          ...         ...
+    Se combinan de a pares hasta obtener n!
+
+Para lotes [n1 < n2 < …] se reutiliza el prefijo común:
+    n2! = n1! · (n1+1)·…·n2
+"""
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# =============================================================================
+# VERSIÓN ORIGINAL (bucle)
+# =============================================================================
+def calcular_factorial(n):
+    """
+    Calcula factorial (CPU-bound).
+    Ideal para ProcessPoolExecutor porque requiere cómputo intensivo.
+    """
+    resultado = 1
+    for i in range(1, n + 1):
+        resultado *= i
+    return resultado
+
+
+# =============================================================================
+# ÁRBOL DE PRODUCTOS (un proceso)
+# =============================================================================
+def producto_rango(a, b):
+    """Producto de los enteros en [a, b) por división binaria."""
+    if b - a <= 8:
+        resultado = 1
+        for i in range(a, b):
+            resultado *= i
+        return resultado
+    m = (a + b) // 2
+    return producto_rango(a, m) * producto_rango(m, b)
+
+
+def factorial_arbol(n):
+    return producto_rango(1, n + 1)
+
+
+# =============================================================================
+# ÁRBOL DE PRODUCTOS EN PARALELO
+# =============================================================================
+def _multiplicar(a, b):
+    return a * b
+
+
+def _cortes(a, b, partes):
+    """
+    Parte [a, b) en `partes` rangos con un número parecido de bits de producto
+    (log2 del producto ~ suma de log2(i)), no de enteros: los rangos altos son
+    más caros por elemento. Cada corte se busca por bisección sobre sum_log2.
+    """
+    objetivo = sum_log2(a, b) / partes
+    cortes = [a]
+    for k in range(1, partes):
+        lo, hi = cortes[-1], b
+        while lo < hi:
+            m = (lo + hi) // 2
+            if sum_log2(a, m) < k * objetivo:
+                lo = m + 1
+            else:
+                hi = m
+        cortes.append(lo)
+    cortes.append(b)
+    return [(x, y) for x, y in zip(cortes, cortes[1:]) if x < y]
+
+
+def sum_log2(a, b):
+    """log2 de (b-1)!/(a-1)! vía lgamma, sin calcular el producto."""
+    return (math.lgamma(b) - math.lgamma(max(a, 1))) / math.log(2)
+
+
+def combinar_por_pares(executor, productos):
+    """
+    Reduce la lista multiplicando de a pares, un nivel del árbol a la vez.
+    Los niveles bajos se reparten en el pool; el último producto se hace aquí
+    para no enviar dos números enormes a otro proceso y de regreso.
+    """
+    while len(productos) > 2:
+        impar = [productos[-1]] if len(productos) % 2 else []
+        productos = list(executor.map(_multiplicar, productos[0::2], productos[1::2])) + impar
+    return productos[0] * productos[1] if len(productos) == 2 else productos[0]
+
+
+def producto_rango_paralelo(a, b, executor, partes):
+    rangos = _cortes(a, b, partes)
+    if len(rangos) <= 1:
+        return producto_rango(a, b)
+    hojas = list(executor.map(producto_rango, *zip(*rangos)))
+    return combinar_por_pares(executor, hojas)
+
+
+def factorial_paralelo(n, executor, partes=None):
+    """n! con las hojas del árbol repartidas en `partes` rangos (por defecto 2·cores)."""
+    partes = partes or 2 * (os.cpu_count() or 1)
+    return producto_rango_paralelo(1, n + 1, executor, partes)
+
+
+def factoriales_lote(ns, executor, partes=None):
+    """
+    Factoriales de varios n compartiendo prefijos.
+
+    Se ordenan n1 < n2 < … y se calculan en paralelo los segmentos
+    [1, n1], (n1, n2], …; luego un barrido acumulado:
+        n1! = seg1,  n2! = n1! · seg2,  …
+    Retorna dict {n: n!}.
+    """
+    partes = partes or 2 * (os.cpu_count() or 1)
+    ordenados = sorted(set(ns))
+    limites = [0] + ordenados
+    segmentos = []
+    for lo, hi in zip(limites, limites[1:]):
+        # Reparte las partes según el tamaño (en bits) de cada segmento
+        peso = sum_log2(lo + 1, hi + 1) / max(1.0, sum_log2(1, ordenados[-1] + 1))
+        segmentos.append(producto_rango_paralelo(lo + 1, hi + 1, executor, max(1, round(partes * peso))))
+    resultados, acumulado = {}, 1
+    for n, segmento in zip(ordenados, segmentos):
+        acumulado *= segmento
+        resultados[n] = acumulado
+    return resultados
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+def _medir(fn, *args):
+    inicio = time.perf_counter()
+    resultado = fn(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Factorial: bucle vs math.factorial vs árbol paralelo")
+    parser.add_argument("--ns", default="10000,100000,1000000")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-bucle", type=int, default=100_000,
+                        help="n máximo para el bucle original (es ~O(n²))")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print(f"FACTORIAL: BUCLE vs math.factorial vs ÁRBOL ({args.workers} workers)")
+    print("="*70)
+    print(f"{'n':>10} {'bits':>12} {'bucle':>9} {'math':>9} {'árbol':>9} {'árbol ∥':>9} {'∥ vs bucle':>11}")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for n in (int(x) for x in args.ns.split(",")):
+            t_math, esperado = _medir(math.factorial, n)
+            t_arbol, r_arbol = _medir(factorial_arbol, n)
+            t_par, r_par = _medir(factorial_paralelo, n, executor)
+            assert r_arbol == esperado and r_par == esperado
+            if n <= args.max_bucle:
+                t_bucle, r_bucle = _medir(calcular_factorial, n)
+                assert r_bucle == esperado
+                bucle, ganancia = f"{t_bucle:>8.2f}s", f"{t_bucle / t_par:>10.1f}x"
+            else:
+                bucle, ganancia = f"{'—':>9}", f"{'—':>11}"
+            print(f"{n:>10,} {esperado.bit_length():>12,} {bucle} {t_math:>8.2f}s "
+                  f"{t_arbol:>8.2f}s {t_par:>8.2f}s {ganancia}")
+
+        print("\n--- Lote con prefijos comunes (como el demo: 1000, 1001, 1002, 1003) ---")
+        for base in (1000, 100_000):
+            lote = [base, base + 1, base + 2, base + 3]
+            t_ind, individuales = _medir(lambda: list(executor.map(calcular_factorial, lote)))
+            t_lote, r_lote = _medir(factoriales_lote, lote, executor)
+            assert [r_lote[n] for n in lote] == individuales
+            print(f"{str(lote):<40} map(calcular_factorial): {t_ind:>6.2f}s   "
+                  f"factoriales_lote: {t_lote:>6.2f}s")
+
+    print("\n✅ Multiplicar números de tamaño parecido aprovecha Karatsuba")
+    print("✅ Un lote con prefijos comunes calcula el prefijo una sola vez")
+    print("⚠️  El último producto (el más caro) siempre ocurre en un solo proceso")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+I/O de red real contra un servidor HTTP local
+Complemento de ejemplos_modelos_ejecucion.py y de los ejemplos de descarga
+(descargar_url, descargar_async / descargar_thread, tarea_io_*)
+
+Esos ejemplos simulan la red con time.sleep / asyncio.sleep. Una descarga
+real además abre conexiones, escribe y lee sockets y parsea respuestas: todo
+eso cuesta CPU y no aparece en la simulación.
+
+Este archivo levanta un servidor HTTP/1.1 local (en otro proceso) con latencia
+y tamaño de respuesta configurables, y hace las mismas descargas con:
+1. Secuencial:   una conexión keep-alive, una petición a la vez
+2. Hilos:        ThreadPoolExecutor, una conexión keep-alive por hilo
+3. asyncio:      corrutinas con un pool de conexiones compartido
+
+Reporta peticiones/s, percentiles de latencia y tiempo de CPU del cliente.
+"""
+
+import argparse
+import asyncio
+import http.client
+import multiprocessing
+import resource
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# =============================================================================
+# SERVIDOR: HTTP/1.1 mínimo con keep-alive, latencia y tamaño configurables
+# =============================================================================
+async def _atender(reader, writer, latencia, payload):
+    try:
+        while True:
+            linea = await reader.readline()
+            if not linea:
+                break
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # encabezados de la petición: no se usan
+            await asyncio.sleep(latencia)  # "el servidor está pensando"
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/octet-stream\r\n"
+                         b"Content-Length: %d\r\n\r\n" % len(payload))
+            writer.write(payload)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def _servir(puerto, latencia, tam_respuesta, listo):
+    payload = b"x" * tam_respuesta
+    servidor = await asyncio.start_server(
+        lambda r, w: _atender(r, w, latencia, payload),
+        "127.0.0.1", puerto, backlog=16384,
+    )
+    listo.set()
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def _proceso_servidor(puerto, latencia, tam_respuesta, listo):
+    _subir_limite_archivos()
+    asyncio.run(_servir(puerto, latencia, tam_respuesta, listo))
+
+
+def iniciar_servidor(puerto=8765, latencia=0.05, tam_respuesta=1024):
+    """Arranca el servidor en un proceso aparte y espera a que acepte conexiones."""
+    listo = multiprocessing.Event()
+    proceso = multiprocessing.Process(
+        target=_proceso_servidor, args=(puerto, latencia, tam_respuesta, listo), daemon=True
+    )
+    proceso.start()
+    if not listo.wait(timeout=10):
+        proceso.terminate()
+        raise RuntimeError("el servidor local no arrancó")
+    return proceso
+
+
+def _subir_limite_archivos():
+    """Cada conexión es un descriptor de archivo; 10k conexiones exceden el límite típico."""
+    suave, duro = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if suave < duro:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (duro, duro))
+
+
+# =============================================================================
+# CLIENTE 1: SECUENCIAL (una conexión reutilizada)
+# =============================================================================
+def descargar_secuencial(puerto, n):
+    conexion = http.client.HTTPConnection("127.0.0.1", puerto)
+    latencias = []
+    for i in range(n):
+        inicio = time.perf_counter()
+        conexion.request("GET", f"/datos/{i}")
+        conexion.getresponse().read()
+        latencias.append(time.perf_counter() - inicio)
+    conexion.close()
+    return latencias
+
+
+# =============================================================================
+# CLIENTE 2: HILOS (una conexión keep-alive por hilo)
+# =============================================================================
+def descargar_hilos(puerto, n, workers):
+    local = threading.local()
+    conexiones = []
+
+    def descargar_thread(i):
+        conexion = getattr(local, "conexion", None)
+        if conexion is None:
+            conexion = local.conexion = http.client.HTTPConnection("127.0.0.1", puerto)
+            conexiones.append(conexion)
+        inicio = time.perf_counter()
+        conexion.request("GET", f"/datos/{i}")
+        conexion.getresponse().read()
+        return time.perf_counter() - inicio
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencias = list(executor.map(descargar_thread, range(n)))
+    for conexion in conexiones:
+        conexion.close()
+    return latencias
+
+
+# =============================================================================
+# CLIENTE 3: ASYNCIO (pool de conexiones keep-alive compartido)
+# =============================================================================
+class PoolConexiones:
+    """
+    Pool de conexiones HTTP/1.1 keep-alive para asyncio.
+
+    Cada petición toma una conexión libre (o abre una nueva si no se llegó al
+    máximo), la usa y la devuelve. Con más peticiones en vuelo que conexiones,
+    las peticiones esperan turno en la cola del pool.
+    """
+
+    def __init__(self, puerto, maximo):
+        self.puerto = puerto
+        self.maximo = maximo
+        self._libres = asyncio.Queue()
+        self._abiertas = 0
+
+    async def _tomar(self):
+        if self._libres.empty() and self._abiertas < self.maximo:
+            return await self._abrir()
+        conexion = await self._libres.get()
+        if conexion is None:  # cupo de una conexión que falló: abrir otra
+            return await self._abrir()
+        return conexion
+
+    async def _abrir(self):
+        self._abiertas += 1
+        try:
+            return await asyncio.open_connection("127.0.0.1", self.puerto)
+        except BaseException:
+            self._liberar_cupo()
+            raise
+
+    def _liberar_cupo(self):
+        # Una conexión menos; None despierta a quien espera en _libres.get()
+        self._abiertas -= 1
+        self._libres.put_nowait(None)
+
+    async def get(self, ruta):
+        reader, writer = await self._tomar()
+        try:
+            writer.write(f"GET {ruta} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            if not await reader.readline():  # línea de estado
+                raise ConnectionError("el servidor cerró la conexión")
+            largo = 0
+            while (linea := await reader.readline()) not in (b"\r\n", b""):
+                if linea.lower().startswith(b"content-length:"):
+                    largo = int(linea.split(b":", 1)[1])
+            cuerpo = await reader.readexactly(largo)
+        except BaseException:
+            # conexión en estado desconocido: no se reutiliza
+            writer.close()
+            self._liberar_cupo()
+            raise
+        self._libres.put_nowait((reader, writer))
+        return cuerpo
+
+    async def cerrar(self):
+        while not self._libres.empty():
+            conexion = self._libres.get_nowait()
+            if conexion is not None:
+                conexion[1].close()
+
+
+async def descargar_async(pool, i):
+    inicio = time.perf_counter()
+    await pool.get(f"/datos/{i}")
+    return time.perf_counter() - inicio
+
+
+async def _descargar_todo_async(puerto, n, concurrencia, max_conexiones):
+    pool = PoolConexiones(puerto, min(concurrencia, max_conexiones))
+    limite = asyncio.Semaphore(concurrencia)
+
+    async def con_limite(i):
+        async with limite:
+            return await descargar_async(pool, i)
+
+    latencias = await asyncio.gather(*[con_limite(i) for i in range(n)])
+    await pool.cerrar()
+    return latencias
+
+
+def descargar_asyncio(puerto, n, concurrencia, max_conexiones):
+    return asyncio.run(_descargar_todo_async(puerto, n, concurrencia, max_conexiones))
+
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+def percentil(ordenados, p):
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+def medir(fn, *args):
+    """
+    Retorna peticiones/s, p50/p99 (ms) y segundos de CPU del cliente.
+
+    La latencia va desde que la petición se emite (hilo libre o lugar en el
+    semáforo) hasta leer la respuesta completa; en asyncio incluye la espera
+    por una conexión libre cuando hay más peticiones en vuelo que conexiones.
+    """
+    cpu0, inicio = time.process_time(), time.perf_counter()
+    latencias = fn(*args)
+    pared, cpu = time.perf_counter() - inicio, time.process_time() - cpu0
+    ordenadas = sorted(latencias)
+    return {
+        "peticiones": len(latencias),
+        "rps": len(latencias) / pared,
+        "p50_ms": percentil(ordenadas, 50) * 1000,
+        "p99_ms": percentil(ordenadas, 99) * 1000,
+        "cpu_s": cpu,
+        "cpu_us_por_peticion": cpu / len(latencias) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Descargas reales contra un servidor HTTP local")
+    parser.add_argument("--latencia", type=float, default=0.05, help="Latencia del servidor (s)")
+    parser.add_argument("--tam-respuesta", type=int, default=1024, help="Bytes por respuesta")
+    parser.add_argument("--concurrencias", default="10,1000,10000")
+    parser.add_argument("--max-hilos", type=int, default=256,
+                        help="Tope de hilos (miles de hilos agotan memoria y planificador)")
+    parser.add_argument("--max-conexiones", type=int, default=1000,
+                        help="Tope del pool de conexiones de asyncio")
+    parser.add_argument("--puerto", type=int, default=8765)
+    args = parser.parse_args()
+
+    _subir_limite_archivos()
+    servidor = iniciar_servidor(args.puerto, args.latencia, args.tam_respuesta)
+
+    print("\n" + "="*70)
+    print("I/O DE RED REAL: SECUENCIAL vs HILOS vs ASYNCIO")
+    print("="*70)
+    print(f"Servidor local :{args.puerto}, latencia {args.latencia * 1000:.0f}ms, "
+          f"respuesta {args.tam_respuesta} bytes")
+    print(f"{'concurrencia':>12} {'modelo':<11} {'peticiones':>10} {'pet/s':>9} "
+          f"{'p50':>9} {'p99':>9} {'CPU':>7} {'µs CPU/pet':>11}")
+
+    try:
+        for concurrencia in (int(c) for c in args.concurrencias.split(",")):
+            n = max(200, 2 * concurrencia)
+            hilos = min(concurrencia, args.max_hilos)
+            filas = [
+                # Secuencial no depende de la concurrencia: pocas peticiones bastan
+                ("secuencial", medir(descargar_secuencial, args.puerto, min(n, 50))),
+                (f"hilos({hilos})", medir(descargar_hilos, args.puerto, n, hilos)),
+                ("asyncio", medir(descargar_asyncio, args.puerto, n, concurrencia,
+                                  args.max_conexiones)),
+            ]
+            for nombre, m in filas:
+                print(f"{concurrencia:>12} {nombre:<11} {m['peticiones']:>10} {m['rps']:>9.0f} "
+                      f"{m['p50_ms']:>7.1f}ms {m['p99_ms']:>7.1f}ms {m['cpu_s']:>6.2f}s "
+                      f"{m['cpu_us_por_peticion']:>11.0f}")
+    finally:
+        servidor.terminate()
+        servidor.join()
+
+    print("\n✅ Con la red real cada petición cuesta CPU (sockets + parseo): ver µs CPU/pet")
+    print("✅ asyncio escala a miles de peticiones en vuelo con un solo hilo")
+    print("⚠️  Los hilos se topan con --max-hilos; más peticiones esperan en la cola del pool")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
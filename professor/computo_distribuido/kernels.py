@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Registro de kernels CPU-bound para los modelos de ejecución
+Usado por ejemplos_modelos_ejecucion.py (Modelos 3 y 5, demo GIL)
+
+Los ejemplos usan siempre sum(range(n)) como "trabajo de CPU". Aquí el
+mismo cálculo (0 + 1 + … + n-1) tiene tres implementaciones:
+
+- "python":         sum(range(n)), un objeto int por elemento, con el GIL tomado
+- "numpy":          np.arange(n).sum(), vectorizado; crea un arreglo de 8·n bytes
+- "numpy_bloques":  arange + sum por bloques de BLOQUE elementos: memoria
+                    acotada y cada bloque cabe en caché L2
+
+Todas retornan el mismo entero. Los modelos reciben el NOMBRE del kernel
+(no la función) para que viaje barato a los procesos hijos.
+
+Con "python", los hilos no dan paralelismo (GIL). Las reducciones de NumPy
+sueltan el GIL durante el bucle en C, así que con "numpy" los hilos sí
+pueden usar varios cores y los procesos dejan de ser la única opción.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+BLOQUE = 1 << 16  # 64K int64 = 512 KB
+
+
+# =============================================================================
+# KERNELS
+# =============================================================================
+def suma_python(n):
+    return sum(range(n))
+
+
+def suma_numpy(n):
+    return int(np.arange(n, dtype=np.int64).sum())
+
+
+def suma_numpy_bloques(n, bloque=BLOQUE):
+    total = 0
+    for inicio in range(0, n, bloque):
+        total += int(np.arange(inicio, min(inicio + bloque, n), dtype=np.int64).sum())
+    return total
+
+
+KERNELS = {
+    "python": suma_python,
+    "numpy": suma_numpy,
+    "numpy_bloques": suma_numpy_bloques,
+}
+
+
+def obtener(nombre):
+    """Kernel registrado con ese nombre."""
+    try:
+        return KERNELS[nombre]
+    except KeyError:
+        raise ValueError(f"kernel desconocido: {nombre} (opciones: {list(KERNELS)})") from None
+
+
+def ejecutar(nombre, n):
+    """obtener(nombre)(n); a nivel módulo para poder enviarse a otros procesos."""
+    return obtener(nombre)(n)
+
+
+# =============================================================================
+# BENCHMARK: kernel × modelo
+# =============================================================================
+def medir(kernel, modelo, tareas, workers):
+    """Segundos para correr el kernel sobre `tareas` en serie, hilos o procesos."""
+    inicio = time.perf_counter()
+    if modelo == "serie":
+        resultados = [ejecutar(kernel, n) for n in tareas]
+    else:
+        Executor = ThreadPoolExecutor if modelo == "hilos" else ProcessPoolExecutor
+        with Executor(max_workers=workers) as executor:
+            resultados = list(executor.map(ejecutar, [kernel] * len(tareas), tareas))
+    transcurrido = time.perf_counter() - inicio
+    assert resultados == [n * (n - 1) // 2 for n in tareas], (kernel, modelo)
+    return transcurrido
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kernels CPU-bound: vectorización vs paralelismo")
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    tareas = [args.n] * args.workers
+    print("\n" + "="*70)
+    print(f"KERNELS × MODELOS ({args.workers} tareas de n={args.n:,}, {args.workers} workers)")
+    print("="*70)
+    print(f"{'kernel':<15} {'serie':>8} {'hilos':>8} {'procesos':>9} "
+          f"{'vs python':>10} {'hilos ⚡':>8} {'procesos ⚡':>11}")
+
+    base = None
+    for kernel in KERNELS:
+        t = {modelo: medir(kernel, modelo, tareas, args.workers) for modelo in ("serie", "hilos", "procesos")}
+        base = base or t["serie"]
+        print(f"{kernel:<15} {t['serie']:>7.2f}s {t['hilos']:>7.2f}s {t['procesos']:>8.2f}s "
+              f"{base / t['serie']:>9.1f}x {t['serie'] / t['hilos']:>7.2f}x {t['serie'] / t['procesos']:>10.2f}x")
+
+    print("\n✅ Vectorizar suele ganar más que paralelizar el bucle de Python")
+    print("✅ Con NumPy los hilos pueden escalar: la reducción corre sin el GIL")
+    print("⚠️  'numpy' reserva 8·n bytes por tarea; 'numpy_bloques' mantiene la memoria acotada")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Transporte de arreglos NumPy a procesos vía memoria compartida
+Complemento de ejemplos_modelos_ejecucion.py (Modelo 5: paralelo)
+
+Con ProcessPoolExecutor cada argumento y cada resultado se serializan con
+pickle y viajan por un pipe: un arreglo de 1 GB se copia al serializar, al
+pasar por el pipe y al deserializar, de ida y de vuelta.
+
+Aquí los arreglos viven en segmentos de multiprocessing.shared_memory y a los
+workers solo se les envía un descriptor (nombre, shape, dtype, offset).
+El worker mapea el mismo segmento y lee/escribe sin copiar.
+
+    Pickle:            padre --(copia)--> pipe --(copia)--> worker
+    Memoria compartida: padre --(descriptor)--> worker   (mismos bytes)
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+# Lo único que viaja al worker: ~100 bytes sin importar el tamaño del arreglo
+Descriptor = namedtuple("Descriptor", ["nombre", "shape", "dtype", "offset"])
+
+ALINEACION = 64  # bytes; una línea de caché
+
+
+def _alinear(n):
+    return (n + ALINEACION - 1) // ALINEACION * ALINEACION
+
+
+# =============================================================================
+# LADO DEL PADRE: crear segmentos y limpiarlos
+# =============================================================================
+class ArenaCompartida:
+    """
+    Administra los segmentos de memoria compartida de una ejecución.
+
+    Uso:
+        with ArenaCompartida() as arena:
+            d_in = arena.poner(arreglo)              # copia única al segmento
+            d_out = arena.reservar(shape, dtype)     # salida sin inicializar
+            executor.submit(trabajo, d_in, d_out)
+            resultado = arena.leer(d_out).copy()
+        # al salir: close() + unlink() de todos los segmentos
+
+    Cada arreglo usa su propio segmento; el offset permite además enviar
+    rebanadas del mismo segmento a distintos workers (ver rebanar()).
+    """
+
+    def __init__(self):
+        self._segmentos = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.liberar()
+        return False
+
+    def reservar(self, shape, dtype):
+        """Crea un segmento para un arreglo de salida y retorna su descriptor."""
+        dtype = np.dtype(dtype)
+        shape = tuple(int(s) for s in np.atleast_1d(shape))
+        nbytes = _alinear(max(1, int(np.prod(shape)) * dtype.itemsize))
+        shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._segmentos[shm.name] = shm
+        return Descriptor(shm.name, shape, dtype.str, 0)
+
+    def poner(self, arreglo):
+        """Copia `arreglo` a un segmento nuevo (la única copia del camino)."""
+        d = self.reservar(arreglo.shape, arreglo.dtype)
+        self.leer(d)[...] = arreglo
+        return d
+
+    def leer(self, descriptor):
+        """Vista NumPy (sin copia) sobre un segmento creado por esta arena."""
+        shm = self._segmentos[descriptor.nombre]
+        return _vista(shm, descriptor)
+
+    def liberar(self):
+        """Cierra y destruye todos los segmentos. Las vistas dejan de ser válidas."""
+        for shm in self._segmentos.values():
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._segmentos.clear()
+
+
+def rebanar(descriptor, inicio, fin):
+    """Descriptor de las filas [inicio, fin) sin tocar los datos."""
+    fila = int(np.prod(descriptor.shape[1:], dtype=np.int64)) * np.dtype(descriptor.dtype).itemsize
+    return Descriptor(
+        descriptor.nombre,
+        (fin - inicio,) + tuple(descriptor.shape[1:]),
+        descriptor.dtype,
+        descriptor.offset + inicio * fila,
+    )
+
+
+def _vista(shm, descriptor):
+    return np.ndarray(
+        descriptor.shape,
+        dtype=np.dtype(descriptor.dtype),
+        buffer=shm.buf,
+        offset=descriptor.offset,
+    )
+
+
+# =============================================================================
+# LADO DEL WORKER: mapear segmentos por nombre
+# =============================================================================
+@contextmanager
+def adjuntar(*descriptores):
+    """
+    Vistas NumPy sobre los segmentos de `descriptores`, desde un worker.
+
+        with adjuntar(d_in, d_out) as (entrada, salida):
+            ...
+
+    Al salir se cierra el mapeo del worker (no se destruye el segmento):
+    las vistas no deben usarse fuera del with.
+    Los segmentos no se registran en el resource_tracker: el dueño (la arena
+    del padre) es el único que hace unlink; si el worker los registrara, el
+    tracker los destruiría o avisaría de "leaks" al terminar el worker.
+    """
+    segmentos = [_abrir_sin_registro(d.nombre) for d in descriptores]
+    vistas = [_vista(shm, d) for shm, d in zip(segmentos, descriptores)]
+    try:
+        yield vistas
+    finally:
+        for shm in segmentos:
+            shm.close()
+
+
+def _abrir_sin_registro(nombre):
+    try:
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    except TypeError:  # Python < 3.13 no tiene track=
+        shm = shared_memory.SharedMemory(name=nombre)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+# =============================================================================
+# TRABAJOS (a nivel módulo para poder enviarse a otros procesos)
+# =============================================================================
+def escalar_pickle(arreglo, factor):
+    """Versión con pickle: el arreglo llega copiado y el resultado vuelve copiado."""
+    return arreglo * factor
+
+
+def escalar_compartido(d_entrada, d_salida, factor):
+    """Versión con memoria compartida: lee y escribe directamente en los segmentos."""
+    with adjuntar(d_entrada, d_salida) as (entrada, salida):
+        np.multiply(entrada, factor, out=salida)
+    return d_salida.shape[0]
+
+
+# =============================================================================
+# BENCHMARK: pickle vs memoria compartida
+# =============================================================================
+def _partes(n, workers):
+    paso = -(-n // workers)
+    return [(i, min(i + paso, n)) for i in range(0, n, paso)]
+
+
+def medir_pickle(arreglo, factor, executor, workers):
+    inicio = time.perf_counter()
+    trozos = [arreglo[i:j] for i, j in _partes(len(arreglo), workers)]
+    resultado = np.concatenate(list(executor.map(escalar_pickle, trozos, [factor] * len(trozos))))
+    return time.perf_counter() - inicio, resultado
+
+
+def medir_compartido(arreglo, factor, executor, workers):
+    inicio = time.perf_counter()
+    with ArenaCompartida() as arena:
+        d_in = arena.poner(arreglo)
+        d_out = arena.reservar(arreglo.shape, arreglo.dtype)
+        partes = _partes(len(arreglo), workers)
+        list(executor.map(
+            escalar_compartido,
+            [rebanar(d_in, i, j) for i, j in partes],
+            [rebanar(d_out, i, j) for i, j in partes],
+            [factor] * len(partes),
+        ))
+        resultado = arena.leer(d_out).copy()
+    return time.perf_counter() - inicio, resultado
+
+
+def _tamano_en_bytes(texto):
+    unidades = {"KB": 2**10, "MB": 2**20, "GB": 2**30}
+    texto = texto.strip().upper()
+    for sufijo, mult in unidades.items():
+        if texto.endswith(sufijo):
+            return int(float(texto[:-2]) * mult)
+    return int(texto)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pickle vs memoria compartida para arreglos NumPy")
+    parser.add_argument("--tamanos", default="1MB,100MB,1GB", help="Tamaños separados por coma")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("TRANSPORTE DE ARREGLOS: PICKLE vs MEMORIA COMPARTIDA")
+    print("="*70)
+    print(f"Workers: {args.workers}")
+    print(f"{'tamaño':>8} {'pickle':>10} {'compartida':>12} {'speedup':>8} {'GB/s shm':>9}")
+
+    factor = 2.0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for texto in args.tamanos.split(","):
+            nbytes = _tamano_en_bytes(texto)
+            arreglo = np.random.default_rng(0).random(nbytes // 8)
+
+            t_pickle, t_shm = float("inf"), float("inf")
+            for _ in range(args.repeticiones):
+                t, r_pickle = medir_pickle(arreglo, factor, executor, args.workers)
+                t_pickle = min(t_pickle, t)
+                del r_pickle
+                t, r_shm = medir_compartido(arreglo, factor, executor, args.workers)
+                t_shm = min(t_shm, t)
+            assert np.array_equal(r_shm, arreglo * factor)
+            del r_shm, arreglo
+
+            print(f"{texto.strip():>8} {t_pickle:>9.3f}s {t_shm:>11.3f}s "
+                  f"{t_pickle / t_shm:>7.2f}x {nbytes / t_shm / 1e9:>9.2f}")
+
+    print("\n✅ Descriptores de ~100 bytes en lugar de copias del arreglo completo")
+    print("⚠️  La arena debe vivir hasta que los workers terminen de usar los segmentos")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
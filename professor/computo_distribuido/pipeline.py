@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Paralelismo por etapas (pipeline): productor → transformación → destino
+Complemento de ejemplos_modelos_ejecucion.py
+
+Los modelos 1–5 paralelizan tareas independientes. Un ETL real está
+organizado en etapas: mientras la etapa 2 transforma el lote k, la etapa 1
+ya produce el lote k+1 y la etapa 3 escribe el lote k-1.
+
+    productor ──[cola acotada]──> transformar (N workers) ──[cola acotada]──> destino
+
+- Colas acotadas: si una etapa es lenta su cola de entrada se llena y la
+  etapa anterior se bloquea en put() (backpressure); la memoria no crece.
+- Lotes: los elementos viajan en listas de `lote` elementos para amortizar
+  el costo de cada put/get (importante entre procesos).
+- Apagado con centinelas: cuando todos los workers de una etapa terminan, se
+  envía un None por cada worker de la etapa siguiente.
+- Errores: si fn (o la fuente) lanza una excepción, el worker la guarda en su
+  reporte y activa una bandera de cancelación compartida. Desde ahí todas las
+  etapas dejan de procesar pero siguen vaciando su cola de entrada hasta el
+  centinela, para que ningún put() quede bloqueado; al final
+  ejecutar_pipeline relanza la primera excepción. Con "procesos", un worker
+  que muere sin reportar (OOM, segfault) se detecta revisando exitcode cada
+  PLAZO_REVISION s: se terminan los demás y se lanza RuntimeError.
+
+Backends: "hilos" (queue.Queue), "procesos" (multiprocessing.Queue) y
+"asyncio" (asyncio.Queue). Para cada etapa se reporta throughput, tiempo
+ocupado, tiempo esperando entrada (hambre) y tiempo bloqueado al enviar
+(backpressure); para cada cola, profundidad promedio y máxima. La etapa
+cuello de botella es la de mayor utilización.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from collections import namedtuple
+from functools import partial
+
+Etapa = namedtuple("Etapa", ["nombre", "fn", "workers"])
+Etapa.__doc__ = """
+Una etapa del pipeline. `fn(x)` transforma un elemento; si retorna None el
+elemento se descarta. En la última etapa (destino) el valor retornado se ignora.
+Con backend "procesos", fn debe estar a nivel módulo.
+"""
+
+_CENTINELA = None
+PLAZO_REVISION = 0.5  # s: cada cuánto se revisa si murió un proceso (backend "procesos")
+
+
+def _stats(nombre):
+    return {"etapa": nombre, "elementos": 0, "ocupado": 0.0, "hambre": 0.0, "bloqueado": 0.0}
+
+
+def _registrar_error(stats, error, cancelado):
+    """Guarda la excepción en el reporte (que viaja entre procesos) y cancela el pipeline."""
+    try:
+        pickle.dumps(error)
+    except Exception:
+        error = RuntimeError(f"{type(error).__name__}: {error}")
+    stats.setdefault("error", error)
+    cancelado.set()
+
+
+# =============================================================================
+# WORKERS SÍNCRONOS (hilos y procesos comparten el mismo código)
+# =============================================================================
+def _enviar(salida, paquete):
+    """put() midiendo cuánto se bloquea por cola llena."""
+    inicio = time.perf_counter()
+    salida.put(paquete)
+    return time.perf_counter() - inicio
+
+
+def _productor(nombre, fuente, salida, lote, reporte, cancelado):
+    stats = _stats(nombre)
+    paquete = []
+    inicio = time.perf_counter()
+    try:
+        for x in fuente():
+            if cancelado.is_set():
+                return
+            paquete.append(x)
+            if len(paquete) >= lote:
+                stats["bloqueado"] += _enviar(salida, paquete)
+                stats["elementos"] += len(paquete)
+                paquete = []
+        if paquete:
+            stats["bloqueado"] += _enviar(salida, paquete)
+            stats["elementos"] += len(paquete)
+    except BaseException as e:
+        _registrar_error(stats, e, cancelado)
+    finally:
+        stats["ocupado"] = time.perf_counter() - inicio - stats["bloqueado"]
+        reporte.put(stats)
+
+
+def _worker_etapa(nombre, fn, entrada, salida, lote, reporte, cancelado):
+    stats = _stats(nombre)
+    pendiente = []
+    try:
+        while True:
+            t0 = time.perf_counter()
+            paquete = entrada.get()
+            t1 = time.perf_counter()
+            stats["hambre"] += t1 - t0
+            if paquete is _CENTINELA:
+                break
+            if cancelado.is_set():
+                continue  # solo vaciar la cola: la etapa anterior no debe quedar bloqueada
+            try:
+                for x in paquete:
+                    y = fn(x)
+                    if y is not None and salida is not None:
+                        pendiente.append(y)
+            except Exception as e:
+                _registrar_error(stats, e, cancelado)
+                continue
+            stats["elementos"] += len(paquete)
+            stats["ocupado"] += time.perf_counter() - t1
+            if len(pendiente) >= lote:
+                stats["bloqueado"] += _enviar(salida, pendiente)
+                pendiente = []
+        if pendiente and not cancelado.is_set():
+            stats["bloqueado"] += _enviar(salida, pendiente)
+    except BaseException as e:
+        _registrar_error(stats, e, cancelado)
+        raise
+    finally:
+        reporte.put(stats)
+
+
+def _monitorear_colas(colas, muestras, detener, intervalo=0.005):
+    """Hilo que muestrea qsize() de cada cola hasta que se active `detener`."""
+    while not detener.is_set():
+        for i, cola in enumerate(colas):
+            try:
+                muestras[i].append(cola.qsize())
+            except NotImplementedError:  # multiprocessing.Queue.qsize en macOS
+                pass
+        time.sleep(intervalo)
+
+
+def _revisar_procesos(grupos, nombres):
+    """
+    RuntimeError si algún proceso terminó con error: un proceso matado (OOM,
+    segfault) no llega a poner su reporte ni a consumir su cola.
+    """
+    for grupo, nombre in zip(grupos, nombres):
+        for p in grupo:
+            if p.exitcode not in (None, 0):
+                raise RuntimeError(f"pipeline: un proceso de la etapa {nombre!r} "
+                                   f"(pid {p.pid}) murió con código {p.exitcode}")
+
+
+def _recibir(reporte, grupos, nombres):
+    """reporte.get() que no espera para siempre si un proceso muere."""
+    while True:
+        try:
+            return reporte.get(timeout=PLAZO_REVISION)
+        except queue.Empty:
+            _revisar_procesos(grupos, nombres)
+
+
+def _poner(cola, x, grupos, nombres):
+    """cola.put(x) que no espera para siempre si el consumidor muere."""
+    while True:
+        try:
+            return cola.put(x, timeout=PLAZO_REVISION)
+        except queue.Full:
+            _revisar_procesos(grupos, nombres)
+
+
+def _ejecutar_sync(fuente, etapas, capacidad, lote, backend):
+    if backend == "hilos":
+        Cola, Trabajador, Evento, reporte = queue.Queue, threading.Thread, threading.Event, queue.Queue()
+    else:
+        Cola, Trabajador, Evento, reporte = (multiprocessing.Queue, multiprocessing.Process,
+                                             multiprocessing.Event, multiprocessing.Queue())
+
+    colas = [Cola(maxsize=capacidad) for _ in etapas]
+    cancelado = Evento()
+    muestras = [[] for _ in colas]
+    detener = threading.Event()
+    monitor = threading.Thread(target=_monitorear_colas, args=(colas, muestras, detener))
+    monitor.start()
+
+    grupos = [[Trabajador(target=_productor, args=("productor", fuente, colas[0], lote, reporte, cancelado))]]
+    for i, etapa in enumerate(etapas):
+        salida = colas[i + 1] if i + 1 < len(etapas) else None
+        grupos.append([
+            Trabajador(target=_worker_etapa,
+                       args=(etapa.nombre, etapa.fn, colas[i], salida, lote, reporte, cancelado))
+            for _ in range(etapa.workers)
+        ])
+
+    # Apagado ordenado: cuando una etapa termina, un centinela por worker de la siguiente
+    nombres = ["productor"] + [e.nombre for e in etapas]
+    stats = []
+    try:
+        for grupo in grupos:
+            for t in grupo:
+                t.start()
+        for i, grupo in enumerate(grupos):
+            if backend == "procesos":
+                # Leer reportes antes de join: un proceso no termina con datos sin vaciar en su cola
+                stats.extend(_recibir(reporte, grupos, nombres) for _ in grupo)
+            for t in grupo:
+                t.join()
+            if i < len(etapas):
+                for _ in range(etapas[i].workers):
+                    if backend == "procesos":
+                        _poner(colas[i], _CENTINELA, grupos, nombres)
+                    else:
+                        colas[i].put(_CENTINELA)
+    except BaseException:
+        if backend == "procesos":
+            # los demás pueden estar bloqueados en colas que ya nadie atiende
+            cancelado.set()
+            for grupo in grupos:
+                for p in grupo:
+                    if p.pid is None:  # no llegó a arrancar
+                        continue
+                    if p.is_alive():
+                        p.terminate()
+                    p.join()
+        raise
+    finally:
+        detener.set()
+        monitor.join()
+    if backend == "hilos":
+        stats = [reporte.get() for _ in range(reporte.qsize())]
+    return stats, muestras
+
+
+# =============================================================================
+# WORKERS ASYNCIO
+# =============================================================================
+async def _aplicar(fn, x):
+    if asyncio.iscoroutinefunction(fn):
+        return await fn(x)
+    return fn(x)  # síncrona: bloquea el event loop mientras corre
+
+
+async def _enviar_async(salida, paquete):
+    inicio = time.perf_counter()
+    await salida.put(paquete)
+    return time.perf_counter() - inicio
+
+
+async def _productor_async(fuente, salida, lote, reporte, cancelado):
+    stats = _stats("productor")
+    paquete = []
+    inicio = time.perf_counter()
+    try:
+        for x in fuente():
+            if cancelado.is_set():
+                return
+            paquete.append(x)
+            if len(paquete) >= lote:
+                stats["bloqueado"] += await _enviar_async(salida, paquete)
+                stats["elementos"] += len(paquete)
+                paquete = []
+        if paquete:
+            stats["bloqueado"] += await _enviar_async(salida, paquete)
+            stats["elementos"] += len(paquete)
+    except Exception as e:
+        _registrar_error(stats, e, cancelado)
+    finally:
+        stats["ocupado"] = time.perf_counter() - inicio - stats["bloqueado"]
+        reporte.append(stats)
+
+
+async def _worker_etapa_async(nombre, fn, entrada, salida, lote, reporte, cancelado):
+    stats = _stats(nombre)
+    pendiente = []
+    try:
+        while True:
+            t0 = time.perf_counter()
+            paquete = await entrada.get()
+            t1 = time.perf_counter()
+            stats["hambre"] += t1 - t0
+            if paquete is _CENTINELA:
+                break
+            if cancelado.is_set():
+                continue  # solo vaciar la cola
+            try:
+                for x in paquete:
+                    y = await _aplicar(fn, x)
+                    if y is not None and salida is not None:
+                        pendiente.append(y)
+            except Exception as e:
+                _registrar_error(stats, e, cancelado)
+                continue
+            stats["elementos"] += len(paquete)
+            stats["ocupado"] += time.perf_counter() - t1
+            if len(pendiente) >= lote:
+                stats["bloqueado"] += await _enviar_async(salida, pendiente)
+                pendiente = []
+        if pendiente and not cancelado.is_set():
+            stats["bloqueado"] += await _enviar_async(salida, pendiente)
+    finally:
+        reporte.append(stats)
+
+
+async def _monitorear_colas_async(colas, muestras, intervalo=0.005):
+    while True:
+        for i, cola in enumerate(colas):
+            muestras[i].append(cola.qsize())
+        await asyncio.sleep(intervalo)
+
+
+async def _ejecutar_async(fuente, etapas, capacidad, lote):
+    colas = [asyncio.Queue(maxsize=capacidad) for _ in etapas]
+    muestras = [[] for _ in colas]
+    reporte = []
+    cancelado = asyncio.Event()
+    monitor = asyncio.create_task(_monitorear_colas_async(colas, muestras))
+
+    grupos = [[asyncio.create_task(_productor_async(fuente, colas[0], lote, reporte, cancelado))]]
+    for i, etapa in enumerate(etapas):
+        salida = colas[i + 1] if i + 1 < len(etapas) else None
+        grupos.append([
+            asyncio.create_task(_worker_etapa_async(etapa.nombre, etapa.fn, colas[i], salida, lote,
+                                                    reporte, cancelado))
+            for _ in range(etapa.workers)
+        ])
+    try:
+        for i, grupo in enumerate(grupos):
+            await asyncio.gather(*grupo)
+            if i < len(etapas):
+                for _ in range(etapas[i].workers):
+                    await colas[i].put(_CENTINELA)
+    finally:
+        monitor.cancel()
+    return reporte, muestras
+
+
+# =============================================================================
+# API
+# =============================================================================
+def ejecutar_pipeline(fuente, etapas, backend="hilos", capacidad=8, lote=1):
+    """
+    Corre fuente() → etapas[0] → ... → etapas[-1] y retorna métricas.
+
+    fuente:    callable sin argumentos que retorna un iterable
+               (a nivel módulo o functools.partial para backend "procesos")
+    etapas:    lista de Etapa(nombre, fn, workers)
+    capacidad: paquetes máximos en cada cola (backpressure)
+    lote:      elementos por paquete entre etapas
+
+    Si la fuente o la fn de alguna etapa lanza una excepción, el pipeline se
+    cancela ordenadamente y se relanza la primera excepción.
+    """
+    inicio = time.perf_counter()
+    if backend == "asyncio":
+        stats, muestras = asyncio.run(_ejecutar_async(fuente, etapas, capacidad, lote))
+    elif backend in ("hilos", "procesos"):
+        stats, muestras = _ejecutar_sync(fuente, etapas, capacidad, lote, backend)
+    else:
+        raise ValueError(f"backend desconocido: {backend}")
+    errores = [s.pop("error") for s in stats if "error" in s]
+    if errores:
+        raise errores[0]
+    pared = time.perf_counter() - inicio
+    return resumir(stats, muestras, etapas, pared)
+
+
+def resumir(stats, muestras, etapas, pared):
+    """Agrega las estadísticas por worker a estadísticas por etapa y por cola."""
+    workers = {"productor": 1, **{e.nombre: e.workers for e in etapas}}
+    por_etapa = {}
+    for s in stats:
+        agg = por_etapa.setdefault(s["etapa"], {"elementos": 0, "ocupado": 0.0, "hambre": 0.0, "bloqueado": 0.0})
+        for clave in agg:
+            agg[clave] += s[clave]
+    for nombre, agg in por_etapa.items():
+        agg["workers"] = workers[nombre]
+        agg["throughput"] = agg["elementos"] / pared
+        agg["utilizacion"] = agg["ocupado"] / (pared * workers[nombre])
+    colas = [
+        {"antes_de": e.nombre,
+         "promedio": sum(m) / len(m) if m else 0.0,
+         "maximo": max(m) if m else 0}
+        for e, m in zip(etapas, muestras)
+    ]
+    cuello = max(por_etapa, key=lambda n: por_etapa[n]["utilizacion"])
+    return {"pared": pared, "etapas": por_etapa, "colas": colas, "cuello_de_botella": cuello}
+
+
+# =============================================================================
+# DEMO: ETL simulado (a nivel módulo para el backend de procesos)
+# =============================================================================
+def generar_registros(n):
+    for i in range(n):
+        yield {"id": i, "texto": f"registro-{i}"}
+
+
+def transformar(registro, costo=20_000):
+    """CPU-bound: 'parsear' el registro."""
+    registro["valor"] = sum(range(costo)) + registro["id"]
+    return registro
+
+
+def escribir(registro):
+    """Destino tipo I/O: cada escritura espera (como un INSERT remoto)."""
+    time.sleep(0.0002)
+
+
+async def escribir_async(registro):
+    await asyncio.sleep(0.0002)
+
+
+def imprimir_resumen(titulo, m):
+    print(f"\n--- {titulo}: {m['pared']:.2f}s, cuello de botella: {m['cuello_de_botella']} ---")
+    print(f"{'etapa':<12} {'workers':>7} {'elem/s':>9} {'utiliz.':>8} {'hambre':>8} {'bloqueado':>10}")
+    for nombre, e in m["etapas"].items():
+        print(f"{nombre:<12} {e['workers']:>7} {e['throughput']:>9,.0f} {e['utilizacion']:>7.0%} "
+              f"{e['hambre']:>7.2f}s {e['bloqueado']:>9.2f}s")
+    for c in m["colas"]:
+        print(f"  cola → {c['antes_de']:<12} profundidad promedio {c['promedio']:>5.1f}, máx {c['maximo']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline por etapas con colas acotadas")
+    parser.add_argument("--n", type=int, default=5_000, help="Registros a procesar")
+    parser.add_argument("--capacidad", type=int, default=8, help="Paquetes por cola")
+    args = parser.parse_args()
+
+    fuente = partial(generar_registros, args.n)
+
+    print("\n" + "="*70)
+    print("PIPELINE: productor → transformar → escribir")
+    print("="*70)
+
+    configuraciones = [
+        ("hilos, 1 transformador, lote 1", "hilos", 1, 1, escribir),
+        ("hilos, 1 transformador, lote 64", "hilos", 1, 64, escribir),
+        ("procesos, 1 transformador, lote 64", "procesos", 1, 64, escribir),
+        ("procesos, 4 transformadores, lote 64", "procesos", 4, 64, escribir),
+        ("asyncio, lote 64", "asyncio", 1, 64, escribir_async),
+    ]
+    for titulo, backend, n_transf, lote, destino in configuraciones:
+        etapas = [
+            Etapa("transformar", transformar, n_transf),
+            Etapa("escribir", destino, 2),
+        ]
+        m = ejecutar_pipeline(fuente, etapas, backend=backend, capacidad=args.capacidad, lote=lote)
+        imprimir_resumen(titulo, m)
+
+    print("\n✅ Cuello de botella = etapa con mayor utilización y cola llena delante")
+    print("✅ Lotes más grandes → menos costo por put/get (sobre todo entre procesos)")
+    print("⚠️  Etapa CPU-bound con hilos: el GIL impide escalar; usar procesos")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
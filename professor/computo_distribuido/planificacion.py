@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Planificación de tareas heterogéneas en un pool de procesos
+Complemento de ejemplos_modelos_ejecucion.py (Modelo 5: paralelo)
+
+En modelo_5_paralelo las tareas tienen costos distintos (Papas 8M,
+Zanahorias 6M, Cebollas 5M) y executor.map las reparte en el orden en que
+llegan: el makespan (tiempo hasta que termina la última) depende de la suerte.
+
+Este archivo compara cuatro estrategias de reparto:
+1. Estático:    bloques fijos por worker (map con chunksize grande)
+2. LPT:         "longest processing time first", ordena por costo estimado
+3. Dinámico:    submit + as_completed, cada worker toma la siguiente tarea libre
+4. División:    parte los rangos grandes en sub-rangos para que los workers
+                libres "roben" trabajo de las tareas grandes
+
+Para cada estrategia reporta makespan y tiempo ocioso de los workers.
+"""
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+# =============================================================================
+# TRABAJO (debe estar a nivel módulo para poder enviarse a otros procesos)
+# =============================================================================
+def sumar_rango(nombre, inicio, fin):
+    """
+    Trabajo CPU-bound: suma de inicio..fin-1.
+    Retorna también PID y marcas de tiempo para medir ocupación por worker.
+    """
+    t_inicio = time.time()
+    resultado = sum(range(inicio, fin))
+    t_fin = time.time()
+    return nombre, os.getpid(), t_inicio, t_fin, resultado
+
+
+def sumar_bloque(bloque):
+    """Ejecuta una lista de tareas en el mismo worker (reparto estático)."""
+    return [sumar_rango(*tarea) for tarea in bloque]
+
+
+def _calentar(segundos):
+    """Tarea vacía para que el pool arranque todos sus procesos antes de medir."""
+    time.sleep(segundos)
+    return os.getpid()
+
+
+# =============================================================================
+# ESTRATEGIAS DE REPARTO
+# Cada estrategia recibe un executor ya caliente y una lista de tareas
+# (nombre, inicio, fin); retorna la lista de registros de sumar_rango.
+# =============================================================================
+def estrategia_estatica(executor, tareas, workers):
+    """
+    Reparto estático: la lista se corta en `workers` bloques contiguos
+    y cada bloque lo ejecuta un solo worker. Es lo que hace map con
+    chunksize = ceil(n / workers); si las tareas caras caen en el mismo
+    bloque, un worker termina mucho después que los demás.
+    """
+    tam = math.ceil(len(tareas) / workers)
+    bloques = [tareas[i:i + tam] for i in range(0, len(tareas), tam)]
+    registros = []
+    for parcial in executor.map(sumar_bloque, bloques):
+        registros.extend(parcial)
+    return registros
+
+
+def estrategia_lpt(executor, tareas, workers):
+    """
+    LPT (longest processing time first): ordena por costo estimado
+    descendente y envía una tarea a la vez. Las grandes arrancan primero
+    y las chicas rellenan los huecos al final.
+    """
+    ordenadas = sorted(tareas, key=costo_estimado, reverse=True)
+    return list(executor.map(_sumar_tupla, ordenadas, chunksize=1))
+
+
+def estrategia_dinamica(executor, tareas, workers):
+    """
+    Reparto dinámico: submit de todas las tareas en el orden original
+    y recolección con as_completed. Cada worker libre toma la siguiente
+    tarea pendiente, sin usar las pistas de costo.
+    """
+    futuros = [executor.submit(sumar_rango, *t) for t in tareas]
+    return [f.result() for f in as_completed(futuros)]
+
+
+def estrategia_division(executor, tareas, workers, partes_por_worker=4):
+    """
+    División en sub-rangos (aproximación a work stealing): las tareas cuyo
+    costo supera el costo total / (workers * partes_por_worker) se parten en
+    pedazos de ese tamaño. Todos los pedazos van a la cola común, así que un
+    worker que se queda sin trabajo toma pedazos de las tareas grandes.
+    """
+    total = sum(costo_estimado(t) for t in tareas)
+    tam_max = max(1, total // (workers * partes_por_worker))
+    pedazos = []
+    for tarea in sorted(tareas, key=costo_estimado, reverse=True):
+        pedazos.extend(dividir_rango(tarea, tam_max))
+    futuros = [executor.submit(sumar_rango, *p) for p in pedazos]
+    return [f.result() for f in as_completed(futuros)]
+
+
+ESTRATEGIAS = {
+    "estatica": estrategia_estatica,
+    "lpt": estrategia_lpt,
+    "dinamica": estrategia_dinamica,
+    "division": estrategia_division,
+}
+
+
+def _sumar_tupla(tarea):
+    return sumar_rango(*tarea)
+
+
+def costo_estimado(tarea):
+    """Pista de costo: tamaño del rango (la suma es lineal en fin - inicio)."""
+    _, inicio, fin = tarea
+    return fin - inicio
+
+
+def dividir_rango(tarea, tam_max):
+    """Parte (nombre, inicio, fin) en sub-rangos de a lo más tam_max elementos."""
+    nombre, inicio, fin = tarea
+    if fin - inicio <= tam_max:
+        return [tarea]
+    return [(nombre, i, min(i + tam_max, fin)) for i in range(inicio, fin, tam_max)]
+
+
+def combinar_resultados(registros):
+    """Suma los resultados parciales de cada tarea (los sub-rangos comparten nombre)."""
+    resultados = {}
+    for nombre, _, _, _, resultado in registros:
+        resultados[nombre] = resultados.get(nombre, 0) + resultado
+    return resultados
+
+
+# =============================================================================
+# MÉTRICAS
+# =============================================================================
+def medir_ocupacion(registros, t0, t1):
+    """
+    Calcula makespan y tiempo ocioso por worker.
+
+    makespan = t1 - t0 (desde el primer envío hasta el último resultado)
+    ocioso(worker) = makespan - tiempo que el worker pasó ejecutando tareas
+    """
+    makespan = t1 - t0
+    ocupado = {}
+    for _, pid, inicio, fin, _ in registros:
+        ocupado[pid] = ocupado.get(pid, 0.0) + (fin - inicio)
+    ocioso = {pid: max(0.0, makespan - t) for pid, t in ocupado.items()}
+    return makespan, ocupado, ocioso
+
+
+def ejecutar_estrategia(nombre, tareas, workers):
+    """Ejecuta una estrategia con un pool precalentado y retorna sus métricas."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_calentar, [0.05] * workers))
+
+        t0 = time.time()
+        registros = ESTRATEGIAS[nombre](executor, tareas, workers)
+        t1 = time.time()
+
+    makespan, ocupado, ocioso = medir_ocupacion(registros, t0, t1)
+    # Workers que nunca recibieron trabajo estuvieron ociosos todo el makespan
+    ociosos_totales = (workers - len(ocupado)) * makespan
+    return {
+        "makespan": makespan,
+        "ocioso_total": sum(ocioso.values()) + ociosos_totales,
+        "ocioso_max": max(list(ocioso.values()) + ([makespan] if ociosos_totales else [])),
+        "resultados": combinar_resultados(registros),
+    }
+
+
+# =============================================================================
+# CARGAS DE TRABAJO SESGADAS
+# =============================================================================
+def carga_ingredientes():
+    """Las tareas de modelo_5_paralelo, como rangos (nombre, inicio, fin)."""
+    return [
+        ("🥔 Papas", 0, 8_000_000),
+        ("🥕 Zanahorias", 0, 6_000_000),
+        ("🧅 Cebollas", 0, 5_000_000),
+    ]
+
+
+def carga_una_gigante(n_chicas=12, tam_chica=500_000, tam_gigante=12_000_000):
+    """Muchas tareas chicas y una gigante al final: el peor caso para map en orden."""
+    tareas = [(f"chica-{i}", 0, tam_chica) for i in range(n_chicas)]
+    tareas.append(("gigante", 0, tam_gigante))
+    return tareas
+
+
+def carga_pareto(n=24, escala=300_000, alfa=1.2, semilla=42):
+    """Costos con cola pesada (Pareto), en orden aleatorio."""
+    rng = random.Random(semilla)
+    return [(f"pareto-{i}", 0, int(escala * rng.paretovariate(alfa))) for i in range(n)]
+
+
+CARGAS = {
+    "ingredientes": carga_ingredientes,
+    "una_gigante": carga_una_gigante,
+    "pareto": carga_pareto,
+}
+
+
+# =============================================================================
+# MAIN: Comparar estrategias sobre cada carga
+# =============================================================================
+def main():
+    workers = min(3, os.cpu_count() or 1)
+
+    print("\n" + "="*70)
+    print("PLANIFICACIÓN DE TAREAS HETEROGÉNEAS")
+    print("="*70)
+    print(f"Sistema: {os.cpu_count()} cores disponibles, usando {workers} workers")
+
+    for nombre_carga, generar in CARGAS.items():
+        tareas = generar()
+        costos = [costo_estimado(t) for t in tareas]
+        cota = max(max(costos), sum(costos) / workers)
+
+        print(f"\n--- Carga: {nombre_carga} ({len(tareas)} tareas, "
+              f"costo total {sum(costos):,}, cota inferior {cota:,.0f}) ---")
+        print(f"{'estrategia':<12} {'makespan':>10} {'ocioso total':>14} {'ocioso máx':>12}")
+
+        referencia = None
+        for nombre in ESTRATEGIAS:
+            m = ejecutar_estrategia(nombre, tareas, workers)
+            if referencia is None:
+                referencia = m["resultados"]
+            assert m["resultados"] == referencia, f"{nombre}: resultados distintos"
+            print(f"{nombre:<12} {m['makespan']:>9.2f}s {m['ocioso_total']:>13.2f}s "
+                  f"{m['ocioso_max']:>11.2f}s")
+
+    print("\n" + "="*70)
+    print("✅ Costos conocidos          → LPT")
+    print("✅ Costos desconocidos       → dinámico (as_completed)")
+    print("✅ Pocas tareas muy grandes  → dividir en sub-rangos")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Selección automática: serie, ThreadPoolExecutor o ProcessPoolExecutor
+Usado por ejemplos_modelos_ejecucion.py (resumen de decisiones)
+
+El resumen de los ejemplos dice "CPU-bound → procesos, I/O-bound → hilos".
+auto_executor(fn, entradas) toma esa decisión midiendo:
+
+1. Perfil: corre fn en serie sobre una muestra pequeña y mide por llamada
+   - tiempo de pared (perf_counter) y de CPU del hilo (thread_time)
+   - CPU / pared: ~1 = CPU-bound, ~0 = esperando (I/O)
+2. Costo de envío: pickle.dumps de (fn, entrada) y del resultado, que es lo
+   que paga un ProcessPoolExecutor por tarea (si fn no se puede serializar,
+   p. ej. una lambda, los procesos quedan descartados)
+3. Decisión:
+   - poco trabajo total (< MINIMO_PARALELO s)         → serie
+   - CPU-bound, pickle barato y más de un core        → procesos, 1 por core
+   - CPU-bound en otro caso                           → serie
+   - I/O-bound                                        → hilos, cores / (CPU/pared)
+     (cada hilo usa la CPU solo una fracción del tiempo)
+
+Las llamadas de la muestra no se repiten: sus resultados se reutilizan.
+"""
+
+import argparse
+import math
+import os
+import pickle
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+UMBRAL_CPU = 0.5          # CPU/pared a partir de la cual se considera CPU-bound
+MINIMO_PARALELO = 0.05    # s de trabajo total estimado por debajo del cual no conviene un pool
+MAX_PICKLE = 0.1          # costo de pickle máximo como fracción de la llamada
+MAX_HILOS = 64
+
+Decision = namedtuple("Decision", [
+    "modo", "workers", "razon",
+    "cpu_pared", "pared_llamada", "pickle_llamada", "n",
+    "tiempo", "serie", "speedup",
+])
+
+
+# =============================================================================
+# PERFIL
+# =============================================================================
+def _costo_pickle(fn, entrada, resultado):
+    """Segundos para serializar ida y vuelta, o None si no se puede."""
+    inicio = time.perf_counter()
+    try:
+        pickle.dumps((fn, entrada))
+        pickle.dumps(resultado)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None
+    return time.perf_counter() - inicio
+
+
+def perfilar(fn, muestra):
+    """
+    Corre fn sobre cada entrada de la muestra.
+    Retorna (resultados, pared media, CPU/pared, pickle medio o None).
+    """
+    resultados, pared, cpu, pickles = [], 0.0, 0.0, []
+    for x in muestra:
+        p0, c0 = time.perf_counter(), time.thread_time()
+        r = fn(x)
+        cpu += time.thread_time() - c0
+        pared += time.perf_counter() - p0
+        resultados.append(r)
+        pickles.append(_costo_pickle(fn, x, r))
+    n = max(1, len(muestra))
+    costo = None if None in pickles else sum(pickles) / n
+    return resultados, pared / n, (cpu / pared if pared else 1.0), costo
+
+
+def decidir(n, pared_llamada, cpu_pared, pickle_llamada, cores=None):
+    """Retorna (modo, workers, razón) a partir del perfil."""
+    cores = cores or os.cpu_count() or 1
+    if n <= 1 or pared_llamada * n < MINIMO_PARALELO:
+        return "serie", 1, f"poco trabajo ({pared_llamada * n * 1e3:.1f} ms estimados)"
+    if cpu_pared >= UMBRAL_CPU:
+        if pickle_llamada is None:
+            return "serie", 1, "CPU-bound, pero fn o sus datos no se pueden serializar"
+        if pickle_llamada > MAX_PICKLE * pared_llamada:
+            return "serie", 1, f"CPU-bound, pero pickle cuesta {pickle_llamada / pared_llamada:.0%} de la llamada"
+        if cores == 1:
+            return "serie", 1, "CPU-bound con un solo core"
+        return "procesos", min(cores, n), f"CPU-bound (CPU/pared={cpu_pared:.2f})"
+    workers = min(n, MAX_HILOS, math.ceil(cores / max(cpu_pared, 1 / MAX_HILOS)))
+    return "hilos", workers, f"I/O-bound (CPU/pared={cpu_pared:.2f})"
+
+
+# =============================================================================
+# auto_executor
+# =============================================================================
+def auto_executor(fn, entradas, muestra=3, comparar=False):
+    """
+    Aplica fn a cada entrada con la estrategia elegida por el perfil.
+    Retorna (resultados en orden, Decision).
+
+    Decision.speedup compara contra la serie: estimada (pared media de la
+    muestra × n) o, con comparar=True, medida corriendo todo otra vez en serie.
+    """
+    entradas = list(entradas)
+    n = len(entradas)
+    inicio = time.perf_counter()
+    k = min(muestra, n)
+    resultados, pared_llamada, cpu_pared, pickle_llamada = perfilar(fn, entradas[:k])
+    modo, workers, razon = decidir(n, pared_llamada, cpu_pared, pickle_llamada)
+
+    resto = entradas[k:]
+    if modo == "serie":
+        resultados += [fn(x) for x in resto]
+    else:
+        Executor = ProcessPoolExecutor if modo == "procesos" else ThreadPoolExecutor
+        with Executor(max_workers=workers) as executor:
+            resultados += list(executor.map(fn, resto))
+    tiempo = time.perf_counter() - inicio
+
+    serie = pared_llamada * n
+    if comparar:
+        inicio = time.perf_counter()
+        assert [fn(x) for x in entradas] == resultados
+        serie = time.perf_counter() - inicio
+    return resultados, Decision(modo, workers, razon, cpu_pared, pared_llamada, pickle_llamada,
+                                n, tiempo, serie, serie / tiempo if tiempo else 1.0)
+
+
+def reportar(nombre, d):
+    """Una línea de resumen de la decisión."""
+    pickle_txt = f"{d.pickle_llamada * 1e6:.0f}µs" if d.pickle_llamada is not None else "no serializable"
+    return (f"{nombre:<22} → {d.modo:<8} ×{d.workers:<3} {d.razon}; "
+            f"llamada {d.pared_llamada * 1e3:.1f}ms, pickle {pickle_txt}; "
+            f"{d.n} tareas en {d.tiempo:.2f}s vs {d.serie:.2f}s en serie ({d.speedup:.1f}x)")
+
+
+# =============================================================================
+# CARGAS DE EJEMPLO (a nivel módulo para que los procesos las importen)
+# =============================================================================
+def esperar_io(segundos):
+    """I/O simulado: casi nada de CPU."""
+    time.sleep(segundos)
+    return segundos
+
+
+def calcular(n):
+    """CPU-bound: como procesar_ingrediente del Modelo 5."""
+    return sum(range(n))
+
+
+def trivial(x):
+    return x * 2
+
+
+def sumar_lista(datos):
+    """Poco cálculo por byte: enviar la lista cuesta casi lo que procesarla."""
+    return sum(datos)
+
+
+def cargas_demo():
+    return [
+        ("I/O (sleep 50ms)", esperar_io, [0.05] * 40),
+        ("CPU (sum(range))", calcular, [2_000_000] * 8),
+        ("trivial (x*2)", trivial, list(range(1000))),
+        ("datos grandes", sumar_lista, [list(range(200_000))] * 80),
+        ("lambda CPU", lambda n: sum(range(n)), [2_000_000] * 4),
+    ]
+
+
+def demo(comparar=False):
+    """
+    Decide y ejecuta cada carga de ejemplo; imprime una línea por carga.
+    comparar=True corre además cada carga completa en serie para medir el speedup
+    (duplica el tiempo de la demo); si no, la serie se estima con la muestra.
+    """
+    for nombre, fn, entradas in cargas_demo():
+        _, decision = auto_executor(fn, entradas, comparar=comparar)
+        print(reportar(nombre, decision))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="auto_executor: serie, hilos o procesos según el perfil")
+    parser.add_argument("--comparar", action="store_true",
+                        help="Correr cada carga completa en serie para medir el speedup (en vez de estimarlo)")
+    args = parser.parse_args()
+    print("\n" + "="*70)
+    print(f"SELECCIÓN AUTOMÁTICA DE EXECUTOR ({os.cpu_count()} cores)")
+    print("="*70)
+    demo(comparar=args.comparar)
+    print("\n⚠️  El perfil usa pocas llamadas: cargas muy irregulares pueden engañarlo")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
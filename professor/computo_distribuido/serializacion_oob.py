@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Resultados entre procesos con pickle protocolo 5 y buffers fuera de banda
+Complemento de ejemplos_modelos_ejecucion.py (Modelo 5: paralelo)
+y de memoria_compartida.py
+
+Cuando un worker de ProcessPoolExecutor retorna un arreglo grande, el
+resultado se serializa con el protocolo por defecto (4 en Python < 3.14):
+el arreglo se copia a un bytes, ese bytes se copia al flujo de pickle y el
+flujo completo se escribe al pipe. Del otro lado pasa lo mismo al revés.
+
+Con el protocolo 5 (PEP 574) los datos grandes pueden viajar "fuera de
+banda": pickle.dumps(..., buffer_callback=...) entrega un PickleBuffer por
+cada bloque de datos (vistas, sin copia) y el flujo de pickle solo contiene
+la estructura. Aquí cada buffer se escribe directo al socket y del otro lado
+se recibe directo en memoria ya reservada:
+
+    Protocolo 4: arreglo → bytes → flujo pickle → pipe → flujo → bytes → arreglo
+    Protocolo 5: arreglo ─────────────────────→ pipe ──────────────→ arreglo
+                 (solo la cabecera pasa por pickle)
+"""
+
+import argparse
+import io
+import os
+import pickle
+import socket
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+
+from memoria_compartida import _tamano_en_bytes
+
+
+# =============================================================================
+# SERIALIZADOR
+# =============================================================================
+UMBRAL_BYTES = 64 * 1024  # bytes más chicos viajan dentro del flujo
+
+
+class _PicklerOOB(pickle.Pickler):
+    """
+    Pickler de protocolo 5 que además saca de banda los objetos bytes grandes.
+
+    ndarray y bytearray ya entregan PickleBuffer con protocolo 5; bytes no
+    (pickle siempre lo copia al flujo). Aquí se reduce a un PickleBuffer
+    que del otro lado se entrega tal cual: llega como bytearray, sin copia extra.
+    """
+
+    def reducer_override(self, obj):
+        if type(obj) is bytes and len(obj) >= UMBRAL_BYTES:
+            return _identidad, (pickle.PickleBuffer(obj),)
+        return NotImplemented
+
+
+def _identidad(x):
+    return x
+
+
+def serializar(obj):
+    """
+    Retorna (cabecera, buffers).
+
+    cabecera: bytes con la estructura del objeto (pequeño)
+    buffers:  memoryviews de los datos de ndarrays, bytearrays y bytes
+              grandes, sin copiar
+    """
+    buffers = []
+    flujo = io.BytesIO()
+    _PicklerOOB(flujo, protocol=5, buffer_callback=buffers.append).dump(obj)
+    return flujo.getvalue(), [b.raw() for b in buffers]
+
+
+def deserializar(cabecera, buffers):
+    """Reconstruye el objeto usando `buffers` como memoria de los arreglos (sin copia)."""
+    return pickle.loads(cabecera, buffers=buffers)
+
+
+def enviar(conn, obj):
+    """Envía obj por una Connection: cabecera + cada buffer sin copias intermedias."""
+    cabecera, buffers = serializar(obj)
+    conn.send((cabecera, [b.nbytes for b in buffers]))
+    for b in buffers:
+        conn.send_bytes(b)
+
+
+def recibir(conn):
+    """Recibe lo enviado por enviar(); cada buffer se lee directo a su destino."""
+    cabecera, tamanos = conn.recv()
+    buffers = []
+    for nbytes in tamanos:
+        destino = bytearray(nbytes)
+        conn.recv_bytes_into(destino)
+        buffers.append(destino)
+    return deserializar(cabecera, buffers)
+
+
+# =============================================================================
+# USO CON ProcessPoolExecutor
+# El future solo transporta un acuse; el resultado va por un socket local.
+# =============================================================================
+def _ejecutar_y_enviar(direccion, clave, indice, fn, args):
+    resultado = fn(*args)
+    with Client(direccion, authkey=clave) as conn:
+        enviar(conn, (indice, resultado))
+    return indice
+
+
+def _despertar(listener, aceptado):
+    """
+    Desbloquea un accept() pendiente con un socket crudo que se cierra enseguida.
+    No es un Client autenticado: si el accept toma antes la conexión de un worker
+    real, un Client se quedaría esperando su reto de autenticación para siempre.
+    """
+    with socket.socket(socket.AF_UNIX) as s:
+        s.settimeout(1.0)
+        s.connect(listener.address)
+    try:
+        aceptado.result().close()  # la de un worker real, si llegó primero
+    except (OSError, EOFError, AuthenticationError):
+        pass  # tomó el socket crudo: el reto de autenticación falla al cerrarse
+
+
+def _aceptar(listener, hilo, pendientes, limite):
+    """
+    listener.accept() que no espera para siempre: un worker cuya fn lanza una
+    excepción nunca se conecta. Se espera a la vez la conexión y los futures
+    pendientes; si uno falla (o se pasa `limite`) se despierta el accept y se
+    lanza el error.
+    """
+    aceptado = hilo.submit(listener.accept)
+    while True:
+        restante = None if limite is None else max(0.0, limite - time.monotonic())
+        hechos, _ = wait([aceptado, *pendientes], timeout=restante, return_when=FIRST_COMPLETED)
+        if aceptado in hechos:
+            return aceptado.result()
+        fallido = next((f for f in hechos if f.exception() is not None), None)
+        if fallido is not None or restante == 0:
+            _despertar(listener, aceptado)
+            if fallido is not None:
+                raise fallido.exception()
+            raise TimeoutError("map_oob: se agotó el tiempo esperando resultados")
+        # terminaron bien (ya se recibió su resultado): dejar de esperarlos
+        pendientes.difference_update(hechos)
+
+
+def map_oob(executor, fn, *iterables, timeout=None):
+    """
+    Como executor.map(fn, *iterables), pero los resultados regresan por
+    protocolo 5 fuera de banda. Retorna la lista de resultados en orden.
+    Propaga la primera excepción de un worker; timeout (segundos, total)
+    lanza TimeoutError.
+    """
+    argumentos = list(zip(*iterables))
+    clave = os.urandom(16)
+    limite = None if timeout is None else time.monotonic() + timeout
+    with Listener(family="AF_UNIX", authkey=clave) as listener, \
+            ThreadPoolExecutor(max_workers=1) as hilo:
+        futuros = [
+            executor.submit(_ejecutar_y_enviar, listener.address, clave, i, fn, args)
+            for i, args in enumerate(argumentos)
+        ]
+        pendientes = set(futuros)
+        resultados = [None] * len(argumentos)
+        for _ in argumentos:
+            with _aceptar(listener, hilo, pendientes, limite) as conn:
+                indice, resultado = recibir(conn)
+                resultados[indice] = resultado
+        for f in futuros:
+            f.result()  # propaga excepciones del worker
+    return resultados
+
+
+# =============================================================================
+# TRABAJOS (a nivel módulo para poder enviarse a otros procesos)
+# =============================================================================
+def generar_arreglo(nbytes, semilla):
+    """Resultado grande: un arreglo float64 de `nbytes`."""
+    return np.random.default_rng(semilla).random(nbytes // 8)
+
+
+def generar_bytes(nbytes, semilla):
+    """Resultado grande como bytes."""
+    return generar_arreglo(nbytes, semilla).tobytes()
+
+
+# =============================================================================
+# MEDICIONES
+# =============================================================================
+def copias_en_proceso(obj, nbytes, protocolo):
+    """
+    Serializa y deserializa `obj` en el mismo proceso y retorna el pico de
+    memoria adicional medido con tracemalloc, en "copias" del payload.
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    if protocolo == "oob":
+        cabecera, buffers = serializar(obj)
+        copia = deserializar(cabecera, buffers)
+    else:
+        flujo = pickle.dumps(obj, protocol=protocolo)
+        copia = pickle.loads(flujo)
+        del flujo
+    pico = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    del copia
+    return pico / nbytes
+
+
+def medir_executor(executor, nbytes, tareas, modo, fn=generar_arreglo):
+    """Tiempo para traer `tareas` resultados de `nbytes` por el camino indicado."""
+    tamanos = [nbytes] * tareas
+    semillas = list(range(tareas))
+    inicio = time.perf_counter()
+    if modo == "oob":
+        resultados = map_oob(executor, fn, tamanos, semillas)
+    else:
+        resultados = list(executor.map(fn, tamanos, semillas))
+    transcurrido = time.perf_counter() - inicio
+    return transcurrido, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resultados entre procesos con pickle protocolo 5")
+    parser.add_argument("--tamanos", default="1MB,64MB,256MB", help="Tamaño de cada resultado")
+    parser.add_argument("--tareas", type=int, default=4, help="Resultados por medición")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("SERIALIZACIÓN FUERA DE BANDA (pickle protocolo 5)")
+    print("="*70)
+
+    print("\n--- Copias en un mismo proceso (pico de memoria / tamaño del payload) ---")
+    print(f"{'tamaño':>8} {'protocolo 4':>12} {'5 en banda':>11} {'5 fuera de banda':>17}")
+    for texto in args.tamanos.split(","):
+        nbytes = _tamano_en_bytes(texto)
+        arreglo = generar_arreglo(nbytes, 0)
+        c4 = copias_en_proceso(arreglo, nbytes, 4)
+        c5 = copias_en_proceso(arreglo, nbytes, 5)
+        coob = copias_en_proceso(arreglo, nbytes, "oob")
+        print(f"{texto.strip():>8} {c4:>11.2f}x {c5:>10.2f}x {coob:>16.2f}x")
+
+    print(f"\n--- Resultados desde ProcessPoolExecutor ({args.workers} workers, "
+          f"{args.tareas} resultados por medición) ---")
+    print(f"{'tamaño':>8} {'tipo':>8} {'executor.map':>13} {'protocolo 5':>12} {'GB/s map':>9} {'GB/s p5':>8}")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for texto in args.tamanos.split(","):
+            nbytes = _tamano_en_bytes(texto)
+            total = nbytes * args.tareas
+            for tipo, fn in (("ndarray", generar_arreglo), ("bytes", generar_bytes)):
+                t_map, r_map = medir_executor(executor, nbytes, args.tareas, "map", fn)
+                t_oob, r_oob = medir_executor(executor, nbytes, args.tareas, "oob", fn)
+                for a, b in zip(r_map, r_oob):
+                    assert bytes(a) == bytes(b) if tipo == "bytes" else np.array_equal(a, b)
+                del r_map, r_oob
+                print(f"{texto.strip():>8} {tipo:>8} {t_map:>12.3f}s {t_oob:>11.3f}s "
+                      f"{total / t_map / 1e9:>9.2f} {total / t_oob / 1e9:>8.2f}")
+
+    print("\n✅ Fuera de banda: la cabecera pasa por pickle, los datos van directo al socket")
+    print("⚠️  Los bytes grandes llegan como bytearray (sin la copia de vuelta a bytes)")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Registro de tramos (spans) de bajo costo para los modelos de ejecución
+Usado por ejemplos_modelos_ejecucion.py
+
+Imprimir "[HH:MM:SS.mmm] ..." en cada paso tiene dos problemas: el solape
+entre tareas es difícil de ver, y datetime.now().strftime + print cuestan
+decenas de microsegundos que alteran lo que se está midiendo.
+
+Aquí cada tramo guarda solo dos lecturas de time.perf_counter_ns() y una
+tupla en una lista en memoria. Al final se exporta:
+- JSON de Chrome Trace Event (abrir en chrome://tracing o ui.perfetto.dev)
+- un diagrama de Gantt en ASCII
+
+Cada tramo se etiqueta con PID, hilo y tarea de asyncio. Los tramos de
+procesos hijos se registran en el buffer del hijo y regresan al padre junto
+con el resultado (ver map_trazado). perf_counter_ns usa CLOCK_MONOTONIC en
+Linux, que es el mismo reloj para todos los procesos de la máquina.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# (nombre, categoria, inicio_ns, fin_ns, pid, hilo, tarea)
+_tramos = []
+
+
+def _tarea_actual():
+    try:
+        tarea = asyncio.current_task()
+    except RuntimeError:  # no hay event loop en este hilo
+        return None
+    return tarea.get_name() if tarea is not None else None
+
+
+@contextmanager
+def tramo(nombre, categoria="tarea"):
+    """
+    Registra la duración del bloque:
+
+        with tramo("☕ Café"):
+            await asyncio.sleep(1)
+    """
+    inicio = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        fin = time.perf_counter_ns()
+        _tramos.append((nombre, categoria, inicio, fin, os.getpid(),
+                        threading.current_thread().name, _tarea_actual()))
+
+
+def tramos():
+    """Copia de los tramos registrados en este proceso."""
+    return list(_tramos)
+
+
+def limpiar():
+    """Vacía el buffer (p. ej. entre un modelo y el siguiente)."""
+    _tramos.clear()
+
+
+# =============================================================================
+# PROCESOS HIJOS: los tramos viajan de regreso con el resultado
+# =============================================================================
+def ejecutar_trazado(fn, *args):
+    """
+    Corre fn(*args) en un worker y retorna (resultado, tramos del worker).
+    Debe estar a nivel módulo para poder enviarse a otros procesos.
+    """
+    limpiar()  # el worker puede traer tramos de tareas anteriores
+    resultado = fn(*args)
+    return resultado, tramos()
+
+
+def map_trazado(executor, fn, *iterables):
+    """Como executor.map(fn, ...) pero incorpora los tramos de los workers a este proceso."""
+    n = len(iterables[0]) if iterables else 0
+    resultados = []
+    for resultado, hijos in executor.map(ejecutar_trazado, [fn] * n, *iterables):
+        _tramos.extend(hijos)
+        resultados.append(resultado)
+    return resultados
+
+
+# =============================================================================
+# EXPORTACIÓN
+# =============================================================================
+def _carril(t):
+    """Etiqueta de la fila: hilo, o tarea de asyncio si la hay."""
+    _, _, _, _, pid, hilo, tarea = t
+    return pid, tarea or hilo
+
+
+def exportar_chrome(ruta, lista=None):
+    """
+    Escribe los tramos en formato Chrome Trace Event ("ph": "X", tiempos en µs).
+    Cada tarea de asyncio se muestra como un "hilo" propio para que se vea el solape.
+    """
+    lista = tramos() if lista is None else lista
+    if not lista:
+        return
+    origen = min(t[2] for t in lista)
+    carriles = {}
+    eventos = []
+    for t in lista:
+        nombre, categoria, inicio, fin, pid, hilo, tarea = t
+        tid = carriles.setdefault(_carril(t), len(carriles) + 1)
+        eventos.append({
+            "name": nombre, "cat": categoria, "ph": "X",
+            "ts": (inicio - origen) / 1000, "dur": (fin - inicio) / 1000,
+            "pid": pid, "tid": tid,
+            "args": {"hilo": hilo, "tarea": tarea},
+        })
+    for (pid, etiqueta), tid in carriles.items():
+        eventos.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                        "args": {"name": etiqueta}})
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+
+
+def gantt_ascii(lista=None, ancho=60):
+    """
+    Diagrama de Gantt en texto: una fila por tramo, agrupadas por PID y carril.
+
+        PID 123 MainThread  ☕ Café   |████████████                  | 0.00-1.00s
+    """
+    lista = tramos() if lista is None else lista
+    if not lista:
+        return "(sin tramos)"
+    origen = min(t[2] for t in lista)
+    total = max(t[3] for t in lista) - origen or 1
+    ordenados = sorted(lista, key=lambda t: (_carril(t), t[2]))
+    etiquetas = [f"PID {t[4]} {_carril(t)[1]}" for t in ordenados]
+    ancho_etiqueta = max(len(e) for e in etiquetas)
+    ancho_nombre = max(len(t[0]) for t in ordenados)
+
+    lineas = []
+    for etiqueta, t in zip(etiquetas, ordenados):
+        nombre, _, inicio, fin = t[:4]
+        a = int((inicio - origen) / total * ancho)
+        b = max(a + 1, int((fin - origen) / total * ancho))
+        barra = " " * a + "█" * (b - a) + " " * (ancho - b)
+        lineas.append(f"{etiqueta:<{ancho_etiqueta}}  {nombre:<{ancho_nombre}} |{barra}| "
+                      f"{(inicio - origen) / 1e9:.2f}-{(fin - origen) / 1e9:.2f}s")
+    return "\n".join(lineas)
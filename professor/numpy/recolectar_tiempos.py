@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Recolector de resultados de la tarea de tiempos (tarea_tiempos_numpy.ipynb)
+
+Busca students/*/**/tiempos*.json, normaliza los distintos formatos que
+usaron los alumnos a una tabla "tidy" (una fila por problema × estrategia × n
+× archivo) y escribe:
+
+- tiempos_tidy.csv       todas las filas
+- tiempos_tidy.parquet   lo mismo, solo si pyarrow está instalado
+- rollup_maquina.csv     por máquina × problema × estrategia
+- rollup_estrategia.csv  por problema × estrategia (todas las máquinas)
+
+Formatos reconocidos (la clave que los distingue):
+
+- "mediciones" + "schema"   arnés versionado (tiempos_p123/v1)
+- "resultados_por_n"        {n: {p: {estrategia: {"mediana", "p25_s", ...}}}}
+- "results_by_n"            {n: {p: {estrategia: segundos}}}
+- "results" con n arriba    {n: {p: {estrategia: {"s_per_call_median", ...}}}}
+- "results" sin n           {p: {estrategia: {"s_per_call_median" o "s_per_call"}}},
+                            n en metadata.params (global o por problema)
+
+Los archivos se leen en paralelo (ProcessPoolExecutor): con cientos de
+archivos el costo es json.load, que es CPU y no suelta el GIL.
+Un archivo que no se reconoce se reporta y se salta, no detiene la corrida.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    HAY_PYARROW = True
+except ImportError:
+    HAY_PYARROW = False
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+PATRON = os.path.join("students", "*", "**", "tiempos*.json")
+REFERENCIA = "numpy"
+
+COLUMNAS = [
+    "archivo", "alumno", "formato", "timestamp", "python_version", "numpy_version",
+    "maquina", "arquitectura", "problema", "estrategia", "consumo", "dtype", "disposicion", "n",
+    "s_per_call_median", "p25_s", "p75_s", "repeticiones",
+    "ns_per_element", "ratio_vs_numpy", "bytes_per_element",
+]
+
+
+# =============================================================================
+# NORMALIZACIÓN POR FORMATO
+# =============================================================================
+def _fila(problema, estrategia, n, mediana, p25=None, p75=None, repeticiones=None, consumo=None,
+          dtype="float64", disposicion="contiguo", bytes_por_elemento=None):
+    # las tareas usan arange/linspace: float64 contiguo salvo que el archivo diga otra cosa
+    return {
+        "problema": problema, "estrategia": estrategia, "consumo": consumo,
+        "dtype": dtype, "disposicion": disposicion, "n": n,
+        "s_per_call_median": mediana, "p25_s": p25, "p75_s": p75, "repeticiones": repeticiones,
+        "bytes_per_element": bytes_por_elemento,
+    }
+
+
+def _mediana_de(valor):
+    """Segundos por llamada de una entrada de cualquier formato de "results"."""
+    if isinstance(valor, (int, float)):
+        return valor
+    for clave in ("s_per_call_median", "mediana", "s_per_call"):
+        if clave in valor:
+            return valor[clave]
+    # solo media y muestras crudas: la mediana se calcula de las muestras
+    for clave in ("vector_de_datos", "raw_times"):
+        if valor.get(clave):
+            return statistics.median(valor[clave])
+    raise ValueError(f"entrada sin tiempo reconocible: {sorted(valor)}")
+
+
+def _desde_arnes(datos):
+    for m in datos["mediciones"]:
+        yield _fila(m["problema"], m["estrategia"], m["n"], m["mediana_s"], m.get("p25_s"),
+                    m.get("p75_s"), m.get("repeticiones"), m["consumo"],
+                    m["dtype"], m["disposicion"], m["bytes_por_elemento"])
+
+
+def _desde_por_n(por_n):
+    """{n: {p: {estrategia: valor}}} (resultados_por_n, results_by_n, results con n)."""
+    for n, problemas in por_n.items():
+        for problema, estrategias in problemas.items():
+            if problema == "params":
+                continue
+            for estrategia, valor in estrategias.items():
+                extra = valor if isinstance(valor, dict) else {}
+                yield _fila(problema, estrategia, int(n), _mediana_de(valor),
+                            extra.get("p25_s", extra.get("s_per_call_p25")),
+                            extra.get("p75_s", extra.get("s_per_call_p75")),
+                            extra.get("repetitions", extra.get("runs")))
+
+
+def _n_de_params(params, problema):
+    """n global (params.n), anidado (params.params.n) o por problema (params.p1.n)."""
+    while isinstance(params, dict):
+        if "n" in params:
+            return params["n"]
+        if problema in params:
+            params = params[problema]
+        elif "params" in params:
+            params = params["params"]
+        else:
+            break
+    return None
+
+
+def _desde_results(datos):
+    params = datos.get("metadata", {}).get("params") or datos.get("params", {})
+    for problema, estrategias in datos["results"].items():
+        n = _n_de_params(params, problema)
+        for estrategia, valor in estrategias.items():
+            yield _fila(problema, estrategia, n, _mediana_de(valor),
+                        valor.get("s_per_call_p25"), valor.get("s_per_call_p75"),
+                        valor.get("repetitions"), bytes_por_elemento=valor.get("bytes_per_element"))
+
+
+def detectar(datos):
+    """(nombre del formato, generador de filas)"""
+    if "mediciones" in datos:
+        return datos.get("schema", "arnes"), _desde_arnes(datos)
+    if "resultados_por_n" in datos:
+        return "resultados_por_n", _desde_por_n(datos["resultados_por_n"])
+    if "results_by_n" in datos:
+        return "results_by_n", _desde_por_n(datos["results_by_n"])
+    if "results" in datos:
+        if all(str(k).isdigit() for k in datos["results"]):
+            return "results_por_n", _desde_por_n(datos["results"])
+        return "results", _desde_results(datos)
+    raise ValueError(f"formato no reconocido (claves: {sorted(datos)})")
+
+
+def _arquitectura(maquina):
+    m = re.search(r"x86_64|amd64|arm64|aarch64", maquina or "", re.IGNORECASE)
+    return m.group(0).lower().replace("aarch64", "arm64").replace("amd64", "x86_64") if m else maquina
+
+
+def leer(ruta, raiz=RAIZ):
+    """Filas normalizadas de un archivo; se ejecuta en un proceso del pool."""
+    with open(ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+    formato, filas = detectar(datos)
+    meta = datos.get("metadata", {})
+    maquina = meta.get("platform") or meta.get("machine")
+    relativa = os.path.relpath(ruta, raiz)
+    comun = {
+        "archivo": relativa,
+        "alumno": relativa.split(os.sep)[1],
+        "formato": formato,
+        "timestamp": meta.get("timestamp"),
+        # algunos guardaron sys.version completo: solo la versión
+        "python_version": (meta.get("python_version") or "").split(" ")[0] or None,
+        "numpy_version": meta.get("numpy_version"),
+        "maquina": maquina,
+        "arquitectura": _arquitectura(maquina),
+    }
+    filas = [{**comun, **f} for f in filas]
+
+    # ns por elemento y razón contra numpy del mismo problema, n, dtype y disposición
+    referencia = {(f["problema"], f["n"], f["dtype"], f["disposicion"], f["consumo"]): f["s_per_call_median"]
+                  for f in filas if f["estrategia"] == REFERENCIA}
+    for f in filas:
+        s = f["s_per_call_median"]
+        f["ns_per_element"] = s / f["n"] * 1e9 if f["n"] else None
+        clave = (f["problema"], f["n"], f["dtype"], f["disposicion"])
+        ref = referencia.get(clave + (f["consumo"],)) or referencia.get(clave + ("ansioso",))
+        f["ratio_vs_numpy"] = s / ref if ref else None
+    return filas
+
+
+def _leer_seguro(ruta, raiz=RAIZ):
+    try:
+        return ruta, leer(ruta, raiz), None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        return ruta, [], f"{type(e).__name__}: {e}"
+
+
+# =============================================================================
+# RECOLECCIÓN Y ROLLUPS
+# =============================================================================
+def buscar(raiz=RAIZ, patron=PATRON):
+    return sorted(glob.glob(os.path.join(raiz, patron), recursive=True))
+
+
+def recolectar(rutas, workers=None, raiz=RAIZ):
+    """(filas, errores). Con un solo archivo o workers=1 no se crea el pool."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(rutas) < 2:
+        resultados = [_leer_seguro(ruta, raiz) for ruta in rutas]
+    else:
+        # chunksize: cientos de archivos chicos, mejor mandarlos en lotes
+        chunksize = max(1, len(rutas) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultados = list(executor.map(_leer_seguro, rutas, [raiz] * len(rutas), chunksize=chunksize))
+    filas, errores = [], []
+    for ruta, filas_archivo, error in resultados:
+        filas.extend(filas_archivo)
+        if error:
+            errores.append((ruta, error))
+    return filas, errores
+
+
+def _media_geometrica(valores):
+    return statistics.geometric_mean(valores) if valores else None
+
+
+def rollup(filas, claves):
+    """Agrupa por `claves`; speedup de numpy = ratio_vs_numpy de la estrategia."""
+    grupos = {}
+    for f in filas:
+        grupos.setdefault(tuple(f[c] for c in claves), []).append(f)
+    salida = []
+    for clave, grupo in sorted(grupos.items(), key=lambda kv: tuple(str(x) for x in kv[0])):
+        ratios = [f["ratio_vs_numpy"] for f in grupo if f["ratio_vs_numpy"]]
+        ns = [f["ns_per_element"] for f in grupo if f["ns_per_element"] is not None]
+        memoria = [f["bytes_per_element"] for f in grupo if f["bytes_per_element"] is not None]
+        salida.append({
+            **dict(zip(claves, clave)),
+            "filas": len(grupo),
+            "archivos": len({f["archivo"] for f in grupo}),
+            "ratio_vs_numpy_mediana": statistics.median(ratios) if ratios else None,
+            "ratio_vs_numpy_geomedia": _media_geometrica(ratios),
+            "ratio_vs_numpy_min": min(ratios) if ratios else None,
+            "ratio_vs_numpy_max": max(ratios) if ratios else None,
+            "ns_per_element_mediana": statistics.median(ns) if ns else None,
+            "bytes_per_element_mediana": statistics.median(memoria) if memoria else None,
+        })
+    return salida
+
+
+# =============================================================================
+# SALIDA
+# =============================================================================
+def escribir_csv(ruta, filas, columnas):
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas, extrasaction="ignore")
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+
+def escribir_parquet(ruta, filas, columnas):
+    tabla = pyarrow.Table.from_pylist([{c: f.get(c) for c in columnas} for f in filas])
+    pyarrow.parquet.write_table(tabla, ruta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Une todos los tiempos*.json de los alumnos en una tabla")
+    parser.add_argument("--raiz", default=RAIZ, help="Raíz del repositorio")
+    parser.add_argument("--salida", default="resultados_tiempos", help="Directorio de salida")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos (por defecto os.cpu_count())")
+    args = parser.parse_args()
+
+    rutas = buscar(args.raiz)
+    filas, errores = recolectar(rutas, args.workers, args.raiz)
+    os.makedirs(args.salida, exist_ok=True)
+
+    print("\n" + "="*70)
+    print(f"RECOLECCIÓN: {len(rutas)} archivos, {len(filas)} filas")
+    print("="*70)
+    formatos = {}
+    for f in filas:
+        formatos.setdefault(f["formato"], set()).add(f["archivo"])
+    for formato, archivos in sorted(formatos.items()):
+        print(f"  {formato:<18} {len(archivos):>4} archivos")
+    for ruta, error in errores:
+        print(f"⚠️  {os.path.relpath(ruta, args.raiz)}: {error}")
+
+    escritos = [os.path.join(args.salida, "tiempos_tidy.csv")]
+    escribir_csv(escritos[-1], filas, COLUMNAS)
+    if HAY_PYARROW:
+        escritos.append(os.path.join(args.salida, "tiempos_tidy.parquet"))
+        escribir_parquet(escritos[-1], filas, COLUMNAS)
+
+    por_maquina = rollup(filas, ["arquitectura", "maquina", "problema", "estrategia", "dtype", "disposicion"])
+    por_estrategia = rollup(filas, ["problema", "estrategia", "dtype", "disposicion"])
+    for nombre, tabla in (("rollup_maquina.csv", por_maquina), ("rollup_estrategia.csv", por_estrategia)):
+        escritos.append(os.path.join(args.salida, nombre))
+        escribir_csv(escritos[-1], tabla, list(tabla[0]) if tabla else [])
+
+    print(f"\n{'problema':<9} {'estrategia':<14} {'dtype':<8} {'disposición':<12} {'archivos':>8} "
+          f"{'x numpy (mediana)':>18} {'x numpy (geo)':>14} {'ns/elem':>9}")
+    for r in por_estrategia:
+        if r["ratio_vs_numpy_mediana"] is None:
+            continue
+        print(f"{r['problema']:<9} {r['estrategia']:<14} {r['dtype']:<8} {r['disposicion']:<12} {r['archivos']:>8} "
+              f"{r['ratio_vs_numpy_mediana']:>17.1f}x {r['ratio_vs_numpy_geomedia']:>13.1f}x "
+              f"{r['ns_per_element_mediana']:>9.2f}")
+
+    print()
+    for ruta in escritos:
+        print("✅ Guardado en:", ruta)
+    if not HAY_PYARROW:
+        print("⚠️  pyarrow no está instalado: solo CSV")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
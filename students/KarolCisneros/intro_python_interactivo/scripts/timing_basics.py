@@ -1,7 +1,9 @@
 import argparse
 import time
 import timeit
+import tracemalloc
 from statistics import mean, stdev
+from typing import Callable
 
 
 def format_stats(samples: list[float]) -> str:
@@ -12,34 +14,64 @@ def format_stats(samples: list[float]) -> str:
     return f"{mean(samples)*1000:.3f} ms ± {stdev(samples)*1000:.3f} ms"
 
 
-def bench_sum_builtin(n: int, repeat: int, number: int) -> list[float]:
-    return timeit.repeat(lambda: sum(range(n)), number=number, repeat=repeat)
+def peak_bytes(fn: Callable[[], object]) -> int:
+    # Pico de memoria reservada durante una llamada (tracemalloc).
+    # Se mide en una pasada aparte: con tracemalloc activo todo corre más lento
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
 
 
-def bench_sum_loop(n: int, repeat: int, number: int) -> list[float]:
+def format_per_element(samples: list[float], number: int, peak: int | None, n: int) -> str:
+    # ns y bytes por elemento, para comparar estrategias con distinto n
+    texto = f"{mean(samples) / number / n * 1e9:.1f} ns/elem"
+    if peak is not None:
+        texto += f", pico {peak / n:.1f} B/elem"
+    return texto
+
+
+# Cada *_cases arma las funciones a comparar; los bench_* las cronometran y
+# main() puede medir su memoria aparte con peak_bytes.
+
+def sum_cases(n: int) -> tuple[Callable[[], int], Callable[[], int]]:
     def _f() -> int:
         total = 0
         for i in range(n):
             total += i
         return total
 
-    return timeit.repeat(_f, number=number, repeat=repeat)
+    return (lambda: sum(range(n))), _f
 
 
-def bench_list_comp_vs_append(n: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
-    comp = timeit.repeat(lambda: [i * i for i in range(n)], number=number, repeat=repeat)
+def bench_sum_builtin(n: int, repeat: int, number: int) -> list[float]:
+    return timeit.repeat(sum_cases(n)[0], number=number, repeat=repeat)
 
+
+def bench_sum_loop(n: int, repeat: int, number: int) -> list[float]:
+    return timeit.repeat(sum_cases(n)[1], number=number, repeat=repeat)
+
+
+def list_cases(n: int) -> tuple[Callable[[], list[int]], Callable[[], list[int]]]:
     def _append() -> list[int]:
         values: list[int] = []
         for i in range(n):
             values.append(i * i)
         return values
 
-    app = timeit.repeat(_append, number=number, repeat=repeat)
+    return (lambda: [i * i for i in range(n)]), _append
+
+
+def bench_list_comp_vs_append(n: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+    comp_f, append_f = list_cases(n)
+    comp = timeit.repeat(comp_f, number=number, repeat=repeat)
+    app = timeit.repeat(append_f, number=number, repeat=repeat)
     return comp, app
 
 
-def bench_concat_vs_join(k: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+def string_cases(k: int) -> tuple[Callable[[], str], Callable[[], str]]:
     # k menor porque concatenar en bucle es O(n^2)
     def _concat() -> str:
         s = ""
@@ -50,12 +82,17 @@ def bench_concat_vs_join(k: int, repeat: int, number: int) -> tuple[list[float],
     def _join() -> str:
         return "".join(["a"] * k)
 
-    concat = timeit.repeat(_concat, number=number, repeat=repeat)
-    join = timeit.repeat(_join, number=number, repeat=repeat)
+    return _concat, _join
+
+
+def bench_concat_vs_join(k: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+    concat_f, join_f = string_cases(k)
+    concat = timeit.repeat(concat_f, number=number, repeat=repeat)
+    join = timeit.repeat(join_f, number=number, repeat=repeat)
     return concat, join
 
 
-def bench_set_vs_list_membership(n: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+def membership_cases(n: int) -> tuple[Callable[[], bool], Callable[[], bool]]:
     universe = list(range(n))
     probe_values = list(range(n, n + 1000))  # misses para medir peor caso
 
@@ -74,12 +111,17 @@ def bench_set_vs_list_membership(n: int, repeat: int, number: int) -> tuple[list
                 found = True
         return found
 
-    list_times = timeit.repeat(_list_in, number=number, repeat=repeat)
-    set_times = timeit.repeat(_set_in, number=number, repeat=repeat)
+    return _list_in, _set_in
+
+
+def bench_set_vs_list_membership(n: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+    list_f, set_f = membership_cases(n)
+    list_times = timeit.repeat(list_f, number=number, repeat=repeat)
+    set_times = timeit.repeat(set_f, number=number, repeat=repeat)
     return list_times, set_times
 
 
-def bench_any_vs_loop(n: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+def any_cases(n: int) -> tuple[Callable[[], bool], Callable[[], bool]]:
     data = [0] * (n - 1) + [1]
 
     def _loop() -> bool:
@@ -88,8 +130,13 @@ def bench_any_vs_loop(n: int, repeat: int, number: int) -> tuple[list[float], li
                 return True
         return False
 
-    loop_t = timeit.repeat(_loop, number=number, repeat=repeat)
-    any_t = timeit.repeat(lambda: any(data), number=number, repeat=repeat)
+    return (lambda: any(data)), _loop
+
+
+def bench_any_vs_loop(n: int, repeat: int, number: int) -> tuple[list[float], list[float]]:
+    any_f, loop_f = any_cases(n)
+    loop_t = timeit.repeat(loop_f, number=number, repeat=repeat)
+    any_t = timeit.repeat(any_f, number=number, repeat=repeat)
     return any_t, loop_t
 
 
@@ -116,23 +163,33 @@ def main() -> None:
     parser.add_argument("--n", type=int, default=200_000, help="Tamaño del problema (depende de la prueba)")
     parser.add_argument("--repeat", type=int, default=5, help="Repeticiones para estadística")
     parser.add_argument("--number", type=int, default=1, help="Ejecuciones por repetición (timeit)")
+    parser.add_argument("--no-memory", action="store_true", help="No medir el pico de memoria (tracemalloc)")
     args = parser.parse_args()
 
+    def peaks(cases: tuple[Callable[[], object], ...]) -> list[int | None]:
+        # Pasada de memoria, después de los tiempos de la misma prueba
+        return [None if args.no_memory else peak_bytes(f) for f in cases]
+
+    def per_elem(samples: list[float], peak: int | None, n: int = args.n) -> str:
+        return format_per_element(samples, args.number, peak, n)
+
     # Sumas
     if args.benchmark in ("all", "sum"):
         print_header("Suma: builtin sum vs bucle explícito")
         b = bench_sum_builtin(args.n, args.repeat, args.number)
         l = bench_sum_loop(args.n, args.repeat, args.number)
-        print(f"sum(range(n)): {format_stats(b)}")
-        print(f"for ... total += i: {format_stats(l)}")
+        pb, pl = peaks(sum_cases(args.n))
+        print(f"sum(range(n)): {format_stats(b)} ({per_elem(b, pb)})")
+        print(f"for ... total += i: {format_stats(l)} ({per_elem(l, pl)})")
         print(f"→ speedup (builtin / loop): {mean(l)/mean(b):.2f}× más rápido (aprox.)")
 
     # Listas
     if args.benchmark in ("all", "list"):
         print_header("Listas: comprensión vs append en bucle")
         comp, app = bench_list_comp_vs_append(args.n, args.repeat, args.number)
-        print(f"[i*i for i in range(n)]: {format_stats(comp)}")
-        print(f"append en bucle:            {format_stats(app)}")
+        pc, pa = peaks(list_cases(args.n))
+        print(f"[i*i for i in range(n)]: {format_stats(comp)} ({per_elem(comp, pc)})")
+        print(f"append en bucle:            {format_stats(app)} ({per_elem(app, pa)})")
         print(f"→ speedup (comp / append): {mean(app)/mean(comp):.2f}× más rápido (aprox.)")
 
     # Cadenas (k suele ser menor que n)
@@ -140,27 +197,31 @@ def main() -> None:
         k = max(10_000, min(args.n, 200_000))
         print_header(f"Cadenas: concatenar (+) vs join (k={k})")
         concat, join = bench_concat_vs_join(k, args.repeat, args.number)
-        print(f"s += 'a': {format_stats(concat)}")
-        print(f"''.join([...]): {format_stats(join)}")
+        pc, pj = peaks(string_cases(k))
+        print(f"s += 'a': {format_stats(concat)} ({per_elem(concat, pc, k)})")
+        print(f"''.join([...]): {format_stats(join)} ({per_elem(join, pj, k)})")
         print(f"→ speedup (join / concat): {mean(concat)/mean(join):.2f}× más rápido (aprox.)")
 
     # Pertenencia
     if args.benchmark in ("all", "membership"):
         print_header("Pertenencia: list vs set (misses)")
         list_t, set_t = bench_set_vs_list_membership(args.n, args.repeat, args.number)
-        print(f"x in list: {format_stats(list_t)}")
-        print(f"x in set:  {format_stats(set_t)}")
+        pl, ps = peaks(membership_cases(args.n))
+        print(f"x in list: {format_stats(list_t)} ({per_elem(list_t, pl)})")
+        print(f"x in set:  {format_stats(set_t)} ({per_elem(set_t, ps)})")
         print(f"→ speedup (set / list): {mean(list_t)/mean(set_t):.2f}× más rápido (aprox.)")
 
     # any()
     if args.benchmark in ("all", "any"):
         print_header("any() vs bucle con return temprano")
         any_t, loop_t = bench_any_vs_loop(args.n, args.repeat, args.number)
-        print(f"any(data):    {format_stats(any_t)}")
-        print(f"loop+return:  {format_stats(loop_t)}")
+        pa, pl = peaks(any_cases(args.n))
+        print(f"any(data):    {format_stats(any_t)} ({per_elem(any_t, pa)})")
+        print(f"loop+return:  {format_stats(loop_t)} ({per_elem(loop_t, pl)})")
         print(f"→ speedup (any / loop): {mean(loop_t)/mean(any_t):.2f}× más rápido (aprox.)")
 
     # Nota: Los resultados dependen de n, de la máquina y del intérprete.
+    # El pico de memoria no incluye los datos de entrada (ya existían antes de medir).
     # El objetivo es observar tendencias y fomentar el pensamiento crítico.
 
 
@@ -0,0 +1,205 @@
+"""
+Arnés de benchmarks para los problemas de tarea_tiempos (p1, p2, p3).
+
+Los problemas y las estrategias se registran solos con los decoradores
+@problema y @estrategia de registro.py (proyecto_python.py los usa).
+
+Para cada problema, dtype, disposición, estrategia y n del barrido:
+- timeit.Timer.autorange() elige `number` (llamadas por muestra, >= 0.2 s)
+- se toman `repeticiones` muestras y se reporta mediana, p25, p75, IQR, mínimo
+- ns por elemento, GB/s de entrada leída (n · itemsize / mediana) y razón
+  contra la estrategia "numpy" del mismo problema, n, dtype y disposición
+- bytes por elemento, en una pasada aparte después de medir los tiempos (con
+  tracemalloc activo todo corre más lento y reserva más): el pico total y lo
+  que retiene el resultado, separado en objetos de Python y buffers de NumPy
+  (NumPy reporta sus arreglos a tracemalloc en np.lib.tracemalloc_domain)
+
+Consumo: las estrategias ansiosas se llaman tal cual. Las perezosas
+(generadores) se miden dos veces, para comparar la misma cantidad de trabajo:
+- "drenado": collections.deque(gen, maxlen=0) recorre todo sin guardar nada
+- "lista":   list(gen), el costo de materializar el resultado
+
+dtype y disposición (--dtypes, --disposiciones; ver disposicion.py): por
+defecto float64 contiguo. El ratio_numpy de cada combinación muestra cuánto
+del speedup de NumPy depende de datos contiguos, alineados y angostos.
+
+Todo se escribe en un solo esquema versionado (ESQUEMA), en JSON (con las
+muestras y metadatos de la máquina) y en CSV (una fila por medición).
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import timeit
+from collections import deque
+from datetime import datetime, timezone
+
+import numpy as np
+
+from proyecto_python import cerrar_pools, memoria_por_dominio  # importarlo registra problemas y estrategias
+from disposicion import DISPOSICIONES, DTYPES, preparar
+from registro import PROBLEMAS, Estrategia, estrategias_de
+
+ESQUEMA = "tiempos_p123/v1"
+REFERENCIA = "numpy"
+
+COLUMNAS = [
+    "problema", "estrategia", "consumo", "dtype", "disposicion", "n", "number", "repeticiones",
+    "mediana_s", "p25_s", "p75_s", "iqr_s", "min_s",
+    "ns_por_elemento", "gb_s", "ratio_numpy",
+    "bytes_por_elemento", "bytes_python_por_elemento", "bytes_numpy_por_elemento",
+]
+
+
+# Medición
+
+def llamables(e: Estrategia, args: tuple):
+    """[(consumo, función sin argumentos)] para medir la estrategia."""
+    if e.perezosa:
+        return [
+            ("drenado", lambda: deque(e.fn(*args), maxlen=0)),
+            ("lista", lambda: list(e.fn(*args))),
+        ]
+    return [("ansioso", lambda: e.fn(*args))]
+
+
+def medir(fn, repeticiones: int = 7):
+    """Retorna (number, lista de segundos por llamada)."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    muestras = timer.repeat(repeat=repeticiones, number=number)
+    return number, [t / number for t in muestras]
+
+
+def memoria(fn, n: int):
+    """Bytes por elemento: pico y retenidos (Python / NumPy). Los datos de entrada ya existen."""
+    pico, python, numpy = memoria_por_dominio(fn)
+    return {"bytes_por_elemento": pico / n, "bytes_python_por_elemento": python / n,
+            "bytes_numpy_por_elemento": numpy / n}
+
+
+def resumir(muestras):
+    p25, mediana, p75 = np.percentile(muestras, [25, 50, 75])
+    return {
+        "mediana_s": float(mediana),
+        "p25_s": float(p25),
+        "p75_s": float(p75),
+        "iqr_s": float(p75 - p25),
+        "min_s": min(muestras),
+    }
+
+
+def correr(ns, problemas=None, estrategias=None, repeticiones: int = 7,
+           max_s_por_llamada: float = 1.0, verbose: bool = True,
+           dtypes=("float64",), disposiciones=("contiguo",)):
+    """
+    Barrido sobre ns (y dtypes × disposiciones). Una estrategia que pasa de
+    `max_s_por_llamada` en un n ya no se mide en los n siguientes de esa misma
+    combinación (los bucles de Python a n=10^7 tardarían minutos).
+    Retorna la lista de mediciones (dicts con COLUMNAS + "muestras_s").
+    """
+    mediciones = []
+    lentas = set()
+    try:
+        for nombre_problema in problemas or PROBLEMAS:
+            for dtype in dtypes:
+                for disposicion in disposiciones:
+                    for n in sorted(ns):
+                        args = preparar(PROBLEMAS[nombre_problema](n), dtype, disposicion)
+                        fila_n, funciones = [], []
+                        for e in estrategias_de(nombre_problema):
+                            if estrategias and e.nombre not in estrategias and e.nombre != REFERENCIA:
+                                continue
+                            combinacion = (nombre_problema, e.nombre, dtype, disposicion)
+                            if combinacion in lentas:
+                                continue
+                            for consumo, fn in llamables(e, args):
+                                number, muestras = medir(fn, repeticiones)
+                                m = {"problema": nombre_problema, "estrategia": e.nombre, "consumo": consumo,
+                                     "dtype": dtype, "disposicion": disposicion, "n": n, "number": number,
+                                     "repeticiones": repeticiones, **resumir(muestras)}
+                                m["ns_por_elemento"] = m["mediana_s"] / n * 1e9
+                                m["gb_s"] = n * args[0].itemsize / m["mediana_s"] / 1e9
+                                m["muestras_s"] = muestras
+                                fila_n.append(m)
+                                funciones.append(fn)
+                                if m["mediana_s"] > max_s_por_llamada:
+                                    lentas.add(combinacion)
+                        # pasada de memoria: ya con todos los tiempos de este n tomados
+                        for m, fn in zip(fila_n, funciones):
+                            m.update(memoria(fn, n))
+                        ref = next((m for m in fila_n if m["estrategia"] == REFERENCIA), None)
+                        for m in fila_n:
+                            m["ratio_numpy"] = m["mediana_s"] / ref["mediana_s"] if ref else None
+                            if verbose:
+                                print(f"{m['problema']} {dtype:<7} {disposicion:<11} n={n:<10,} "
+                                      f"{m['estrategia']:<14} {m['consumo']:<8} "
+                                      f"mediana={m['mediana_s'] * 1e3:>10.3f}ms  IQR={m['iqr_s'] * 1e3:>8.3f}ms  "
+                                      f"{m['ns_por_elemento']:>9.2f} ns/elem  {m['gb_s']:>6.2f} GB/s  "
+                                      f"pico {m['bytes_por_elemento']:>6.1f} B/elem "
+                                      f"(retiene py {m['bytes_python_por_elemento']:>5.1f} "
+                                      f"np {m['bytes_numpy_por_elemento']:>5.1f})  "
+                                      + (f"{m['ratio_numpy']:>8.1f}x numpy" if ref else ""))
+                        mediciones.extend(fila_n)
+    finally:
+        cerrar_pools()  # los hilos de las estrategias _par no sobreviven al barrido
+    return mediciones
+
+
+# Salida
+
+def metadatos(params: dict):
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "numpy_version": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "params": params,
+    }
+
+
+def guardar(mediciones, params: dict, directorio: str, prefijo: str = "tiempos_v1"):
+    """Escribe <prefijo>_<fecha>.json y .csv en directorio; retorna las dos rutas."""
+    os.makedirs(directorio, exist_ok=True)
+    sello = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
+    ruta_json = os.path.join(directorio, f"{prefijo}_{sello}.json")
+    ruta_csv = os.path.join(directorio, f"{prefijo}_{sello}.csv")
+    with open(ruta_json, "w", encoding="utf-8") as f:
+        json.dump({"schema": ESQUEMA, "metadata": metadatos(params), "mediciones": mediciones}, f, indent=2)
+    with open(ruta_csv, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=["schema"] + COLUMNAS, extrasaction="ignore")
+        escritor.writeheader()
+        for m in mediciones:
+            escritor.writerow({"schema": ESQUEMA, **m})
+    return ruta_json, ruta_csv
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Barrido de n para p1-p3 con estadísticas robustas")
+    parser.add_argument("--ns", default="1000,10000,100000,1000000")
+    parser.add_argument("--problemas", help="p.ej. p1,p3 (por defecto todos)")
+    parser.add_argument("--estrategias", help="p.ej. for,numpy (numpy siempre se mide)")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument("--dtypes", default="float64", help=f"p.ej. float32,int64 o 'todos' ({','.join(DTYPES)})")
+    parser.add_argument("--disposiciones", default="contiguo",
+                        help=f"p.ej. contiguo,salto2 o 'todas' ({','.join(DISPOSICIONES)})")
+    parser.add_argument("--max-s", type=float, default=1.0, help="No medir n mayores si una llamada pasa de esto")
+    parser.add_argument("--salida", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "tiempos"))
+    args = parser.parse_args()
+
+    ns = [int(n) for n in args.ns.split(",")]
+    dtypes = DTYPES if args.dtypes == "todos" else tuple(args.dtypes.split(","))
+    disposiciones = DISPOSICIONES if args.disposiciones == "todas" else tuple(args.disposiciones.split(","))
+    params = {"ns": ns, "repeticiones": args.repeticiones, "max_s_por_llamada": args.max_s,
+              "timeit": "autorange", "dtypes": dtypes, "disposiciones": disposiciones}
+    mediciones = correr(ns, args.problemas and args.problemas.split(","),
+                        args.estrategias and args.estrategias.split(","),
+                        args.repeticiones, args.max_s, dtypes=dtypes, disposiciones=disposiciones)
+    for ruta in guardar(mediciones, params, args.salida):
+        print("Guardado en:", ruta)
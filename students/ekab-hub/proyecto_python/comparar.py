@@ -0,0 +1,126 @@
+"""
+Detector de regresiones entre dos corridas de arnes.py (esquema tiempos_p123/v1).
+
+Empareja las mediciones por (problema, estrategia, consumo, dtype, disposición, n)
+y compara las muestras crudas (muestras_s) con la prueba U de Mann-Whitney de
+dos colas:
+- aproximación normal con corrección por empates y por continuidad
+- con 7 vs 7 muestras (lo que usa el arnés) la aproximación es razonable; con
+  3 vs 3 el p mínimo posible es ~0.08, así que nunca hay significancia a 0.05;
+  con menos de 3 la fila queda como "?"
+
+Una fila es regresión si p < alfa Y la mediana empeoró más que `umbral`
+(relativo); mejora si p < alfa y mejoró más que `umbral`. El umbral evita
+marcar diferencias reales pero irrelevantes (ruido de la máquina, 1-2%).
+
+Sale con código 1 si hay al menos una regresión (útil en CI), 0 si no.
+"""
+
+import argparse
+import json
+import math
+import sys
+
+import numpy as np
+
+ESQUEMA = "tiempos_p123/v1"
+
+
+# Carga
+
+def cargar(ruta: str):
+    """{(problema, estrategia, consumo, dtype, disposición, n): medición} de un JSON del arnés."""
+    with open(ruta, encoding="utf-8") as f:
+        datos = json.load(f)
+    esquema = datos.get("schema")
+    if esquema != ESQUEMA:
+        raise ValueError(f"{ruta}: esquema {esquema!r} no soportado (se esperaba {ESQUEMA})")
+    mediciones = {}
+    for m in datos["mediciones"]:
+        clave = (m["problema"], m["estrategia"], m["consumo"], m["dtype"], m["disposicion"], m["n"])
+        mediciones[clave] = m
+    return mediciones
+
+
+# Estadística
+
+def mann_whitney(x, y):
+    """
+    U de Mann-Whitney para x vs y, de dos colas.
+    Retorna (U de x, p). p es None si alguna muestra tiene menos de 3 valores.
+    """
+    n1, n2 = len(x), len(y)
+    if n1 < 3 or n2 < 3:
+        return None, None
+    valores = np.concatenate([x, y])
+    orden = np.argsort(valores, kind="mergesort")
+    ordenados = valores[orden]
+    rangos = np.empty(len(valores))
+    # rango promedio para los empates
+    _, inicio, conteo = np.unique(ordenados, return_index=True, return_counts=True)
+    for i, c in zip(inicio, conteo):
+        rangos[orden[i:i + c]] = i + (c + 1) / 2
+    u = rangos[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    varianza = n1 * n2 / 12 * ((n + 1) - (conteo ** 3 - conteo).sum() / (n * (n - 1)))
+    if varianza == 0:
+        return u, 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(varianza)
+    return u, math.erfc(max(z, 0) / math.sqrt(2))
+
+
+def comparar(base: dict, candidata: dict, alfa: float = 0.05, umbral: float = 0.05):
+    """Lista de filas (clave, mediana base, mediana candidata, cambio relativo, p, veredicto)."""
+    filas = []
+    for clave in sorted(base.keys() & candidata.keys()):
+        x = np.asarray(base[clave]["muestras_s"])
+        y = np.asarray(candidata[clave]["muestras_s"])
+        med_x, med_y = float(np.median(x)), float(np.median(y))
+        cambio = med_y / med_x - 1
+        _, p = mann_whitney(x, y)
+        if p is None:
+            veredicto = "?"
+        elif p < alfa and cambio > umbral:
+            veredicto = "REGRESIÓN"
+        elif p < alfa and cambio < -umbral:
+            veredicto = "mejora"
+        else:
+            veredicto = "="
+        filas.append((clave, med_x, med_y, cambio, p, veredicto))
+    return filas
+
+
+# Reporte
+
+def imprimir(filas, solo_cambios: bool = False):
+    print(f"{'problema':<8} {'estrategia':<14} {'consumo':<8} {'dtype':<7} {'disposición':<11} "
+          f"{'n':>10} {'base':>10} {'candidata':>10} {'cambio':>8} {'p':>7}  veredicto")
+    for (problema, estrategia, consumo, dtype, disposicion, n), med_x, med_y, cambio, p, veredicto in filas:
+        if solo_cambios and veredicto == "=":
+            continue
+        p_texto = f"{p:.4f}" if p is not None else "—"
+        print(f"{problema:<8} {estrategia:<14} {consumo:<8} {dtype:<7} {disposicion:<11} "
+              f"{n:>10,} {med_x * 1e3:>8.3f}ms "
+              f"{med_y * 1e3:>8.3f}ms {cambio:>+7.1%} {p_texto:>7}  {veredicto}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara dos JSON de arnes.py y detecta regresiones")
+    parser.add_argument("base", help="JSON de la corrida de referencia")
+    parser.add_argument("candidata", help="JSON de la corrida nueva")
+    parser.add_argument("--alfa", type=float, default=0.05, help="Nivel de significancia")
+    parser.add_argument("--umbral", type=float, default=0.05, help="Cambio relativo mínimo de la mediana")
+    parser.add_argument("--solo-cambios", action="store_true", help="No imprimir las filas sin cambio")
+    args = parser.parse_args()
+
+    base, candidata = cargar(args.base), cargar(args.candidata)
+    filas = comparar(base, candidata, args.alfa, args.umbral)
+    imprimir(filas, args.solo_cambios)
+
+    sin_pareja = len(base.keys() ^ candidata.keys())
+    if sin_pareja:
+        print(f"{sin_pareja} mediciones solo en una de las dos corridas (no comparadas)")
+    regresiones = sum(f[-1] == "REGRESIÓN" for f in filas)
+    mejoras = sum(f[-1] == "mejora" for f in filas)
+    print(f"{len(filas)} comparadas: {regresiones} regresiones, {mejoras} mejoras")
+    sys.exit(1 if regresiones else 0)
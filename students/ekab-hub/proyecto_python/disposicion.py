@@ -0,0 +1,79 @@
+"""
+dtype y disposición en memoria de las entradas de p1-p3 (ver arnes.py --dtypes --disposiciones).
+
+Los datos de PROBLEMAS son float64 contiguos. Aquí se convierten a otro dtype
+con astype (float32 redondea; los enteros truncan: los arange de p1 y p2 quedan
+iguales, el linspace de p3 no) y se ponen en otra disposición, que no cambia
+los valores:
+
+- "contiguo":    C-contiguo y alineado (lo normal)
+- "salto2":      vista a[::2] de un arreglo del doble de tamaño (stride = 2 elementos)
+- "fortran":     fila de una matriz 2-D en orden Fortran de FILAS_FORTRAN filas:
+                 stride = FILAS_FORTRAN elementos, el caso de leer una fila de datos
+                 por columnas (pandas, Fortran, .T de un arreglo C)
+- "desalineado": contiguo pero empezando 1 byte después de un inicio alineado;
+                 NumPy no puede usar sus bucles SIMD y copia por trozos a un buffer
+
+Con stride, cada línea de caché (64 B) trae menos elementos útiles: a[::2] en
+float64 usa la mitad de cada línea. Con float32/int32 caben el doble de
+elementos por línea y por registro SIMD que con float64/int64.
+"""
+
+import numpy as np
+
+DTYPES = ("float64", "float32", "int64", "int32")
+DISPOSICIONES = ("contiguo", "salto2", "fortran", "desalineado")
+FILAS_FORTRAN = 4
+
+
+def con_disposicion(a: np.ndarray, disposicion: str):
+    """Arreglo 1-D con los mismos valores y dtype que `a`, en la disposición pedida."""
+    n = len(a)
+    if disposicion == "contiguo":
+        return np.ascontiguousarray(a)
+    if disposicion == "salto2":
+        base = np.zeros(2 * n, dtype=a.dtype)
+        base[::2] = a
+        return base[::2]
+    if disposicion == "fortran":
+        base = np.zeros((FILAS_FORTRAN, n), dtype=a.dtype, order="F")
+        base[0] = a
+        return base[0]
+    if disposicion == "desalineado":
+        buffer = np.zeros(n * a.itemsize + 1, dtype=np.uint8)
+        salida = buffer[1:].view(a.dtype)
+        salida[:] = a
+        return salida
+    raise ValueError(f"disposición desconocida: {disposicion} (opciones: {DISPOSICIONES})")
+
+
+def preparar(args: tuple, dtype: str = "float64", disposicion: str = "contiguo"):
+    """
+    Convierte los argumentos de un problema: los arreglos al dtype (astype, que
+    trunca a entero) y disposición pedidos; los escalares float a int si el dtype
+    es entero (para que a * c no promueva a float64 y se mida otro dtype).
+    """
+    entero = np.dtype(dtype).kind == "i"
+    salida = []
+    for x in args:
+        if isinstance(x, np.ndarray):
+            x = con_disposicion(x.astype(dtype), disposicion)
+        elif entero and isinstance(x, float):
+            x = int(x)
+        salida.append(x)
+    return tuple(salida)
+
+
+def describir(a: np.ndarray):
+    """Texto corto con dtype, stride y alineación (para verificar las disposiciones)."""
+    return (f"{a.dtype} strides={a.strides} C={a.flags.c_contiguous} "
+            f"alineado={a.flags.aligned}")
+
+
+if __name__ == "__main__":
+    a = np.arange(8, dtype=float)
+    for dtype in DTYPES:
+        for disposicion in DISPOSICIONES:
+            b = preparar((a,), dtype, disposicion)[0]
+            assert np.array_equal(b, a.astype(dtype))
+            print(f"{disposicion:<12} {describir(b)}")
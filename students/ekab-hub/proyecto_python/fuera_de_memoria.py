@@ -0,0 +1,208 @@
+"""
+Ejecución fuera de memoria (out-of-core) de p1_np, p2_np y p3_np.
+
+Los kernels reciben un ndarray completo en RAM. Aquí la entrada es un archivo
+.npy abierto con np.load(mmap_mode="r") (puede ser más grande que la RAM) y
+se procesa por bloques de `bloque` elementos:
+
+- p1: salida[i:j] = p1_np(a[i:j], c)
+- p2: la ventana necesita k-1 elementos más allá del bloque, así que se lee
+      a[i : j + k - 1] y se obtienen exactamente j - i sumas (sin huecos ni repetidos)
+- p3: el tamaño de la salida no se conoce; se reserva n, se escribe de forma
+      contigua y al final se reescribe el encabezado .npy con el tamaño real y
+      se trunca el archivo
+
+La salida es un .npy abierto con np.lib.format.open_memmap, así que también
+puede ser más grande que la RAM.
+
+GB/s se compara contra la lectura secuencial cruda del mismo archivo. Antes de
+cada medición se sacan los archivos del page cache (posix_fadvise DONTNEED),
+para medir disco y no RAM ("frío"); con --caliente se omite ese paso.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from proyecto_python import p1_np, p2_np, p3_np
+from ventanas import _dtype_suma
+
+BLOQUE = 1 << 22  # 4M float64 = 32 MB
+
+
+# Archivos
+
+def crear_entrada(ruta: str, n: int, dtype=np.float64, bloque: int = BLOQUE):
+    """Escribe linspace(0, 1000, n) en un .npy, por bloques (nunca todo en RAM)."""
+    a = np.lib.format.open_memmap(ruta, mode="w+", dtype=dtype, shape=(n,))
+    paso = 1000 / max(n - 1, 1)
+    for i in range(0, n, bloque):
+        j = min(i + bloque, n)
+        a[i:j] = np.arange(i, j) * paso
+    a.flush()
+    del a
+
+
+def _abrir_salida(ruta: str, n: int, dtype):
+    return np.lib.format.open_memmap(ruta, mode="w+", dtype=dtype, shape=(n,))
+
+
+def _recortar_npy(ruta: str, offset: int, dtype: np.dtype, m: int):
+    """
+    Reescribe el encabezado .npy con shape (m,) y trunca el archivo.
+    El encabezado nuevo se rellena con espacios hasta la longitud original,
+    así los datos no se mueven. El memmap de la salida ya debe estar cerrado.
+    """
+    encabezado = repr({"descr": np.lib.format.dtype_to_descr(dtype),
+                       "fortran_order": False, "shape": (m,)})
+    with open(ruta, "r+b") as f:
+        version = f.read(8)[6:8]
+        tam_largo = 2 if version == b"\x01\x00" else 4
+        inicio_encabezado = 8 + tam_largo
+        f.seek(inicio_encabezado)
+        f.write(encabezado.ljust(offset - inicio_encabezado - 1).encode("latin1") + b"\n")
+        f.truncate(offset + m * dtype.itemsize)
+
+
+def _sacar_de_cache(*rutas):
+    """Pide al kernel que descarte las páginas del archivo (Linux)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for ruta in rutas:
+        if not os.path.exists(ruta):
+            continue
+        fd = os.open(ruta, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+# Drivers por bloques
+
+def p1_fuera(entrada: str, salida: str, c: float = 2.0, bloque: int = BLOQUE):
+    a = np.load(entrada, mmap_mode="r")
+    out = _abrir_salida(salida, len(a), np.result_type(a.dtype, c))  # el dtype de a * c
+    for i in range(0, len(a), bloque):
+        j = min(i + bloque, len(a))
+        out[i:j] = p1_np(a[i:j], c)
+    out.flush()
+    return len(a)
+
+
+def p2_fuera(entrada: str, salida: str, k: int = 3, bloque: int = BLOQUE):
+    a = np.load(entrada, mmap_mode="r")
+    m = max(len(a) - k + 1, 0)  # k > n: ninguna ventana completa, .npy vacío
+    out = _abrir_salida(salida, m, _dtype_suma(a))
+    for i in range(0, m, bloque):
+        j = min(i + bloque, m)
+        # k - 1 elementos de traslape con el siguiente bloque
+        out[i:j] = p2_np(np.asarray(a[i:j + k - 1]), k)
+    out.flush()
+    return m
+
+
+def p3_fuera(entrada: str, salida: str, umbral: float = 10.0, bloque: int = BLOQUE):
+    a = np.load(entrada, mmap_mode="r")
+    tipo = a.dtype if a.dtype.kind == "f" else np.float64  # sin() de enteros da float64
+    out = _abrir_salida(salida, len(a), tipo)
+    m = 0
+    for i in range(0, len(a), bloque):
+        r = p3_np(np.asarray(a[i:i + bloque]), umbral)
+        out[m:m + len(r)] = r
+        m += len(r)
+    offset, dtype = out.offset, out.dtype
+    out.flush()
+    del out  # cierra el mmap: truncar un archivo mapeado deja páginas sin respaldo (SIGBUS)
+    _recortar_npy(salida, offset, dtype, m)
+    return m
+
+
+DRIVERS = {
+    "p1": (p1_fuera, p1_np, {"c": 2.0}),
+    "p2": (p2_fuera, p2_np, {"k": 3}),
+    "p3": (p3_fuera, p3_np, {"umbral": 10.0}),
+}
+
+
+# Verificación
+
+def _check_fuera(directorio: str):
+    entrada = os.path.join(directorio, "chico.npy")
+    salida = os.path.join(directorio, "chico_salida.npy")
+    for dtype in (np.float64, np.int64):  # con enteros la salida no debe truncarse
+        crear_entrada(entrada, 10_001, dtype=dtype)
+        a = np.load(entrada)
+        for nombre, (fuera, kernel, parametros) in DRIVERS.items():
+            fuera(entrada, salida, bloque=1000, **parametros)
+            r = np.load(salida)
+            esperado = kernel(a, *parametros.values())
+            # allclose: las sumas de p2 por bloques redondean distinto que sobre el arreglo completo
+            print(f"{nombre.upper()} fuera de memoria igual ({np.dtype(dtype)}):",
+                  r.dtype == esperado.dtype and np.allclose(r, esperado))
+    crear_entrada(entrada, 2)
+    p2_fuera(entrada, salida, k=3)
+    print("P2 fuera de memoria con k > n vacío:", np.load(salida).shape == (0,))
+
+
+# Benchmark
+
+def lectura_cruda(ruta: str, bloque_bytes: int = 32 << 20):
+    """Segundos para leer el archivo completo con readinto, sin procesar."""
+    buffer = bytearray(bloque_bytes)
+    inicio = time.perf_counter()
+    with open(ruta, "rb", buffering=0) as f:
+        while f.readinto(buffer):
+            pass
+    return time.perf_counter() - inicio
+
+
+def benchmark(directorio: str, gb: float = 2.0, bloque: int = BLOQUE, frio: bool = True):
+    n = int(gb * 2**30 / 8)
+    entrada = os.path.join(directorio, "entrada.npy")
+    salida = os.path.join(directorio, "salida.npy")
+    print(f"Creando {entrada} ({n:,} float64 = {n * 8 / 2**30:.2f} GB)...")
+    crear_entrada(entrada, n, bloque=bloque)
+    bytes_entrada = os.path.getsize(entrada)
+
+    if frio:
+        _sacar_de_cache(entrada)
+    t_crudo = lectura_cruda(entrada)
+    gbs_crudo = bytes_entrada / t_crudo / 1e9
+    print(f"Lectura secuencial cruda: {t_crudo:.2f}s = {gbs_crudo:.2f} GB/s ({'frío' if frio else 'caliente'})")
+
+    print(f"{'kernel':<7} {'tiempo':>8} {'GB/s':>7} {'vs lectura':>11} {'salida':>10}")
+    for nombre, (fuera, _, parametros) in DRIVERS.items():
+        if frio:
+            _sacar_de_cache(entrada, salida)
+        inicio = time.perf_counter()
+        m = fuera(entrada, salida, bloque=bloque, **parametros)
+        if frio:
+            _sacar_de_cache(salida)  # incluye el fsync de la salida
+        t = time.perf_counter() - inicio
+        gbs = bytes_entrada / t / 1e9
+        print(f"{nombre:<7} {t:>7.2f}s {gbs:>7.2f} {gbs / gbs_crudo:>10.0%} {m * 8 / 2**30:>8.2f}GB")
+        os.remove(salida)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="p1-p3 por bloques sobre archivos .npy (memmap)")
+    parser.add_argument("--gb", type=float, default=2.0, help="Tamaño de la entrada en GB")
+    parser.add_argument("--bloque", type=int, default=BLOQUE, help="Elementos por bloque")
+    parser.add_argument("--dir", help="Directorio para los archivos (por defecto uno temporal)")
+    parser.add_argument("--caliente", action="store_true", help="No sacar los archivos del page cache")
+    args = parser.parse_args()
+
+    directorio = args.dir or tempfile.mkdtemp(prefix="fuera_de_memoria_")
+    os.makedirs(directorio, exist_ok=True)
+    try:
+        _check_fuera(directorio)
+        benchmark(directorio, args.gb, args.bloque, frio=not args.caliente)
+    finally:
+        if not args.dir:
+            shutil.rmtree(directorio)
@@ -0,0 +1,71 @@
+"""
+Memoria pico y tiempo de p3_np vs p3_np_bloques.
+
+p3_np crea arreglos temporales de tamaño n (sin(a), a**2, la suma, la máscara)
+antes de filtrar. p3_np_bloques procesa bloques de BLOQUE_P3 elementos con
+buffers reutilizados, así que lo único que crece con n es la salida.
+
+Cada medición corre en un proceso nuevo para que ru_maxrss (memoria pico del
+proceso) no arrastre picos de mediciones anteriores. Se reportan:
+- tiempo: mejor de `repeticiones`
+- RSS extra: ru_maxrss durante la llamada menos ru_maxrss con la entrada ya creada
+- tracemalloc: pico de memoria reservada (NumPy reporta sus arreglos a tracemalloc)
+"""
+
+import argparse
+import resource
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from proyecto_python import p3_np, p3_np_bloques
+
+METODOS = {
+    "p3_np": p3_np,
+    "p3_np_bloques": p3_np_bloques,
+}
+
+
+def medir(metodo: str, n: int, repeticiones: int = 3, umbral: float = 10.0):
+    """(segundos, MB de RSS extra, MB pico de tracemalloc, elementos en la salida)"""
+    a = np.linspace(0, 1000, n, dtype=float)
+    fn = METODOS[metodo]
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    salida = fn(a, umbral)
+    rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    m = len(salida)
+    del salida
+
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        fn(a, umbral)
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    fn(a, umbral)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return mejor, (rss1 - rss0) / 1024, pico / 2**20, m  # ru_maxrss en KB (Linux)
+
+
+def benchmark(ns=(200_000, 1_000_000, 10_000_000, 100_000_000), repeticiones: int = 3):
+    print(f"{'n':>12} {'método':<14} {'tiempo':>9} {'ns/elem':>8} {'RSS extra':>10} "
+          f"{'tracemalloc':>12} {'salida':>9}")
+    for n in ns:
+        for metodo in METODOS:
+            # max_tasks_per_child=1: un proceso limpio por medición
+            with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+                t, rss, pico, m = executor.submit(medir, metodo, n, repeticiones).result()
+            print(f"{n:>12,} {metodo:<14} {t * 1e3:>7.1f}ms {t / n * 1e9:>8.2f} {rss:>8.1f}MB "
+                  f"{pico:>10.1f}MB {m * 8 / 2**20:>7.1f}MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="p3: temporales completos vs bloques con out=")
+    parser.add_argument("--ns", default="200000,1000000,10000000,100000000")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(tuple(int(n) for n in args.ns.split(",")), args.repeticiones)
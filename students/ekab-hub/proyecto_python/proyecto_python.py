@@ -1,39 +1,160 @@
 import numpy as np
 import timeit
 import math
+import tracemalloc
+from collections import deque
 import json
+import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from registro import estrategia, problema
+from ventanas import _dtype_suma, suma_ventana
+
+def _drenar(generador):
+    # Consume el generador sin guardar nada: mide el trabajo, no la creación ni una lista
+    deque(generador, maxlen=0)
+
+# Memoria: pasada aparte con tracemalloc (nunca mientras se mide tiempo).
+# NumPy reporta los buffers de sus arreglos a tracemalloc en su propio dominio
+# (np.lib.tracemalloc_domain), así que se pueden separar de los objetos de Python
+
+_NUMPY = tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)
+_PYTHON = tracemalloc.DomainFilter(False, np.lib.tracemalloc_domain)
+_SIN_TRACEMALLOC = tracemalloc.Filter(False, tracemalloc.__file__)  # las propias fotos
+
+def memoria_por_dominio(fn):
+    # (pico total, retenido en objetos de Python, retenido en buffers de NumPy) en bytes.
+    # Retenido = lo que sigue vivo en el resultado de fn(); solo cuenta lo creado por fn.
+    # Si tracemalloc ya estaba activo (lo inició quien llama) se descuenta lo previo
+    # y se deja activo
+    ya_activo = tracemalloc.is_tracing()
+    if not ya_activo:
+        tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot() if ya_activo else None
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        resultado = fn()
+        pico = tracemalloc.get_traced_memory()[1] - base
+        foto = tracemalloc.take_snapshot()
+    finally:
+        if not ya_activo:
+            tracemalloc.stop()
+    del resultado
+    def total(f, filtro):
+        return sum(t.size for t in f.filter_traces([filtro, _SIN_TRACEMALLOC]).traces) if f else 0
+    retenido = [total(foto, filtro) - total(antes, filtro) for filtro in (_PYTHON, _NUMPY)]
+    return pico, retenido[0], retenido[1]
+
+# Paralelo por bloques: los ufuncs de NumPy sueltan el GIL, así que varios
+# hilos pueden trabajar sobre bloques distintos del mismo arreglo
+
+_pools = {}
+
+def _en_hilos(fn, n: int, hilos: int = None):
+    # Llama fn(i, j) sobre `hilos` bloques contiguos de [0, n) en un pool reutilizado
+    hilos = hilos or os.cpu_count() or 1
+    if hilos not in _pools:
+        _pools[hilos] = ThreadPoolExecutor(max_workers=hilos)
+    cortes = np.linspace(0, n, hilos + 1).astype(int)
+    futuros = [_pools[hilos].submit(fn, i, j) for i, j in zip(cortes[:-1], cortes[1:]) if i < j]
+    for f in futuros:
+        f.result()
+
+def cerrar_pools():
+    # Apaga los pools de _en_hilos: sus hilos quedarían vivos entre barridos
+    # y afectarían las mediciones siguientes. El próximo _en_hilos crea otros
+    while _pools:
+        _pools.popitem()[1].shutdown(wait=True)
+
+def escalamiento_par(n=10_000_000, hilos_max=None, number=3):
+    # Tiempo de p1..p3 _par con 1, 2, 4, ... hilos y speedup contra 1 hilo
+    hilos_max = hilos_max or os.cpu_count() or 1
+    lista_hilos = sorted({2 ** i for i in range(hilos_max.bit_length()) if 2 ** i <= hilos_max} | {hilos_max})
+    a1 = np.arange(n, dtype=float)
+    a3 = np.linspace(0, 1000, n, dtype=float)
+    casos = [
+        ("p1", lambda h: p1_np_par(a1, 2.0, h)),
+        ("p2", lambda h: p2_np_par(a1, 3, h)),
+        ("p3", lambda h: p3_np_par(a3, 10.0, h)),
+    ]
+    resultados = {}
+    try:
+        for nombre, fn in casos:
+            tiempos = [min(timeit.repeat(lambda: fn(h), number=1, repeat=number)) for h in lista_hilos]
+            resultados[nombre] = dict(zip(lista_hilos, tiempos))
+            print(nombre, " ".join(f"{h}h={t * 1e3:.1f}ms({tiempos[0] / t:.2f}x)"
+                                  for h, t in zip(lista_hilos, tiempos)))
+    finally:
+        cerrar_pools()
+    return resultados
+
 # Problema 1
 
+@problema("p1")
+def datos_p1(n: int):
+    return (np.arange(n, dtype=float), 2.0)
+
+@estrategia("p1", "for")
 def p1_for(a: np.ndarray, c: float):
     resultado = []
     for x in a:
         resultado.append(x*c)
     return resultado
 
+@estrategia("p1", "comp")
 def p1_comp(a: np.ndarray, c: float):
     return [x * c for x in a]
 
+@estrategia("p1", "gen", perezosa=True)
 def p1_gen(a: np.ndarray, c: float):
     for x in a:
         yield x * c
 
+@estrategia("p1", "numpy")
 def p1_np(a: np.ndarray, c: float):
     return a * c
 
+@estrategia("p1", "par")
+def p1_np_par(a: np.ndarray, c: float, hilos: int = None):
+    out = np.empty(len(a), dtype=np.result_type(a, c))
+    def bloque(i, j):
+        np.multiply(a[i:j], c, out=out[i:j])
+    _en_hilos(bloque, len(a), hilos)
+    return out
+
 def tiempo_p1(n=100_000, num = 5):
     a = np.arange(n, dtype=float)
     c = 2.0
     return (
         timeit.timeit(lambda: p1_for(a, c), number=num),
         timeit.timeit(lambda: p1_comp(a, c), number=num),
-        timeit.timeit(lambda: p1_gen(a, c), number=num),
+        timeit.timeit(lambda: _drenar(p1_gen(a, c)), number=num),
         timeit.timeit(lambda: p1_np(a, c), number=num),
+        timeit.timeit(lambda: p1_np_par(a, c), number=num),
     )
 
+def memoria_p1(n=100_000):
+    # Bytes pico por elemento, mismo orden que tiempo_p1 (el generador se materializa con list)
+    a = np.arange(n, dtype=float)
+    c = 2.0
+    return tuple(memoria_por_dominio(fn)[0] / n for fn in (
+        lambda: p1_for(a, c),
+        lambda: p1_comp(a, c),
+        lambda: list(p1_gen(a, c)),
+        lambda: p1_np(a, c),
+        lambda: p1_np_par(a, c),
+    ))
+
 # Problema 2
+
+@problema("p2")
+def datos_p2(n: int):
+    return (np.arange(n, dtype=float), 3)
+
+@estrategia("p2", "for")
 def p2_for(a: np.ndarray, k: int = 3):
     assert k % 2 == 1
     n = len(a)
@@ -44,6 +165,7 @@ def p2_for(a: np.ndarray, k: int = 3):
         resultado.append(float(np.sum(ventana)))
     return resultado
 
+@estrategia("p2", "comp")
 def p2_comp(a: np.ndarray, k: int = 3):
     assert k % 2 == 1
     n = len(a)
@@ -53,6 +175,7 @@ def p2_comp(a: np.ndarray, k: int = 3):
         for i in range(mitad, n - mitad)
     ]
 
+@estrategia("p2", "gen", perezosa=True)
 def p2_gen(a: np.ndarray, k: int = 3):
     assert k % 2 == 1
     n = len(a)
@@ -60,7 +183,16 @@ def p2_gen(a: np.ndarray, k: int = 3):
     for i in range(mitad, n - mitad):
         yield float(np.sum(a[i - mitad: i + mitad + 1]))
 
+@estrategia("p2", "numpy")
 def p2_np(a: np.ndarray, k: int = 3):
+    assert k % 2 == 1
+    if k > len(a):  # como la versión original: ninguna ventana completa
+        return np.empty(0, dtype=_dtype_suma(a))
+    return suma_ventana(a, k)
+
+@estrategia("p2", "numpy_vstack")
+def p2_np_vstack(a: np.ndarray, k: int = 3):
+    # Versión original: O(n·k) memoria y tiempo (ver ventanas.py)
     assert k % 2 == 1
     n = len(a)
     mitad = k // 2
@@ -69,18 +201,47 @@ def p2_np(a: np.ndarray, k: int = 3):
     stacked = np.vstack(slices)
     return stacked.sum(axis=0)
 
+@estrategia("p2", "par")
+def p2_np_par(a: np.ndarray, k: int = 3, hilos: int = None):
+    assert k % 2 == 1
+    m = max(len(a) - k + 1, 0)
+    out = np.empty(m, dtype=_dtype_suma(a))
+    def bloque(i, j):
+        # halo: la última ventana del bloque necesita k - 1 elementos del siguiente
+        out[i:j] = suma_ventana(a[i:j + k - 1], k)
+    _en_hilos(bloque, m, hilos)
+    return out
+
 def tiempo_p2(n=100_000, number=3):
     a = np.arange(n, dtype=float)
     k = 3
     return (
         timeit.timeit(lambda: p2_for(a, k), number=number),
         timeit.timeit(lambda: p2_comp(a, k), number=number),
-        timeit.timeit(lambda: list(p2_gen(a, k)), number=number),
+        timeit.timeit(lambda: _drenar(p2_gen(a, k)), number=number),
         timeit.timeit(lambda: p2_np(a, k), number=number),
+        timeit.timeit(lambda: p2_np_par(a, k), number=number),
     )
 
+def memoria_p2(n=100_000):
+    a = np.arange(n, dtype=float)
+    k = 3
+    return tuple(memoria_por_dominio(fn)[0] / n for fn in (
+        lambda: p2_for(a, k),
+        lambda: p2_comp(a, k),
+        lambda: list(p2_gen(a, k)),
+        lambda: p2_np(a, k),
+        lambda: p2_np_par(a, k),
+    ))
+
 # Problema 3
 
+@problema("p3")
+def datos_p3(n: int):
+    return (np.linspace(0, 1000, n, dtype=float), 10.0)
+
+
+@estrategia("p3", "for")
 def p3_for(a: np.ndarray, umbral: float):
     resultado = []
     for x in a:
@@ -89,6 +250,7 @@ def p3_for(a: np.ndarray, umbral: float):
             resultado.append(t)
     return resultado
 
+@estrategia("p3", "comp")
 def p3_comp(a: np.ndarray, umbral: float):
     return [
         (math.sin(x) + x**2)
@@ -96,27 +258,89 @@ def p3_comp(a: np.ndarray, umbral: float):
         if (math.sin(x) + x**2) > umbral
     ]
 
+@estrategia("p3", "gen", perezosa=True)
 def p3_gen(a: np.ndarray, umbral: float):
     for x in a:
         t = math.sin(x) + x**2
         if t > umbral:
             yield t
 
+@estrategia("p3", "numpy")
 def p3_np(a: np.ndarray, umbral: float):
     t = np.sin(a) + a**2
     mascara = t > umbral
     return t[mascara]
 
+BLOQUE_P3 = 1 << 15  # 32K elementos: 3 buffers de 256 KB caben en L2
+
+@estrategia("p3", "numpy_bloques")
+def p3_np_bloques(a: np.ndarray, umbral: float, bloque: int = BLOQUE_P3):
+    # Igual que p3_np pero por bloques con buffers reutilizados (out=):
+    # sin temporales de tamaño n. La salida crece con ndarray.resize (realloc:
+    # en arreglos grandes suele crecer en su lugar, sin copia ni doble pico)
+    tipo = a.dtype if a.dtype.kind == "f" else np.float64  # sin() de enteros da float64
+    bloque = max(min(bloque, len(a)), 1)  # buffers no más grandes que la entrada
+    t = np.empty(bloque, dtype=tipo)
+    cuadrado = np.empty(bloque, dtype=tipo)
+    mascara = np.empty(bloque, dtype=bool)
+    salida = np.empty(bloque, dtype=tipo)
+    m = 0
+    for inicio in range(0, len(a), bloque):
+        x = a[inicio:inicio + bloque]
+        b = len(x)
+        np.sin(x, out=t[:b])
+        np.square(x, out=cuadrado[:b])
+        np.add(t[:b], cuadrado[:b], out=t[:b])
+        np.greater(t[:b], umbral, out=mascara[:b])
+        cuenta = np.count_nonzero(mascara[:b])
+        if m + cuenta > len(salida):
+            salida.resize(min(len(a), max(2 * len(salida), m + cuenta)), refcheck=False)
+        np.compress(mascara[:b], t[:b], out=salida[m:m + cuenta])
+        m += cuenta
+    salida.resize(m, refcheck=False)
+    return salida
+
+@estrategia("p3", "par")
+def p3_np_par(a: np.ndarray, umbral: float, hilos: int = None):
+    # Fase 1: cada hilo filtra su bloque. Fase 2: con los tamaños se calcula
+    # dónde empieza cada bloque en la salida y se copian en paralelo.
+    partes = {}
+    def filtrar(i, j):
+        partes[i] = p3_np_bloques(a[i:j], umbral)
+    _en_hilos(filtrar, len(a), hilos)
+    inicios = sorted(partes)
+    offsets = np.cumsum([0] + [len(partes[i]) for i in inicios])
+    out = np.empty(offsets[-1], dtype=partes[inicios[0]].dtype if inicios else a.dtype)
+    destino = dict(zip(inicios, offsets))
+    def copiar(i, j):
+        out[destino[i]:destino[i] + len(partes[i])] = partes[i]
+    _en_hilos(copiar, len(a), hilos)
+    return out
+
 def tiempo_p3(n=200_000, number=3):
     a = np.linspace(0, 1000, n, dtype=float)
     umbral = 10.0
     return (
         timeit.timeit(lambda: p3_for(a, umbral), number=number),
         timeit.timeit(lambda: p3_comp(a, umbral), number=number),
-        timeit.timeit(lambda: list(p3_gen(a, umbral)), number=number),
+        timeit.timeit(lambda: _drenar(p3_gen(a, umbral)), number=number),
         timeit.timeit(lambda: p3_np(a, umbral), number=number),
+        timeit.timeit(lambda: p3_np_par(a, umbral), number=number),
     )
 
+def memoria_p3(n=200_000):
+    # par: cada hilo reserva los buffers de p3_np_bloques, ~17 B por elemento de
+    # min(BLOQUE_P3, n / hilos); con n chico ese piso fijo domina los B/elem
+    a = np.linspace(0, 1000, n, dtype=float)
+    umbral = 10.0
+    return tuple(memoria_por_dominio(fn)[0] / n for fn in (
+        lambda: p3_for(a, umbral),
+        lambda: p3_comp(a, umbral),
+        lambda: list(p3_gen(a, umbral)),
+        lambda: p3_np(a, umbral),
+        lambda: p3_np_par(a, umbral),
+    ))
+
 # Verificación de tiempos
 
 def _check_p1():
@@ -126,10 +350,12 @@ def _check_p1():
     r_comp = np.array(p1_comp(a, c))
     r_gen = np.array(list(p1_gen(a, c)))
     r_np = p1_np(a, c)
+    r_par = p1_np_par(a, c, hilos=3)
     print("P1 iguales:",
           np.allclose(r_for, r_comp),
           np.allclose(r_for, r_gen),
-          np.allclose(r_for, r_np))
+          np.allclose(r_for, r_np),
+          np.allclose(r_for, r_par))
 
 def _check_p2():
     a = np.arange(10, dtype=float)
@@ -138,10 +364,12 @@ def _check_p2():
     r_comp = np.array(p2_comp(a, k))
     r_gen = np.array(list(p2_gen(a, k)))
     r_np = p2_np(a, k)
+    r_par = p2_np_par(a, k, hilos=3)
     print("P2 iguales:",
           np.allclose(r_for, r_comp),
           np.allclose(r_for, r_gen),
-          np.allclose(r_for, r_np))
+          np.allclose(r_for, r_np),
+          np.allclose(r_for, r_par))
 
 def _check_p3():
     a = np.linspace(0, 100, 50, dtype=float)
@@ -150,10 +378,13 @@ def _check_p3():
     r_comp = np.array(p3_comp(a, umbral))
     r_gen = np.array(list(p3_gen(a, umbral)))
     r_np = p3_np(a, umbral)
+    r_bloques = p3_np_bloques(a, umbral, bloque=16)
     print("P3 iguales:",
           np.allclose(r_for, r_comp),
           np.allclose(r_for, r_gen),
-          np.allclose(r_for, r_np))
+          np.allclose(r_for, r_np),
+          np.array_equal(r_np, r_bloques),
+          np.array_equal(r_np, p3_np_par(a, umbral, hilos=3)))
 
 if __name__ == "__main__":
     _check_p1()
@@ -162,6 +393,11 @@ if __name__ == "__main__":
     print("P1 tiempos:", tiempo_p1())
     print("P2 tiempos:", tiempo_p2())
     print("P3 tiempos:", tiempo_p3())
+    print("P1 bytes/elem:", memoria_p1())
+    print("P2 bytes/elem:", memoria_p2())
+    print("P3 bytes/elem:", memoria_p3())
+    print("Escalamiento _par (n=10^7):")
+    escalamiento_par()
 
 def guardar_en_json():
     n1, n2_p2, n3 = 100_000, 100_000, 200_000
@@ -170,6 +406,14 @@ def guardar_en_json():
     t1 = tiempo_p1(n=n1, num=number_p1)
     t2 = tiempo_p2(n=n2_p2, number=number_p2)
     t3 = tiempo_p3(n=n3, number=number_p3)
+    # Memoria en una pasada aparte, después de medir todos los tiempos
+    m1, m2, m3 = memoria_p1(n1), memoria_p2(n2_p2), memoria_p3(n3)
+    cerrar_pools()
+
+    def entrada(t, number, n, bytes_por_elemento):
+        return {"s_total": t, "repetitions": number, "s_per_call": t / number,
+                "ns_per_element": t / number / n * 1e9,
+                "bytes_per_element": bytes_por_elemento}
 
     results = {
         "metadata": {
@@ -185,34 +429,25 @@ def guardar_en_json():
         },
         "results": {
             "p1": {
-                "for":   {"s_total": t1[0], "repetitions": number_p1,
-                          "s_per_call": t1[0] / number_p1},
-                "comp":  {"s_total": t1[1], "repetitions": number_p1,
-                          "s_per_call": t1[1] / number_p1},
-                "gen":   {"s_total": t1[2], "repetitions": number_p1,
-                          "s_per_call": t1[2] / number_p1},
-                "numpy": {"s_total": t1[3], "repetitions": number_p1,
-                          "s_per_call": t1[3] / number_p1},
+                "for":   entrada(t1[0], number_p1, n1, m1[0]),
+                "comp":  entrada(t1[1], number_p1, n1, m1[1]),
+                "gen":   entrada(t1[2], number_p1, n1, m1[2]),
+                "numpy": entrada(t1[3], number_p1, n1, m1[3]),
+                "par":   entrada(t1[4], number_p1, n1, m1[4]),
             },
             "p2": {
-                "for":   {"s_total": t2[0], "repetitions": number_p2,
-                          "s_per_call": t2[0] / number_p2},
-                "comp":  {"s_total": t2[1], "repetitions": number_p2,
-                          "s_per_call": t2[1] / number_p2},
-                "gen":   {"s_total": t2[2], "repetitions": number_p2,
-                          "s_per_call": t2[2] / number_p2},
-                "numpy": {"s_total": t2[3], "repetitions": number_p2,
-                          "s_per_call": t2[3] / number_p2},
+                "for":   entrada(t2[0], number_p2, n2_p2, m2[0]),
+                "comp":  entrada(t2[1], number_p2, n2_p2, m2[1]),
+                "gen":   entrada(t2[2], number_p2, n2_p2, m2[2]),
+                "numpy": entrada(t2[3], number_p2, n2_p2, m2[3]),
+                "par":   entrada(t2[4], number_p2, n2_p2, m2[4]),
             },
             "p3": {
-                "for":   {"s_total": t3[0], "repetitions": number_p3,
-                          "s_per_call": t3[0] / number_p3},
-                "comp":  {"s_total": t3[1], "repetitions": number_p3,
-                          "s_per_call": t3[1] / number_p3},
-                "gen":   {"s_total": t3[2], "repetitions": number_p3,
-                          "s_per_call": t3[2] / number_p3},
-                "numpy": {"s_total": t3[3], "repetitions": number_p3,
-                          "s_per_call": t3[3] / number_p3},
+                "for":   entrada(t3[0], number_p3, n3, m3[0]),
+                "comp":  entrada(t3[1], number_p3, n3, m3[1]),
+                "gen":   entrada(t3[2], number_p3, n3, m3[2]),
+                "numpy": entrada(t3[3], number_p3, n3, m3[3]),
+                "par":   entrada(t3[4], number_p3, n3, m3[4]),
             },
         },
     }
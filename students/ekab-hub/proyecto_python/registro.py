@@ -0,0 +1,42 @@
+"""
+Registro de problemas y estrategias de tarea_tiempos (ver arnes.py).
+
+    @problema("p1")
+    def datos_p1(n):
+        return (np.arange(n, dtype=float), 2.0)      # argumentos de cada estrategia
+
+    @estrategia("p1", "numpy")
+    def p1_np(a, c):
+        ...
+"""
+
+from collections import namedtuple
+
+Estrategia = namedtuple("Estrategia", ["problema", "nombre", "fn", "perezosa"])
+
+PROBLEMAS = {}    # nombre -> función n -> tupla de argumentos
+ESTRATEGIAS = {}  # (problema, nombre) -> Estrategia
+
+
+def problema(nombre: str):
+    """Registra la función que genera los datos del problema para un n dado."""
+    def registrar(generar):
+        PROBLEMAS[nombre] = generar
+        return generar
+    return registrar
+
+
+def estrategia(nombre_problema: str, nombre: str, perezosa: bool = False):
+    """
+    Registra una estrategia. perezosa=True para generadores: el arnés los
+    consume completos (drenados y como lista), si no solo se mediría crear
+    el generador.
+    """
+    def registrar(fn):
+        ESTRATEGIAS[(nombre_problema, nombre)] = Estrategia(nombre_problema, nombre, fn, perezosa)
+        return fn
+    return registrar
+
+
+def estrategias_de(nombre_problema: str):
+    return [e for (p, _), e in ESTRATEGIAS.items() if p == nombre_problema]
@@ -0,0 +1,266 @@
+"""
+Agregaciones sobre ventanas deslizantes de tamaño k en O(n).
+
+p2_np apilaba k rebanadas desplazadas con np.vstack: memoria y tiempo O(n·k).
+Aquí:
+- suma y media: sumas acumuladas (cumsum), por bloques para que el error de
+  redondeo dependa del tamaño del bloque y no de n (con k <= K_DESPLAZADAS,
+  k - 1 sumas de rebanadas desplazadas, que para k chico son más rápidas)
+- mínimo y máximo: algoritmo de van Herk / Gil-Werman (prefijos y sufijos por
+  bloques de k, vectorizado) o una deque monótona (referencia en Python puro)
+- cualquier otra reducción: sliding_window_view (sin copiar, pero O(n·k) cálculo)
+
+Modos de borde:
+- "valid":   solo ventanas completas, salida de n - k + 1
+- "same":    salida de n, se rellena con `valor_borde` (0 por defecto, como np.convolve)
+- "reflect": salida de n, se refleja el arreglo en los bordes (d c b | a b c d | c b a)
+
+En "same" y "reflect" la ventana de la salida i cubre a[i - k//2 : i - k//2 + k],
+así que con k par la ventana queda un elemento más hacia la izquierda.
+Soporta float64, float32 y enteros. La suma siempre acumula en float64 o int64;
+la salida queda en float32 si la entrada es float32 y en int64 si es entera
+(como np.sum, para que int32 no se desborde).
+"""
+
+import argparse
+import collections
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+MODOS = ("valid", "same", "reflect")
+BLOQUE = 1 << 16
+K_DESPLAZADAS = 5  # hasta este k, k - 1 sumas desplazadas ganan a cumsum
+
+
+# Bordes
+
+def rellenar(a: np.ndarray, k: int, modo: str = "valid", valor_borde: float = 0.0):
+    """Arreglo tal que sus ventanas "valid" son las ventanas pedidas en `modo`."""
+    if k < 1:
+        raise ValueError("k debe ser >= 1")
+    if modo not in MODOS:
+        raise ValueError(f"modo desconocido: {modo} (opciones: {MODOS})")
+    a = np.asarray(a)
+    if modo == "valid":
+        if k > len(a):
+            raise ValueError(f"k={k} es mayor que n={len(a)}")
+        return a
+    izq, der = k // 2, k - 1 - k // 2
+    if modo == "same":
+        return np.pad(a, (izq, der), mode="constant", constant_values=valor_borde)
+    if len(a) < 2 and k > 1:
+        raise ValueError("reflect necesita al menos 2 elementos")
+    return np.pad(a, (izq, der), mode="reflect")
+
+
+# Suma y media
+
+def _dtype_acumulador(a: np.ndarray):
+    return np.float64 if a.dtype.kind == "f" else np.result_type(a.dtype, np.int64)
+
+
+def _dtype_suma(a: np.ndarray):
+    """dtype de la salida de suma_ventana: el de a si es flotante, el acumulador si es entero."""
+    return a.dtype if a.dtype.kind == "f" else _dtype_acumulador(a)
+
+
+def _suma_valid(b: np.ndarray, k: int, bloque: int = BLOQUE):
+    """Sumas de las n - k + 1 ventanas completas de b, con cumsum por bloques."""
+    m = len(b) - k + 1
+    acum = _dtype_acumulador(b)
+    if k <= K_DESPLAZADAS:
+        salida = b[:m].astype(acum)
+        for s in range(1, k):
+            salida += b[s:s + m]
+        return salida.astype(_dtype_suma(b), copy=False)
+    salida = np.empty(m, dtype=_dtype_suma(b))
+    c = np.empty(bloque + k, dtype=acum)
+    c[0] = 0
+    for inicio in range(0, m, bloque):
+        fin = min(inicio + bloque, m)
+        trozo = b[inicio:fin + k - 1]
+        # c[j] = suma de trozo[:j]; la ventana que empieza en j es c[j + k] - c[j]
+        np.cumsum(trozo, dtype=acum, out=c[1:len(trozo) + 1])
+        salida[inicio:fin] = c[k:len(trozo) + 1] - c[:fin - inicio]
+    return salida
+
+
+def suma_ventana(a: np.ndarray, k: int, modo: str = "valid", valor_borde: float = 0.0,
+                 bloque: int = BLOQUE):
+    b = rellenar(a, k, modo, valor_borde)
+    return _suma_valid(b, k, bloque)
+
+
+def media_ventana(a: np.ndarray, k: int, modo: str = "valid", valor_borde: float = 0.0,
+                  bloque: int = BLOQUE):
+    """Suma / k (en "same" los valores de relleno cuentan como parte de la ventana)."""
+    s = suma_ventana(a, k, modo, valor_borde, bloque)
+    if s.dtype.kind != "f":
+        s = s.astype(np.float64)
+    s /= k
+    return s
+
+
+# Mínimo y máximo
+
+def _identidad(ufunc, dtype):
+    """Valor neutro para ufunc: +inf para mínimo, -inf para máximo (o el límite del entero)."""
+    if np.dtype(dtype).kind == "f":
+        return np.inf if ufunc is np.minimum else -np.inf
+    limite = np.iinfo(dtype)
+    return limite.max if ufunc is np.minimum else limite.min
+
+
+def _extremo_bloques(b: np.ndarray, k: int, ufunc):
+    """
+    van Herk / Gil-Werman: se parte b en bloques de k; para cada posición se
+    calcula el extremo desde el inicio de su bloque (prefijo) y hasta el final
+    (sufijo). La ventana [i, i+k) toca a lo más dos bloques:
+        extremo = ufunc(sufijo[i], prefijo[i + k - 1])
+    Tres pasadas vectorizadas, sin depender de k.
+    """
+    m = len(b) - k + 1
+    if k == 1:
+        return b.copy()
+    bloques = -(-len(b) // k)
+    relleno = np.full(bloques * k, _identidad(ufunc, b.dtype), dtype=b.dtype)
+    relleno[:len(b)] = b
+    r = relleno.reshape(bloques, k)
+    prefijo = ufunc.accumulate(r, axis=1).ravel()
+    sufijo = ufunc.accumulate(r[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(sufijo[:m], prefijo[k - 1:k - 1 + m])
+
+
+def _extremo_deque(b: np.ndarray, k: int, es_min: bool):
+    """Deque monótona: O(n) pero en Python puro (referencia)."""
+    m = len(b) - k + 1
+    salida = np.empty(m, dtype=b.dtype)
+    d = collections.deque()
+    valores = b.tolist()
+    for i, x in enumerate(valores):
+        if es_min:
+            while d and valores[d[-1]] >= x:
+                d.pop()
+        else:
+            while d and valores[d[-1]] <= x:
+                d.pop()
+        d.append(i)
+        if d[0] <= i - k:
+            d.popleft()
+        if i >= k - 1:
+            salida[i - k + 1] = valores[d[0]]
+    return salida
+
+
+def _extremo(a, k, modo, valor_borde, metodo, es_min):
+    b = rellenar(a, k, modo, valor_borde)
+    if metodo == "bloques":
+        return _extremo_bloques(b, k, np.minimum if es_min else np.maximum)
+    if metodo == "deque":
+        return _extremo_deque(b, k, es_min)
+    raise ValueError(f"método desconocido: {metodo} (opciones: bloques, deque)")
+
+
+def min_ventana(a: np.ndarray, k: int, modo: str = "valid", valor_borde: float = 0.0,
+                metodo: str = "bloques"):
+    return _extremo(a, k, modo, valor_borde, metodo, es_min=True)
+
+
+def max_ventana(a: np.ndarray, k: int, modo: str = "valid", valor_borde: float = 0.0,
+                metodo: str = "bloques"):
+    return _extremo(a, k, modo, valor_borde, metodo, es_min=False)
+
+
+# Reducción arbitraria
+
+def reducir_ventana(a: np.ndarray, k: int, fn=np.median, modo: str = "valid",
+                    valor_borde: float = 0.0):
+    """fn(vista, axis=-1) sobre una vista (n, k) sin copia: O(n·k) cálculo, O(n) memoria extra."""
+    b = rellenar(a, k, modo, valor_borde)
+    return fn(sliding_window_view(b, k), axis=-1)
+
+
+AGREGACIONES = {
+    "suma": suma_ventana,
+    "media": media_ventana,
+    "min": min_ventana,
+    "max": max_ventana,
+}
+
+
+# Verificación
+
+def _check_ventanas():
+    rng = np.random.default_rng(0)
+    for dtype in (np.float64, np.float32):
+        a = rng.standard_normal(1_000).astype(dtype)
+        for k in (1, 2, 3, 4, 7, 10, 101):
+            for modo in MODOS:
+                b = rellenar(a, k, modo)
+                vista = sliding_window_view(b.astype(np.float64), k)
+                tol = 1e-4 if dtype == np.float32 else 1e-10
+                assert np.allclose(suma_ventana(a, k, modo, bloque=64), vista.sum(axis=1), atol=tol)
+                assert np.allclose(media_ventana(a, k, modo), vista.mean(axis=1), atol=tol)
+                for metodo in ("bloques", "deque"):
+                    assert np.array_equal(min_ventana(a, k, modo, metodo=metodo), vista.min(axis=1).astype(dtype))
+                    assert np.array_equal(max_ventana(a, k, modo, metodo=metodo), vista.max(axis=1).astype(dtype))
+                assert suma_ventana(a, k, modo).dtype == dtype
+    # enteros: int32 se suma en int64 (3 * 2**30 no cabe en int32)
+    a = np.full(100, 2**30, dtype=np.int32)
+    for k in (3, 11):
+        assert np.array_equal(suma_ventana(a, k), np.full(100 - k + 1, k * 2**30, dtype=np.int64))
+    print("Ventanas iguales a sliding_window_view: True")
+
+
+# Benchmark
+
+def _tiempo(fn, repeticiones=3):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        fn()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def benchmark(n=10_000_000, ks=(3, 11, 101, 1001), dtypes=("float64", "float32"),
+              limite_bytes=1 << 30, n_deque=1_000_000):
+    """
+    ms por llamada (mejor de 3). Los métodos O(n·k) se saltan cuando su
+    memoria (vstack) pasaría de `limite_bytes`; la deque se mide sobre
+    n_deque elementos y se escala a n.
+    """
+    from proyecto_python import p2_np_vstack
+
+    print(f"n = {n:,}")
+    print(f"{'dtype':<8} {'k':>5} {'vstack':>10} {'swv.sum':>10} {'cumsum':>10} "
+          f"{'min bloques':>12} {'min deque*':>11} {'ns/elem cumsum':>15}")
+    for nombre_dtype in dtypes:
+        a = np.random.default_rng(0).standard_normal(n).astype(nombre_dtype)
+        for k in ks:
+            if k % 2 == 1 and n * k * a.itemsize <= limite_bytes:
+                t_vstack = f"{_tiempo(lambda: p2_np_vstack(a, k)) * 1e3:>8.1f}ms"
+            else:
+                t_vstack = f"{'—':>10}"
+            if n * k <= 20 * limite_bytes:
+                t_swv = f"{_tiempo(lambda: sliding_window_view(a, k).sum(axis=1), 1) * 1e3:>8.1f}ms"
+            else:
+                t_swv = f"{'—':>10}"
+            t_cumsum = _tiempo(lambda: suma_ventana(a, k))
+            t_min = _tiempo(lambda: min_ventana(a, k))
+            chico = a[:n_deque]
+            t_deque = _tiempo(lambda: min_ventana(chico, k, metodo="deque"), 1) * n / len(chico)
+            print(f"{nombre_dtype:<8} {k:>5} {t_vstack} {t_swv} {t_cumsum * 1e3:>8.1f}ms "
+                  f"{t_min * 1e3:>10.1f}ms {t_deque * 1e3:>9.0f}ms {t_cumsum / n * 1e9:>15.2f}")
+    print(f"* deque medida con n={n_deque:,} y escalada a n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ventanas deslizantes: vstack vs O(n)")
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--ks", default="3,11,101,1001")
+    args = parser.parse_args()
+    _check_ventanas()
+    benchmark(n=args.n, ks=tuple(int(k) for k in args.ks.split(",")))